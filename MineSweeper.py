@@ -1,428 +1,3091 @@
-import tkinter as tk
-from tkinter import ttk, messagebox
+import argparse
+import csv
+import functools
+import heapq
+import json
+import math
+import mmap
+import os
+import queue
 import random
+import sys
+import threading
 import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import compress
+
+try:
+    import numpy as np
+except ImportError:  # NumPy yoksa saf Python yolları kullanılır
+    np = None
+
+try:
+    from pysat.card import CardEnc, EncType
+    from pysat.formula import IDPool
+    from pysat.solvers import Solver as SatSolver
+except ImportError:  # python-sat yoksa yerleşik CDCL çözücü kullanılır
+    SatSolver = None
+
+try:
+    import tkinter as tk
+    from tkinter import ttk, messagebox
+except ImportError:  # Arayüzsüz makinelerde sadece komut satırı (bench) kullanılabilir
+    tk = None
+
+# Hücre durumu tek bir byte içinde tutulur:
+# alt 4 bit komşu mayın sayısı (0-8), üst bitler ise mayın/açık/bayrak bilgisidir.
+COUNT_MASK = 0x0F
+MINE = 0x10
+REVEALED = 0x20
+FLAGGED = 0x40
+
+# Byte dizisindeki sayı bitlerini tek seferde temizlemek için çeviri tablosu
+_CLEAR_COUNT = bytes(value & ~COUNT_MASK for value in range(256))
+
+# Mayın yerleşimini geri alırken sadece bayrak bitini bırakan çeviri tablosu
+_CLEAR_PLACEMENT = bytes(value & FLAGGED for value in range(256))
+
+# Eski sözlük anahtarlarının karşılık geldiği bitler (uyumluluk görünümü için)
+_CELL_BITS = {'is_mine': MINE, 'revealed': REVEALED, 'flagged': FLAGGED}
+
+
+class ChangeSet(set):
+    # Tahtada durumu değişen hücrelerin indekslerini biriktiren küme (bkz. MinesweeperBoard.track_changes).
+    # full True ise tahta bütünüyle değişmiştir (yeni oyun veya durum yükleme); tüketici her şeyi yeniden okumalıdır.
+    __slots__ = ('full',)
+
+    def __init__(self):
+        super().__init__()
+        self.full = True
+
+
+class JournalEntry:
+    # Hamle günlüğündeki tek kayıt: hamlenin değiştirdiği hücreler ve bu hücrelerde çevrilen bit.
+    # Açma sadece REVEALED, bayraklama sadece FLAGGED bitini değiştirdiği için aynı XOR hem geri
+    # hem ileri almada kullanılır. mines sadece ilk hamlede (mayın yerleşimi) doludur.
+    __slots__ = ('mask', 'indices', 'mines', 'before', 'after')
+
+    def __init__(self, mask, indices, mines, before, after):
+        self.mask = mask
+        self.indices = indices
+        self.mines = mines
+        self.before = before  # Hamle öncesi (revealed_count, flag_count, game_over, first_move, mines_placed)
+        self.after = after
+
+
+class CellView:
+    # Tek bir hücreyi eski sözlük arayüzüyle ({'is_mine', 'revealed', 'flagged', 'adjacent_mines'}) gösterir.
+    # Veri kopyalanmaz; okuma ve yazma işlemleri doğrudan tahtanın byte dizisine yansır.
+    __slots__ = ('_board', '_idx')
+
+    def __init__(self, board, idx):
+        self._board = board
+        self._idx = idx
+
+    def __getitem__(self, key):
+        state = self._board.cells[self._idx]
+        if key == 'adjacent_mines':
+            return state & COUNT_MASK
+        return bool(state & _CELL_BITS[key])
+
+    def __setitem__(self, key, value):
+        board = self._board
+        if key == 'flagged':
+            # Bayrak değişikliği tahtanın kendi yöntemi üzerinden yapılır.
+            row, col = divmod(self._idx, board.width)
+            board.set_flag(row, col, value)
+            return
+        elif key == 'adjacent_mines':
+            board.cells[self._idx] = (board.cells[self._idx] & ~COUNT_MASK) | (value & COUNT_MASK)
+        elif value:
+            board.cells[self._idx] |= _CELL_BITS[key]
+        else:
+            board.cells[self._idx] &= ~_CELL_BITS[key]
+        # Günlük dışı yazılan bitler geri alma kayıtlarıyla çelişeceği için hamle günlüğü silinir.
+        board.clear_journal()
+        # Doğrudan yazılan bitler sonrası sınır indeksi ve değişiklik takipçileri güncellenir.
+        board._refresh_index((self._idx,))
+
+    def get(self, key, default=None):
+        if key in _CELL_BITS or key == 'adjacent_mines':
+            return self[key]
+        return default
+
+    def keys(self):
+        return ['is_mine', 'revealed', 'flagged', 'adjacent_mines']
+
+    def copy(self):
+        # Eski kodla uyumlu olarak hücrenin sözlük kopyasını döndürür.
+        return {key: self[key] for key in self.keys()}
+
+
+class GridView:
+    # board.grid[i][j] erişimini byte dizisi üzerinde taklit eden uyumluluk görünümü.
+    __slots__ = ('_board',)
+
+    def __init__(self, board):
+        self._board = board
+
+    def __len__(self):
+        return self._board.height
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += self._board.height
+        if not 0 <= row < self._board.height:
+            raise IndexError(row)
+        return RowView(self._board, row)
+
+    def __iter__(self):
+        for row in range(self._board.height):
+            yield RowView(self._board, row)
+
+
+class RowView:
+    __slots__ = ('_board', '_row')
+
+    def __init__(self, board, row):
+        self._board = board
+        self._row = row
+
+    def __len__(self):
+        return self._board.width
+
+    def __getitem__(self, col):
+        if col < 0:
+            col += self._board.width
+        if not 0 <= col < self._board.width:
+            raise IndexError(col)
+        return CellView(self._board, self._row * self._board.width + col)
+
+    def __iter__(self):
+        base = self._row * self._board.width
+        for col in range(self._board.width):
+            yield CellView(self._board, base + col)
+
+
+class NeighborTable:
+    # Belirli bir (genişlik, yükseklik) için önceden hesaplanmış komşuluk tablosu.
+    # Her hücrenin kenar sınıfı (üst/alt/sol/sağ kenarda olup olmadığı, 4 bit) kinds dizisinde tutulur;
+    # offsets[sınıf] o sınıftaki bir hücrenin komşularına olan düz indeks farklarıdır. Böylece komşular
+    # max/min sınır hesabı ve yeni liste oluşturmadan "for d in offsets[kinds[idx]]: idx + d" ile gezilir.
+    # Farklar satır öncelikli sıradadır (eski _neighbors üretecinin sırası korunur).
+    # lazy True ise sınıf dizisi oluşturulmaz, her hücrenin sınıfı erişimde hesaplanır (bkz. SparseBoard).
+    __slots__ = ('width', 'height', 'kinds', 'offsets')
+
+    TOP, BOTTOM, LEFT, RIGHT = 1, 2, 4, 8
+
+    def __init__(self, width, height, lazy=False):
+        self.width = width
+        self.height = height
+        offsets = []
+        for kind in range(16):
+            deltas = []
+            for di in (-1, 0, 1):
+                if (di < 0 and kind & self.TOP) or (di > 0 and kind & self.BOTTOM):
+                    continue
+                for dj in (-1, 0, 1):
+                    if (dj < 0 and kind & self.LEFT) or (dj > 0 and kind & self.RIGHT) or di == dj == 0:
+                        continue
+                    deltas.append(di * width + dj)
+            offsets.append(tuple(deltas))
+        self.offsets = tuple(offsets)
+        if lazy:
+            self.kinds = _EdgeKinds(width, height)
+            return
+        # Sınıf dizisi satır şablonlarından kurulur; hücre başına döngü yoktur.
+        row = bytearray(width)
+        if width:
+            row[0] |= self.LEFT
+            row[-1] |= self.RIGHT
+        if height == 1:
+            kinds = bytearray(value | self.TOP | self.BOTTOM for value in row)
+        elif height:
+            kinds = (bytearray(value | self.TOP for value in row) + row * (height - 2)
+                     + bytearray(value | self.BOTTOM for value in row))
+        else:
+            kinds = bytearray()
+        self.kinds = bytes(kinds)
+
+
+class _EdgeKinds:
+    # NeighborTable.kinds'in tembel karşılığı: hücrenin kenar sınıfını indeksinden hesaplar, bellek kullanmaz.
+    __slots__ = ('width', 'height')
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+    def __len__(self):
+        return self.width * self.height
+
+    def __getitem__(self, idx):
+        row, col = divmod(idx, self.width)
+        return ((row == 0) | (row == self.height - 1) << 1
+                | (col == 0) << 2 | (col == self.width - 1) << 3)
+
+
+@functools.lru_cache(maxsize=16)
+def neighbor_table(width, height):
+    # Komşuluk tablosunu boyuta göre önbellekten verir; aynı boyuttaki tahtalar ve yeniden başlatmalar
+    # tabloyu paylaşır.
+    return NeighborTable(width, height)
+
 
 # Oyun Mantığı: MinesweeperBoard Sınıfı
 # Bu sınıf mayın tarlası oyunundaki oyun alanını ve temel işlemleri yönetir.
 
 class MinesweeperBoard:
-    def __init__(self, width=10, height=10, num_mines=10):
+    def __init__(self, width=10, height=10, num_mines=10, rng=None):
         # Oyun alanının genişliği, yüksekliği ve mayın sayısı belirlenir.
         self.width = width
         self.height = height
         self.num_mines = num_mines
+        # Mayın yerleşimi için rastgele sayı üreteci: None ise modül düzeyindeki random kullanılır,
+        # tam sayı verilirse tohumlu bir random.Random oluşturulur; numpy.random.Generator da kabul edilir.
+        self.rng = random.Random(rng) if isinstance(rng, int) else rng
         self.reset_board()  # Oyun tahtası sıfırlanır
 
     def reset_board(self):
         # Oyun tahtasını baştan oluşturur.
-        # Her hücre için mayın durumu, açılmışlık, bayraklanma ve komşu mayın sayısı tutulur.
-        self.grid = [[{'is_mine': False, 'revealed': False, 'flagged': False, 'adjacent_mines': 0}
-                      for _ in range(self.width)] for _ in range(self.height)]
+        self._allocate()
         self.revealed_count = 0  # Açılan hücre sayısı sıfırlanır
+        self.flag_count = 0  # Bayraklı hücre sayısı
         self.game_over = False  # Oyun henüz bitmedi
         self.first_move = True  # İlk hamle kontrolü
         self.mines_placed = False  # Mayınların yerleştirilip yerleştirilmediği bilgisi
+        # Artımlı sınır indeksi: çözücüler tüm tahtayı taramak yerine bu kümeleri kullanır.
+        self.frontier = set()  # Açılmış komşusu olan, açılmamış ve bayraksız hücreler
+        self.active = set()  # Açılmış, sayılı ve hâlâ gizli (bayraksız) komşusu olan hücreler
+        self.clear_journal()
+        # Değişiklik takipçileri zayıf referansla tutulur; ölmüş olanlar burada ayıklanır.
+        self._trackers = [ref for ref in getattr(self, '_trackers', ()) if ref() is not None]
+        self._notify_full()
+
+    def _allocate(self):
+        # Her hücre, satır öncelikli düz bir byte dizisinde tek byte olarak tutulur (bkz. MINE/REVEALED/FLAGGED).
+        self.cells = bytearray(self.width * self.height)
+        # Komşuluk tablosu boyuta göre paylaşılır; yeniden başlatmada tekrar hesaplanmaz.
+        self.neighbor_table = neighbor_table(self.width, self.height)
+
+    def clear_journal(self):
+        # Hamle günlüğünü boşaltır; bu noktadan önceki hamleler geri alınamaz.
+        self.journal = []  # Açma ve bayraklama hamlelerinin kayıtları (JournalEntry)
+        self.journal_pos = 0  # Uygulanmış hamle sayısı; sonrasındaki kayıtlar ileri alınabilir
+
+    def _scalars(self):
+        return (self.revealed_count, self.flag_count, self.game_over, self.first_move, self.mines_placed)
+
+    def _record(self, mask, indices, before, mines=None):
+        # Yeni bir hamleyi günlüğe ekler; geri alınmış (ileri alınabilir) hamleler silinir.
+        del self.journal[self.journal_pos:]
+        self.journal.append(JournalEntry(mask, indices, mines, before, self._scalars()))
+        self.journal_pos += 1
+
+    def checkpoint(self):
+        # Günlükteki mevcut konumu döndürür; goto ile bu ana dönülebilir.
+        return self.journal_pos
+
+    def undo(self):
+        # Son hamleyi geri alır. Sadece o hamlede değişen hücrelere dokunulduğu için maliyet
+        # tahta boyutuna değil hamlenin büyüklüğüne bağlıdır. Geri alınacak hamle yoksa False döner.
+        if not self.journal_pos:
+            return False
+        self.journal_pos -= 1
+        entry = self.journal[self.journal_pos]
+        cells = self.cells
+        mask = entry.mask
+        for idx in entry.indices:
+            cells[idx] ^= mask
+        (self.revealed_count, self.flag_count, self.game_over,
+         self.first_move, self.mines_placed) = entry.before
+        if entry.mines is None:
+            self._refresh_index(entry.indices)
+        else:
+            # İlk hamle geri alınırsa mayınlar da kaldırılır; bir sonraki açma yeniden yerleştirir.
+            self._clear_mines()
+            self._rebuild_index()
+            self._notify_full()
+        return True
+
+    def redo(self):
+        # Geri alınmış son hamleyi tekrar uygular. İleri alınacak hamle yoksa False döner.
+        if self.journal_pos == len(self.journal):
+            return False
+        entry = self.journal[self.journal_pos]
+        self.journal_pos += 1
+        cells = self.cells
+        if entry.mines is not None:
+            self._put_mines(entry.mines)
+        mask = entry.mask
+        for idx in entry.indices:
+            cells[idx] ^= mask
+        (self.revealed_count, self.flag_count, self.game_over,
+         self.first_move, self.mines_placed) = entry.after
+        if entry.mines is None:
+            self._refresh_index(entry.indices)
+        else:
+            self._rebuild_index()
+            self._notify_full()
+        return True
+
+    def goto(self, pos):
+        # Tahtayı günlükteki verilen konuma (uygulanmış hamle sayısına) geri veya ileri alarak getirir.
+        while self.journal_pos > pos and self.undo():
+            pass
+        while self.journal_pos < pos and self.redo():
+            pass
+        return self.journal_pos == pos
+
+    @property
+    def grid(self):
+        # Eski board.grid[i][j]['anahtar'] erişimi için kopyasız görünüm döndürür.
+        return GridView(self)
+
+    def track_changes(self):
+        # Durumu değişen (açılan, bayraklanan) hücre indekslerini biriktiren yeni bir ChangeSet döndürür.
+        # Tüketici kümeyi okuduktan sonra kendisi temizler; tahta sadece yeni indeksleri ekler.
+        changes = ChangeSet()
+        self._trackers.append(weakref.ref(changes))
+        return changes
+
+    def _notify(self, indices):
+        # Değişen hücreleri tüm canlı takipçilere bildirir.
+        for ref in self._trackers:
+            changes = ref()
+            if changes is not None:
+                changes.update(indices)
+
+    def _notify_full(self):
+        # Tahtanın tamamı değiştiğinde takipçiler tam yenileme için işaretlenir.
+        for ref in self._trackers:
+            changes = ref()
+            if changes is not None:
+                changes.clear()
+                changes.full = True
+
+    def _index_opened(self, opened):
+        # Yeni açılan hücreler için sınır (frontier) ve aktif kısıt kümelerini artımlı olarak günceller.
+        cells = self.cells
+        frontier = self.frontier
+        active = self.active
+        table = self.neighbor_table
+        kinds = table.kinds
+        offsets = table.offsets
+        recheck = set()
+        for idx in opened:
+            was_frontier = idx in frontier
+            frontier.discard(idx)
+            state = cells[idx]
+            # Sıfır hücrenin bütün komşuları aynı taşkınla açılır; daha önce sınırda değilse
+            # açık komşusu da yoktur, yani etkilenen bir aktif kısıt kalmaz.
+            if not state & (COUNT_MASK | MINE) and not was_frontier:
+                continue
+            has_hidden = False
+            for d in offsets[kinds[idx]]:
+                n = idx + d
+                neighbor = cells[n]
+                if neighbor & REVEALED:
+                    if n in active:
+                        recheck.add(n)
+                elif not neighbor & FLAGGED:
+                    frontier.add(n)
+                    has_hidden = True
+            if has_hidden and state & COUNT_MASK and not state & MINE:
+                active.add(idx)
+        for idx in recheck.difference(opened):
+            self._refresh_cell(idx)
+
+    def _refresh_cell(self, idx):
+        # Tek bir hücrenin sınır ve aktif kısıt üyeliğini komşularına bakarak yeniden hesaplar.
+        cells = self.cells
+        state = cells[idx]
+        table = self.neighbor_table
+        deltas = table.offsets[table.kinds[idx]]
+        if state & REVEALED:
+            self.frontier.discard(idx)
+            if state & COUNT_MASK and not state & MINE and any(
+                    not cells[idx + d] & (REVEALED | FLAGGED) for d in deltas):
+                self.active.add(idx)
+            else:
+                self.active.discard(idx)
+        else:
+            self.active.discard(idx)
+            if not state & FLAGGED and any(cells[idx + d] & REVEALED for d in deltas):
+                self.frontier.add(idx)
+            else:
+                self.frontier.discard(idx)
+
+    def _refresh_index(self, indices):
+        # Verilen hücreler ve komşuları için indeksi yeniler ve değişikliği takipçilere bildirir.
+        kinds = self.neighbor_table.kinds
+        offsets = self.neighbor_table.offsets
+        affected = set(indices)
+        for idx in indices:
+            for d in offsets[kinds[idx]]:
+                affected.add(idx + d)
+        for idx in affected:
+            self._refresh_cell(idx)
+        self._notify(indices)
+
+    def _rebuild_index(self):
+        # Sınır ve aktif kısıt kümelerini tüm tahtayı tarayarak sıfırdan kurar (durum yükleme sonrası).
+        # _index_opened kullanılmaz: sıfır hücrelerin bayraklı komşuları da sınıra girebilir.
+        cells = self.cells
+        frontier = self.frontier = set()
+        active = self.active = set()
+        kinds = self.neighbor_table.kinds
+        offsets = self.neighbor_table.offsets
+        for idx, state in self._cell_states():
+            if not state & REVEALED:
+                continue
+            has_hidden = False
+            for d in offsets[kinds[idx]]:
+                n = idx + d
+                if not cells[n] & (REVEALED | FLAGGED):
+                    frontier.add(n)
+                    has_hidden = True
+            if has_hidden and state & COUNT_MASK and not state & MINE:
+                active.add(idx)
+
+    def _cell_states(self):
+        # İndeks taraması gereken işlemler için (indeks, durum) çiftleri; seyrek tahta sadece dokunulmuş
+        # hücreleri verir (diğerleri açılmamış ve bayraksızdır).
+        return enumerate(self.cells)
+
+    def hidden_cells(self, reverse=False):
+        # Açılmamış ve bayraksız hücrelerin indekslerini sırayla (reverse ise sondan başa) üretir.
+        # Tembel bir üreteçtir; aday arayan kod ilk uygun hücrede durduğunda tahtanın geri kalanı taranmaz.
+        cells = self.cells
+        total = len(cells)
+        for idx in (range(total - 1, -1, -1) if reverse else range(total)):
+            if not cells[idx] & (REVEALED | FLAGGED):
+                yield idx
+
+    def random_hidden_cell(self, rng, exclude=()):
+        # Açılmamış, bayraksız ve exclude'da olmayan hücrelerden rastgele birini (satır, sütun) seçer; yoksa None.
+        width = self.width
+        hidden = [divmod(idx, width) for idx in self.hidden_cells()]
+        if exclude:
+            hidden = [cell for cell in hidden if cell not in exclude]
+        return rng.choice(hidden) if hidden else None
 
     def place_mines(self, exclude_row, exclude_col):
         # İlk hamle yapılırken tıklanan hücreyi hariç tutarak mayınları yerleştirir.
-        positions = [(i, j) for i in range(self.height) for j in range(self.width)
-                     if not (i == exclude_row and j == exclude_col)]
-        mine_positions = random.sample(positions, self.num_mines)  # Rastgele mayın pozisyonları seçilir
-        for i, j in mine_positions:
-            self.grid[i][j]['is_mine'] = True  # Seçilen hücrelere mayın yerleştirilir
-        self.calculate_adjacent_mines()  # Her hücre için komşu mayın sayıları hesaplanır
-
-    def calculate_adjacent_mines(self):
+        # Tüm pozisyonların listesi oluşturulmaz: hariç tutulan hücre dışındaki n - 1 hücreden indeks seçilir
+        # ve seçilen indeks hariç tutulan hücreye eşit veya büyükse bir kaydırılır.
+        total = self.width * self.height
+        excluded = exclude_row * self.width + exclude_col
+        rng = self.rng
+        if np is not None and isinstance(rng, np.random.Generator):
+            picks = rng.choice(total - 1, size=self.num_mines, replace=False)
+            picks += picks >= excluded
+            flat = np.frombuffer(self.cells, dtype=np.uint8)
+            flat[picks] |= MINE  # Seçilen hücrelere mayın yerleştirilir
+            picks = picks.tolist()
+        else:
+            # random.sample bir range üzerinde çalıştığında listeyi bellekte oluşturmaz;
+            # aynı tohumla eski pozisyon listesiyle birebir aynı yerleşimi verir.
+            picks = (rng or random).sample(range(total - 1), self.num_mines)
+            picks = [p + 1 if p >= excluded else p for p in picks]
+            cells = self.cells
+            for idx in picks:
+                cells[idx] |= MINE  # Seçilen hücrelere mayın yerleştirilir
+        self.calculate_adjacent_mines(picks)  # Her hücre için komşu mayın sayıları hesaplanır
+        return picks
+
+    def calculate_adjacent_mines(self, mines=None):
         # Her hücre için etrafındaki (komşu) hücrelerde kaç adet mayın bulunduğunu hesaplar.
-        for i in range(self.height):
-            for j in range(self.width):
-                count = 0
-                # Hücrenin çevresindeki 8 hücre kontrol edilir (kenar ve köşe durumları için sınırlar ayarlanır)
-                for x in range(max(0, i - 1), min(self.height, i + 2)):
-                    for y in range(max(0, j - 1), min(self.width, j + 2)):
-                        if x == i and y == j:
-                            continue  # Kendi hücresi hariç tutulur
-                        if self.grid[x][y]['is_mine']:
-                            count += 1  # Mayın varsa sayacı artırır
-                self.grid[i][j]['adjacent_mines'] = count  # Komşu mayın sayısı atanır
+        # NumPy varsa mayın matrisi kenarlardan doldurulup 3x3 pencere toplamı alınır;
+        # yoksa sadece mayınların komşu sayaçları artırılır (mines verilmezse tahtadan okunur).
+        cells = self.cells
+        if np is not None:
+            grid = np.frombuffer(cells, dtype=np.uint8).reshape(self.height, self.width)
+            is_mine = ((grid & MINE) != 0).view(np.uint8)
+            padded = np.pad(is_mine, 1)
+            counts = np.zeros_like(is_mine)
+            for di in range(3):
+                for dj in range(3):
+                    counts += padded[di:di + self.height, dj:dj + self.width]
+            counts -= is_mine  # Kendi hücresi hariç tutulur
+            grid &= 0xFF ^ COUNT_MASK
+            grid |= counts
+            return
+
+        cells[:] = cells.translate(_CLEAR_COUNT)
+        if mines is None:
+            mines = [idx for idx, state in enumerate(cells) if state & MINE]
+        kinds = self.neighbor_table.kinds
+        offsets = self.neighbor_table.offsets
+        for idx in mines:
+            for d in offsets[kinds[idx]]:
+                cells[idx + d] += 1  # Komşu hücrenin sayacı bir artırılır
+
+    def set_mines(self, mines):
+        # Mayınları verilen hücre indekslerine yerleştirir (ör. kayıttan yeniden oynatma); ilk açmada
+        # artık rastgele yerleşim yapılmaz. Henüz mayın yerleştirilmemiş bir tahtada çağrılmalıdır.
+        self._put_mines(mines)
+        self.first_move = False
+        self.mines_placed = True
+
+    def _put_mines(self, mines):
+        # Verilen indekslere mayın bitini koyar ve komşu sayılarını günceller.
+        cells = self.cells
+        for idx in mines:
+            cells[idx] |= MINE
+        self.calculate_adjacent_mines(mines)
+
+    def _clear_mines(self):
+        # Mayın ve sayı bitlerini siler; sadece bayraklar kalır (ilk hamlenin geri alınması).
+        self.cells[:] = self.cells.translate(_CLEAR_PLACEMENT)
+
+    def mine_total(self):
+        # Tahtadaki gerçek mayın sayısı (kazanma koşulu ve olasılık hesabı bunu kullanır); bilinmiyorsa None.
+        return self.num_mines
+
+    @property
+    def density(self):
+        # Bir hücrenin mayın olma olasılığı (SparseBoard yerleşimi hücre başına bu olasılıkla üretir).
+        return self.num_mines / (self.width * self.height)
+
+    def is_mine(self, row, col):
+        return bool(self.cells[row * self.width + col] & MINE)
+
+    def is_revealed(self, row, col):
+        return bool(self.cells[row * self.width + col] & REVEALED)
+
+    def is_flagged(self, row, col):
+        return bool(self.cells[row * self.width + col] & FLAGGED)
+
+    def adjacent_mines(self, row, col):
+        return self.cells[row * self.width + col] & COUNT_MASK
+
+    def set_flag(self, row, col, flagged=True):
+        # Hücrenin bayrak durumunu ayarlar. Açılmış hücreler bayraklanamaz.
+        idx = row * self.width + col
+        state = self.cells[idx]
+        if state & REVEALED:
+            return False
+        new_state = state | FLAGGED if flagged else state & ~FLAGGED
+        if new_state != state:
+            before = self._scalars()
+            self.cells[idx] = new_state
+            self.flag_count += 1 if flagged else -1
+            self._record(FLAGGED, (idx,), before)
+            self._refresh_index((idx,))
+        return True
 
     def reveal(self, row, col):
-        # Belirtilen hücreyi açma işlemini gerçekleştirir.
-        # Eğer oyun bitmişse, hücre zaten açılmışsa veya bayraklıysa hiçbir işlem yapmaz.
-        if self.game_over or self.grid[row][col]['revealed'] or self.grid[row][col]['flagged']:
+        # Belirtilen hücreyi açar; açılan hücre mayınsa True döndürür.
+        # Açılan hücrelerin listesi gerekiyorsa reveal_cells kullanılabilir.
+        opened = self.reveal_cells(row, col)
+        return bool(opened) and bool(self.cells[row * self.width + col] & MINE)
+
+    def reveal_cells(self, row, col):
+        # Belirtilen hücreyi açma işlemini gerçekleştirir ve yeni açılan hücrelerin (satır, sütun) listesini döndürür.
+        # Eğer oyun bitmişse, hücre zaten açılmışsa veya bayraklıysa hiçbir işlem yapmaz (boş liste döner).
+        return self.reveal_many(((row, col),))
+
+    def reveal_many(self, moves):
+        """
+        Verilen (satır, sütun) hücrelerini sırayla açar ve yeni açılan tüm hücrelerin listesini döndürür.
+        Her tıklama günlüğe ayrı bir hamle olarak yazılır (geri alma ve oyun kaydı tıklama başınadır);
+        sınır indeksi ve değişiklik bildirimi ise bütün hamleler için bir kez güncellenir.
+        Açılmış, bayraklı veya önceki tıklamanın taşkınıyla açılmış hücreler atlanır; mayına basılırsa
+        veya oyun kazanılırsa kalan hücreler açılmaz.
+        """
+        cells = self.cells
+        width = self.width
+        kinds = self.neighbor_table.kinds
+        offsets = self.neighbor_table.offsets
+        opened = []
+        for row, col in moves:
+            idx = row * width + col
+            if self.game_over:
+                break
+            if cells[idx] & (REVEALED | FLAGGED):
+                continue
+
+            # Hamle günlüğü için önceki sayaçlar saklanır.
+            before = self._scalars()
+            mines = None
+
+            # İlk hamle ise, tıklanan hücre hariç mayınları yerleştirir.
+            if self.first_move:
+                mines = self.place_mines(row, col)
+                self.first_move = False
+                self.mines_placed = True
+
+            # Hücre açılır; açılan hücrede mayın varsa oyun biter.
+            start = len(opened)
+            cells[idx] |= REVEALED
+            opened.append(idx)
+            if cells[idx] & MINE:
+                self.revealed_count += 1
+                self.game_over = True
+                self._record(REVEALED, opened[start:], before, mines)
+                break
+
+            # Komşu mayını olmayan hücrelerden başlayarak boş bölge kuyruk ile (özyinelemesiz) açılır.
+            # opened listesi aynı zamanda BFS kuyruğu olarak kullanılır; her hücre kuyruğa bir kez girer.
+            pos = start
+            while pos < len(opened):
+                current = opened[pos]
+                pos += 1
+                if cells[current] & COUNT_MASK:
+                    continue
+                for d in offsets[kinds[current]]:
+                    n = current + d
+                    # Sıfır hücrenin komşuları mayın olamaz; sadece açılmamış ve bayraksız olanlar açılır.
+                    if not cells[n] & (REVEALED | FLAGGED):
+                        cells[n] |= REVEALED
+                        opened.append(n)
+            self.revealed_count += len(opened) - start
+
+            # Eğer açılan hücre sayısı kazanma durumunu sağlarsa oyunu bitirir (mayın sayısı bilinmiyorsa
+            # sayıya dayalı kazanma denetimi yapılmaz, bkz. SparseBoard.mine_total).
+            total = self.mine_total()
+            if total is not None and self.revealed_count == self.width * self.height - total:
+                self.game_over = True
+            self._record(REVEALED, opened[start:], before, mines)
+
+        if opened:
+            self._index_opened(opened)
+            self._notify(opened)
+        return [divmod(n, width) for n in opened]
+
+    def chord(self, row, col):
+        # Klasik "akor" hamlesi: açılmış sayılı hücrenin komşularındaki bayrak sayısı sayıya eşitse
+        # bayraksız bütün gizli komşuları açar. Bayraklar yanlışsa mayına basılabilir. Açılan hücreleri döndürür.
+        cells = self.cells
+        idx = row * self.width + col
+        state = cells[idx]
+        if self.game_over or not state & REVEALED or state & MINE or not state & COUNT_MASK:
+            return []
+        deltas = self.neighbor_table.offsets[self.neighbor_table.kinds[idx]]
+        if sum(1 for d in deltas if cells[idx + d] & FLAGGED) != state & COUNT_MASK:
+            return []
+        return self.reveal_many([divmod(idx + d, self.width) for d in deltas
+                                 if not cells[idx + d] & (REVEALED | FLAGGED)])
+
+    def get_adjacent_cells(self, row, col):
+        # Belirtilen hücrenin çevresindeki henüz açılmamış hücreleri döndürür.
+        width = self.width
+        cells = self.cells
+        idx = row * width + col
+        table = self.neighbor_table
+        return [divmod(idx + d, width) for d in table.offsets[table.kinds[idx]]
+                if not cells[idx + d] & REVEALED]
+
+    def save_state(self):
+        # Oyun tahtasının mevcut durumunu (hücreler, açılan hücre sayısı, oyun durumu vs.) kaydeder.
+        # Hücreler tek bir bytes nesnesi olarak kopyalanır; hücre başına sözlük oluşturulmaz.
+        return {
+            'cells': bytes(self.cells),
+            'revealed_count': self.revealed_count,
+            'game_over': self.game_over,
+            'first_move': self.first_move,
+            'mines_placed': self.mines_placed
+        }
+
+    def load_state(self, state):
+        # Daha önce kaydedilmiş olan durumu geri yükler.
+        # Eski biçimdeki ('grid' sözlük listesi) kayıtlar da kabul edilir.
+        if 'cells' in state:
+            self.cells = bytearray(state['cells'])
+        else:
+            self.cells = bytearray(self.width * self.height)
+            for i, row in enumerate(state['grid']):
+                for j, cell in enumerate(row):
+                    value = cell['adjacent_mines'] & COUNT_MASK
+                    for key, bit in _CELL_BITS.items():
+                        if cell[key]:
+                            value |= bit
+                    self.cells[i * self.width + j] = value
+        self.revealed_count = state['revealed_count']
+        self.flag_count = sum(1 for value in self.cells if value & FLAGGED)
+        self.game_over = state['game_over']
+        self.first_move = state['first_move']
+        self.mines_placed = state['mines_placed']
+        self.clear_journal()  # Yüklenen durumdan önceki hamlelere dönülemez
+        self._rebuild_index()
+        self._notify_full()
+
+
+class SparseCells(dict):
+    # Seyrek tahtanın hücre dizisi: indeks -> durum byte'ı. Sadece dokunulan (okunan, açılan, bayraklanan)
+    # hücreler saklanır; olmayan bir hücreye ilk erişimde mayın ve sayı bitleri parça yerleşiminden hesaplanır.
+    # Uzunluk ve gezinme bütün tahtayı kapsar, böylece bytearray bekleyen kod değişmeden çalışır;
+    # dokunulmuş hücreler dict.items(cells) ile alınır.
+    __slots__ = ('board',)
+
+    def __init__(self, board):
+        super().__init__()
+        self.board = board
+
+    def __missing__(self, idx):
+        if not 0 <= idx < len(self):
+            raise IndexError(idx)
+        state = self[idx] = self.board._base_state(idx)
+        return state
+
+    def __len__(self):
+        return self.board.width * self.board.height
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+
+# SparseBoard Sınıfı
+# Çok büyük (ör. 10^6 x 10^6) tahtalar için tembel tahta: hücre dizisi ve mayın yerleşimi baştan oluşturulmaz.
+# Tahta CHUNK x CHUNK'lık parçalara bölünür; bir parçanın mayınları ilk ihtiyaç duyulduğunda tohumdan ve
+# parça koordinatlarından deterministik olarak üretilir (her hücre num_mines / (genişlik * yükseklik)
+# olasılıkla mayındır, yani num_mines beklenen mayın sayısıdır). Komşu sayıları da hücreye ilk erişimde
+# hesaplanır; bellek kullanımı keşfedilen alanla orantılıdır. Çözücüler ve bench aynı arayüzle çalışır;
+# arayüz ve oyun kaydı desteklenmez. Gerçek mayın sayısı her parça üretilirken sayılır ve bütün parçalar
+# üretilince bilinir (bkz. mine_total); o zamana kadar sayıya dayalı kazanma denetimi yapılmaz ve
+# ProbabilitySolver toplam mayın sayısı yerine hücre başına mayın olasılığını (density) kullanır.
+# set_mines ile verilen açık yerleşim tohumdan üretilen yerleşimin yerine geçer.
+class SparseBoard(MinesweeperBoard):
+    CHUNK = 64
+
+    def __init__(self, width=10, height=10, num_mines=10, seed=0):
+        self.seed = seed
+        self._chunks = {}  # (parça satırı, parça sütunu) -> CHUNK*CHUNK byte'lık mayın haritası
+        self._chunk_mines = {}  # (parça satırı, parça sütunu) -> parçanın tahta içindeki mayın sayısı
+        self._layout_total = None  # Bütün parçalar üretildiğinde yerleşimdeki toplam mayın sayısı
+        size = self.CHUNK
+        self._chunk_count = -(-height // size) * -(-width // size)
+        super().__init__(width, height, num_mines)
+
+    def _allocate(self):
+        self.cells = SparseCells(self)
+        self.neighbor_table = NeighborTable(self.width, self.height, lazy=True)
+        self._layout = False  # Mayın yerleşimi etkin mi (ilk açmaya kadar tahtada mayın yoktur)
+        self._first_click = None  # İlk açılan hücre; üretilen yerleşimde mayın olsa bile güvenli sayılır
+        self._explicit = None  # set_mines ile verilen mayın indeksleri (frozenset); None ise yerleşim tohumdandır
+
+    @property
+    def chunks_generated(self):
+        # Üretilmiş mayın parçası sayısı; bellek kullanımı bununla (ve saklanan hücrelerle) orantılıdır.
+        return len(self._chunks)
+
+    def _chunk(self, key):
+        # Parçanın mayın haritasını üretir; aynı tohum ve parça her zaman aynı yerleşimi verir.
+        # Tahta kenarını aşan parçalarda sadece tahta içindeki hücrelerin mayınları sayılır.
+        size = self.CHUNK
+        density = self.density
+        draw = random.Random(f"{self.seed}:{key[0]}:{key[1]}").random
+        chunk = self._chunks[key] = bytes(draw() < density for _ in range(size * size))
+        rows = min(size, self.height - key[0] * size)
+        cols = min(size, self.width - key[1] * size)
+        self._chunk_mines[key] = sum(chunk[r * size:r * size + cols].count(1) for r in range(rows))
+        if len(self._chunks) == self._chunk_count:
+            self._layout_total = sum(self._chunk_mines.values())
+        return chunk
+
+    def _layout_mine(self, idx):
+        # Tohumdan üretilen yerleşimde hücrenin mayın olup olmadığı (ilk tıklama istisnası uygulanmadan).
+        row, col = divmod(idx, self.width)
+        size = self.CHUNK
+        key = (row // size, col // size)
+        chunk = self._chunks.get(key) or self._chunk(key)
+        return chunk[row % size * size + col % size]
+
+    def _is_mine(self, idx):
+        if self._explicit is not None:
+            return idx in self._explicit
+        if idx == self._first_click:
             return False
+        return self._layout_mine(idx)
+
+    def mine_total(self):
+        # Gerçek mayın sayısı: açık yerleşimde verilen mayınlar; tohumdan üretilen yerleşimde bütün parçalar
+        # üretildiyse parça sayaçlarının toplamı (ilk tıklanan hücredeki mayın hariç), yoksa None.
+        if self._explicit is not None:
+            return len(self._explicit)
+        total = self._layout_total
+        if total is None:
+            return None
+        if self._first_click is not None and self._layout_mine(self._first_click):
+            total -= 1
+        return total
+
+    def _base_state(self, idx):
+        # Hücrenin mayın ve komşu sayısı bitleri (açık/bayrak bitleri hariç).
+        if not self._layout:
+            return 0
+        # Hızlı yol: hücre tahta kenarında değilse, bütün komşuları aynı parçadaysa ve ilk tıklanan hücre
+        # komşulukta değilse sayı doğrudan parça haritasından toplanır.
+        size = self.CHUNK
+        width = self.width
+        row, col = divmod(idx, width)
+        local_row, local_col = row % size, col % size
+        first = self._first_click
+        if (self._explicit is None and 0 < local_row < size - 1 and 0 < local_col < size - 1
+                and col < width - 1 and row < self.height - 1
+                and (first is None or abs(row - first // width) > 1 or abs(col - first % width) > 1)):
+            key = (row // size, col // size)
+            chunk = self._chunks.get(key) or self._chunk(key)
+            at = local_row * size + local_col
+            up = at - size
+            down = at + size
+            return ((MINE if chunk[at] else 0) + chunk[up - 1] + chunk[up] + chunk[up + 1]
+                    + chunk[at - 1] + chunk[at + 1] + chunk[down - 1] + chunk[down] + chunk[down + 1])
+        is_mine = self._is_mine
+        state = MINE if is_mine(idx) else 0
+        for d in self.neighbor_table.offsets[self.neighbor_table.kinds[idx]]:
+            if is_mine(idx + d):
+                state += 1
+        return state
+
+    def _refill(self):
+        # Saklanan hücrelerin mayın ve sayı bitlerini mevcut yerleşime göre yeniden hesaplar; açık ve
+        # bayrak bitleri korunur, sadece bunlardan birini taşıyan hücreler saklanmaya devam eder.
+        cells = self.cells
+        kept = [(idx, state & (REVEALED | FLAGGED)) for idx, state in dict.items(cells)
+                if state & (REVEALED | FLAGGED)]
+        dict.clear(cells)
+        for idx, bits in kept:
+            dict.__setitem__(cells, idx, bits | self._base_state(idx))
+
+    def place_mines(self, exclude_row, exclude_col):
+        # Mayınlar önceden yerleştirilmez; yerleşim etkinleştirilir ve tıklanan hücre hariç tutulur.
+        self._first_click = exclude_row * self.width + exclude_col
+        self._put_mines(())
+        return []
+
+    def _put_mines(self, mines):
+        self._layout = True
+        self._refill()
+
+    def _clear_mines(self):
+        self._layout = False
+        self._refill()
+
+    def set_mines(self, mines):
+        # Mayınları verilen hücre indekslerine yerleştirir; tohumdan üretilen yerleşim artık kullanılmaz.
+        self._explicit = frozenset(mines)
+        self._first_click = None
+        super().set_mines(mines)
+
+    def calculate_adjacent_mines(self, mines=None):
+        # Komşu sayıları erişimde hesaplandığından sadece saklanan hücreler yenilenir.
+        self._refill()
+
+    def _cell_states(self):
+        return list(dict.items(self.cells))
+
+    def random_hidden_cell(self, rng, exclude=()):
+        # Tahtanın tamamı listelenmez: rastgele indeksler denenir, bulunamazsa ilk uygun gizli hücre seçilir.
+        width = self.width
+        total = self.width * self.height
+        cells = self.cells
+        for _ in range(64):
+            idx = rng.randrange(total)
+            if not cells[idx] & (REVEALED | FLAGGED) and divmod(idx, width) not in exclude:
+                return divmod(idx, width)
+        for idx in self.hidden_cells():
+            if divmod(idx, width) not in exclude:
+                return divmod(idx, width)
+        return None
+
+    def save_state(self):
+        # Sadece dokunulmuş hücreler kaydedilir; yerleşim tohumdan yeniden üretilir.
+        return {
+            'cells': dict(dict.items(self.cells)),
+            'mines': None if self._explicit is None else sorted(self._explicit),
+            'first_click': self._first_click,
+            'revealed_count': self.revealed_count,
+            'game_over': self.game_over,
+            'first_move': self.first_move,
+            'mines_placed': self.mines_placed
+        }
+
+    def load_state(self, state):
+        mines = state.get('mines')
+        self._explicit = None if mines is None else frozenset(mines)
+        self._first_click = state['first_click']
+        self._layout = state['mines_placed']
+        dict.clear(self.cells)
+        dict.update(self.cells, state['cells'])
+        self.revealed_count = state['revealed_count']
+        self.flag_count = sum(1 for value in state['cells'].values() if value & FLAGGED)
+        self.game_over = state['game_over']
+        self.first_move = state['first_move']
+        self.mines_placed = state['mines_placed']
+        self.clear_journal()  # Yüklenen durumdan önceki hamlelere dönülemez
+        self._rebuild_index()
+        self._notify_full()
+
+
+# Çözücü İstatistikleri
+# Çözücünün zamanını hangi aşamada (basit kurallar, sınır çözümü, olasılık hesabı...) harcadığını ve arama
+# düğümü, budama, sınır boyutu, önbellek isabeti gibi sayaçları toplar. Varsayılan NULL_STATS hiçbir şey
+# kaydetmez; ölçüm isteyen (bench --stats, arayüzdeki Stats kutusu) çözücüye bir SolverStats atar.
+
+class _NullPhase:
+    # Kapalı istatistiklerde kullanılan, hiçbir şey yapmayan bağlam yöneticisi.
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class NullStats:
+    # Kapalı istatistikler: tüm çağrılar tek bir yöntem çağrısı maliyetindedir.
+    enabled = False
+    last_move = {}
+    _phase = _NullPhase()
+
+    def phase(self, name):
+        return self._phase
+
+    def move(self):
+        return self._phase
+
+    def count(self, name, value=1):
+        pass
+
+    def observe(self, name, value):
+        pass
+
+
+NULL_STATS = NullStats()
+
+
+class _Phase:
+    # Açık istatistiklerde bir aşamanın süresini ölçer; iç içe aşamalar yığın yolu olarak kaydedilir.
+    __slots__ = ('stats', 'name', 'start', 'child')
+
+    def __init__(self, stats, name):
+        self.stats = stats
+        self.name = name
+
+    def __enter__(self):
+        self.child = 0.0  # İç aşamalarda geçen süre (öz süre hesabı için)
+        self.stats._stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        stats = self.stats
+        stack = stats._stack
+        path = ";".join(phase.name for phase in stack)
+        stack.pop()
+        if stack:
+            stack[-1].child += elapsed
+        entry = stats.phases.get(self.name)
+        if entry is None:
+            entry = stats.phases[self.name] = [0, 0.0]
+        entry[0] += 1
+        entry[1] += elapsed
+        stats.folded[path] = stats.folded.get(path, 0.0) + elapsed - self.child
+        return False
+
+
+class SolverStats:
+    """
+    Aşama süreleri (phase), sayaçlar (count) ve en büyük değerler (observe) için açık istatistikler.
+    move() bağlamı bir hamleyi kapsar; hamle bitince o hamleye ait farklar last_move sözlüğüne yazılır.
+    to_json ve folded (flame graph araçlarının okuduğu "a;b;c mikro_saniye" satırları) ile dışa aktarılır.
+    """
+    enabled = True
+
+    def __init__(self):
+        self.phases = {}  # Aşama adı -> [çağrı sayısı, toplam saniye]
+        self.counters = {}  # Sayaç adı -> toplam
+        self.peaks = {}  # Gözlem adı -> en büyük değer
+        self.folded = {}  # "dış;iç" yığın yolu -> öz süre (saniye)
+        self._stack = []
+        self.moves = 0
+        self.last_move = {}
+
+    def phase(self, name):
+        return _Phase(self, name)
+
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name, value):
+        # Değeri sayaç olarak toplar ve en büyüğünü saklar (ör. sınır boyutu).
+        self.counters[name] = self.counters.get(name, 0) + value
+        if value > self.peaks.get(name, value - 1):
+            self.peaks[name] = value
+
+    def move(self):
+        return _MoveScope(self)
+
+    def merge(self, other):
+        # Başka bir istatistiğin (ör. başka bir oyunun) JSON çıktısını bu nesneye ekler.
+        for name, entry in other["phases"].items():
+            mine = self.phases.setdefault(name, [0, 0.0])
+            mine[0] += entry["calls"]
+            mine[1] += entry["seconds"]
+        for name, value in other["counters"].items():
+            self.counters[name] = self.counters.get(name, 0) + value
+        for name, value in other["peaks"].items():
+            self.peaks[name] = max(self.peaks.get(name, value), value)
+        for path, seconds in other["folded"].items():
+            self.folded[path] = self.folded.get(path, 0.0) + seconds
+        self.moves += other["moves"]
+
+    def to_json(self):
+        return {
+            "moves": self.moves,
+            "phases": {name: {"calls": calls, "seconds": seconds} for name, (calls, seconds) in self.phases.items()},
+            "counters": dict(self.counters),
+            "peaks": dict(self.peaks),
+            "folded": dict(self.folded),
+        }
+
+    def folded_lines(self, prefix=""):
+        # Flame graph biçimi: her satırda yığın yolu ve mikro saniye cinsinden öz süre.
+        return [f"{prefix}{path} {round(seconds * 1e6)}" for path, seconds in sorted(self.folded.items())
+                if seconds > 0]
+
+
+class _MoveScope:
+    # Bir hamle süresince değişen süre ve sayaçları SolverStats.last_move'a yazar.
+    __slots__ = ('stats', 'phase', 'phases', 'counters')
+
+    def __init__(self, stats):
+        self.stats = stats
+        self.phase = _Phase(stats, "move")
+
+    def __enter__(self):
+        stats = self.stats
+        self.phases = {name: entry[1] for name, entry in stats.phases.items()}
+        self.counters = dict(stats.counters)
+        self.phase.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.phase.__exit__(*exc_info)
+        stats = self.stats
+        stats.moves += 1
+        # Referans tek atamayla değiştirilir; arayüz iş parçacığı her zaman tutarlı bir sözlük okur.
+        stats.last_move = {
+            "move": stats.moves,
+            "seconds": stats.phases["move"][1] - self.phases.get("move", 0.0),
+            "phases": {name: entry[1] - self.phases.get(name, 0.0) for name, entry in stats.phases.items()
+                       if name != "move" and entry[1] != self.phases.get(name, 0.0)},
+            "counters": {name: value - self.counters.get(name, 0) for name, value in stats.counters.items()
+                         if value != self.counters.get(name, 0)},
+        }
+        return False
+
+
+def format_move_stats(stats):
+    # Son hamlenin istatistiklerini tek satırlık panel metnine çevirir.
+    last = stats.last_move
+    if not last:
+        return ""
+    parts = [f"#{last['move']} {last['seconds'] * 1000:.2f} ms"]
+    parts += [f"{name} {seconds * 1000:.2f} ms" for name, seconds in last["phases"].items()]
+    parts += [f"{name} {value}" for name, value in last["counters"].items()]
+    return " | ".join(parts)
+
+
+def timed(name):
+    # Çözücü yöntemini self.stats üzerinde name adlı aşama olarak ölçer (istatistik kapalıysa ölçüm yapılmaz).
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.stats.phase(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class LazyHeap:
+    # Anahtarı güncellenebilen öncelik kuyruğu (en küçük anahtar önce). Her öğenin geçerli anahtarı sözlükte
+    # tutulur; güncellemede yığına yeni bir kayıt eklenir, eski kayıt ise en üste çıktığında atlanır
+    # (tembel silme). Eskimiş kayıtlar çoğaldığında yığın geçerli anahtarlardan yeniden kurulur.
+    __slots__ = ('_heap', '_keys')
+
+    def __init__(self):
+        self._heap = []
+        self._keys = {}
+
+    def __len__(self):
+        return len(self._keys)
+
+    def push(self, item, key):
+        # Öğeyi ekler veya anahtarını günceller: O(log N).
+        if self._keys.get(item) == key:
+            return
+        self._keys[item] = key
+        heapq.heappush(self._heap, (key, item))
+        if len(self._heap) > 2 * len(self._keys) + 64:
+            self._heap = [(key, item) for item, key in self._keys.items()]
+            heapq.heapify(self._heap)
+
+    def discard(self, item):
+        # Öğeyi siler; yığındaki kaydı ilk karşılaşıldığında atılır.
+        self._keys.pop(item, None)
+
+    def peek(self):
+        # En küçük anahtarlı (öğe, anahtar) çiftini döndürür; kuyruk boşsa None.
+        heap = self._heap
+        keys = self._keys
+        while heap:
+            key, item = heap[0]
+            if keys.get(item) == key:
+                return item, key
+            heapq.heappop(heap)
+        return None
+
+    def clear(self):
+        self._heap = []
+        self._keys = {}
+
+
+class BudgetExceeded(Exception):
+    # Hamle için ayrılan süre veya arama düğümü bütçesi doldu (bkz. SearchBudget).
+    pass
+
+
+class SearchCancelled(Exception):
+    # Süren arama dışarıdan (Pause düğmesi, komut satırı sürücüsü) durduruldu (bkz. SearchBudget.cancel).
+    pass
+
+
+class SearchBudget:
+    """
+    Tek bir hamle aramasının süre (saniye) ve düğüm sınırı; ikisi de verilmezse sadece durdurma için kullanılır.
+    Çözücü her hamlede start ile sayaçları sıfırlar; düğüm sayacı hamle boyunca bütün bileşenler için birikir.
+    Arama döngüleri belli aralıklarla charge, aramasız aşamalar (bileşenlere ayırma, doğrusal çıkarım,
+    olasılık ağırlıkları) ve bileşenler arası geçişler check çağırır.
+    Bütçe dolunca BudgetExceeded, cancel çağrıldıysa SearchCancelled fırlatılır. cancel başka bir iş
+    parçacığından çağrılabilir ve reset çağrılana kadar sonraki aramaları da durdurur.
+    parent verilirse harcanan düğümler ona da yazılır; üst bütçenin süresi ve durdurma isteği de geçerlidir.
+    """
+    __slots__ = ('seconds', 'nodes', 'parent', 'cancelled', 'deadline', 'used')
+
+    def __init__(self, seconds=None, nodes=None, parent=None):
+        self.seconds = seconds
+        self.nodes = nodes
+        self.parent = parent
+        self.cancelled = False
+        self.deadline = None
+        self.used = 0
+
+    def start(self):
+        self.deadline = None if self.seconds is None else time.perf_counter() + self.seconds
+        self.used = 0
+
+    def cancel(self):
+        self.cancelled = True
+
+    def reset(self):
+        self.cancelled = False
+
+    def check(self):
+        # Düğüm eklemeden süreyi ve durdurma isteğini denetler (bileşenler arası ve aramasız aşamalar için).
+        self.charge(0)
+
+    def charge(self, nodes=1):
+        # Harcanan arama düğümlerini ekler ve bütçeyi denetler.
+        if self.parent is not None:
+            self.parent.charge(nodes)
+        self.used += nodes
+        if self.cancelled:
+            raise SearchCancelled()
+        if self.nodes is not None and self.used > self.nodes:
+            raise BudgetExceeded()
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise BudgetExceeded()
+
+
+# SolverBase: Ortak Çözücü Sınıfı
+# Tüm çözücü algoritmaların ortak özelliklerini ve temel yöntemlerini barındırır.
+
+class SolverBase:
+    def __init__(self, board, pattern_cache=None):
+        self.board = board  # Oyun tahtasına referans
+        self.bad_moves = set()  # Güvenli olmayan hamlelerin kaydı
+        self.flagged_mines = set()  # İşaretlenmiş mayınların takibi
+        self.visited = set()  # Ziyaret edilen hücrelerin takibi (bazı algoritmalarda kullanılır)
+        # Tahtadaki değişiklikler takip edilir; basit kurallar sadece değişen kısıtlar için yeniden değerlendirilir.
+        # Kanıtlanmış hücreler açılana veya bayraklanana kadar hamleler arasında kuyruklarda tutulur
+        # (indeks -> None sözlükleri, bulunma sırasıyla).
+        self._changes = board.track_changes()
+        self._safe_queue = {}  # Kesin güvenli, henüz açılmamış hücreler
+        self._mine_queue = {}  # Kesin mayın, henüz bayraklanmamış hücreler
+        # Sınır bileşeni kullanan çözücüler için: çözülmüş desenler önbelleği (verilmezse tüm çözücüler
+        # PATTERN_CACHE'i paylaşır) ve son çağrıda çözülen bileşenler (mutlak kısıt imzasına göre).
+        self.pattern_cache = PATTERN_CACHE if pattern_cache is None else pattern_cache
+        self._solved = {}
+        self._linear_failed = set()  # Doğrusal çıkarımın sonuç vermediği bileşenlerin imzaları
+        self._rankings = {}  # Sıralama adı -> (LazyHeap, değişiklik kümesi); bkz. _ranked_frontier
+        self.stats = NULL_STATS  # Ölçüm için SolverStats atanabilir
+        self.budget = None  # Hamle başına süre/düğüm sınırı ve durdurma için SearchBudget atanabilir
+        self.sampler = None  # Tam çözümü pahalı bileşenler için MonteCarloEstimator atanabilir
+        self.exhausted = False  # Son hamlede bütçe dolduysa True (sonuç tahminle seçildi)
+
+    def _read_constraint(self, idx):
+        # Açılmış sayılı hücrenin gizli (bayraksız) komşularını ve bu komşularda kalan mayın sayısını döndürür.
+        cells = self.board.cells
+        table = self.board.neighbor_table
+        hidden = []
+        flags = 0
+        for d in table.offsets[table.kinds[idx]]:
+            n = idx + d
+            neighbor = cells[n]
+            if neighbor & FLAGGED:
+                flags += 1
+            elif not neighbor & REVEALED:
+                hidden.append(n)
+        return hidden, (cells[idx] & COUNT_MASK) - flags
+
+    def _dirty_constraints(self):
+        # Son çağrıdan bu yana komşuluğu değişen aktif kısıtları döndürür ve değişiklik kümesini boşaltır.
+        # Açılan veya bayraklanan hücreler kuyruklardan çıkarılır. Normal oyunda bilgi sadece artar ve kanıtlanmış
+        # hücreler kesin kalır. Gizli ve bayraksız hale gelen bir hücre (geri alma, bayrak kaldırma), çıkarımlarla
+        # çelişen bir değişiklik (kanıtlanmamış ya da güvenli bulunmuş hücreye bayrak, mayın bulunmuş hücrenin
+        # açılması; kullanıcı yanlış bayrak koyabilir) veya tahtanın tamamen değişmesi durumunda kuyruklar
+        # boşaltılır ve tüm kısıtlar yeniden değerlendirilir.
+        board = self.board
+        changes = self._changes
+        safe_queue = self._safe_queue
+        mine_queue = self._mine_queue
+        cells = board.cells
+        if not changes.full:
+            for idx in changes:
+                state = cells[idx]
+                if state & FLAGGED:
+                    consistent = idx in mine_queue and idx not in safe_queue
+                else:
+                    consistent = state & REVEALED and idx not in mine_queue
+                if not consistent:
+                    changes.full = True
+                    break
+                safe_queue.pop(idx, None)
+                mine_queue.pop(idx, None)
+        if changes.full:
+            changes.full = False
+            changes.clear()
+            safe_queue.clear()
+            mine_queue.clear()
+            return set(board.active)
+        kinds = board.neighbor_table.kinds
+        offsets = board.neighbor_table.offsets
+        dirty = set(changes)
+        for idx in changes:
+            for d in offsets[kinds[idx]]:
+                dirty.add(idx + d)
+        changes.clear()
+        return dirty
+
+    def _frontier_constraints(self, budget=None):
+        # Açılmış sayılı hücrelerin (aktif kısıtların) gizli komşuları ve kalan mayın sayıları toplanır.
+        # budget (SearchBudget) verilirse her 1024 kısıtta bir denetlenir.
+        constraints = []
+        for count, idx in enumerate(self.board.active):
+            if budget is not None and not count & 1023:
+                budget.check()
+            hidden, remaining = self._read_constraint(idx)
+            if hidden:
+                constraints.append((hidden, remaining))
+        return constraints
+
+    @timed("linear")
+    def find_linear_moves(self):
+        """
+        Basit kuralların yetmediği durumda, arama yapmadan önce sınır bileşenlerine polinom süreli doğrusal
+        çıkarım (kısıt çiftleri ve Gauss eliminasyonu, bkz. linear_deductions) uygular.
+        Kesin güvenli ve kesin mayın hücrelerini (satır, sütun) listeleri olarak döndürür.
+        Önceki çağrıda sonuç vermeyen ve o zamandan beri değişmeyen bileşenler yeniden denenmez.
+        Bütçe (self.budget) dolarsa BudgetExceeded fırlatılır.
+        """
+        budget = self.budget
+        previous = self._linear_failed
+        failed = set()
+        safe_cells = []
+        mine_cells = []
+        for component in self._split_frontier():
+            key = component_signature(component)
+            if key in previous:
+                failed.add(key)
+                continue
+            safe, mines = linear_deductions(component, budget)
+            if not safe and not mines:
+                failed.add(key)
+            safe_cells.extend(safe)
+            mine_cells.extend(mines)
+        self._linear_failed = failed
+        self.stats.count("linear_cells", len(safe_cells) + len(mine_cells))
+
+        width = self.board.width
+        return [divmod(idx, width) for idx in safe_cells], [divmod(idx, width) for idx in mine_cells]
+
+    def _split_frontier(self):
+        # Aktif kısıtları bağımsız bileşenlere ayırır ("split" aşaması); sınır boyutu istatistiğe eklenir.
+        with self.stats.phase("split"):
+            components = split_frontier(self._frontier_constraints(self.budget), self.budget)
+        stats = self.stats
+        if stats.enabled:
+            stats.observe("frontier_cells", sum(len(component.cells) for component in components))
+            stats.count("components", len(components))
+        return components
+
+    def _solve_components(self, components):
+        # Bileşenleri desen önbelleğiyle çözer; arama düğümü, budama ve önbellek isabeti sayılır.
+        # Örnekleyici atanmışsa büyük bileşenlerin tam araması sınırlanır, sığmayanlar örneklenir.
+        cache = self.pattern_cache
+        hits, misses = cache.hits, cache.misses
+        width = self.board.width
+        budget = self.budget
+        sampler = self.sampler
+        solved = []
+        with self.stats.phase("search"):
+            for component in components:
+                if budget is not None:
+                    budget.check()
+                if sampler is None or len(component.cells) <= sampler.threshold:
+                    solved.append(cache.solve(component, width, budget))
+                    continue
+                limit = SearchBudget(nodes=sampler.exact_nodes, parent=budget)
+                try:
+                    solved.append(cache.solve(component, width, limit))
+                except BudgetExceeded:
+                    if limit.used <= limit.nodes:
+                        raise  # Üst bütçe doldu
+                    solved.append(self._sample_component(component))
+        stats = self.stats
+        if stats.enabled:
+            exact = [component for component in solved if not component.sampled]
+            stats.count("search_nodes", sum(component.nodes for component in exact))
+            stats.count("search_prunes", sum(component.prunes for component in exact))
+            stats.count("pattern_hits", cache.hits - hits)
+            stats.count("pattern_misses", cache.misses - misses)
+        return solved
+
+    def _sample_component(self, component):
+        # Bileşeni örnekleyiciyle tahmin eder; örnek sayısı ve tanılar istatistiğe eklenir.
+        sampler = self.sampler
+        with self.stats.phase("sample"):
+            sampler.estimate(component, self.budget)
+        stats = self.stats
+        if stats.enabled:
+            stats.count("sampled_components")
+            stats.count("samples", sampler.last["samples"])
+            if sampler.last["max_stderr"] is not None:
+                stats.observe("sample_stderr_pct", round(100 * sampler.last["max_stderr"]))
+        return component
+
+    def _solve_frontier(self):
+        # Aktif kısıtları bağımsız bileşenlere ayırıp çözer. Son çağrıdan beri değişmeyen bileşenler doğrudan,
+        # tahtanın başka bir yerinde veya başka oyunda görülmüş desenler desen önbelleğinden alınır.
+        previous = self._solved
+        current = {}
+        components = []
+        fresh = []
+        for component in self._split_frontier():
+            key = component_signature(component)
+            solved = previous.get(key)
+            if solved is None:
+                fresh.append((key, component))
+            else:
+                current[key] = solved
+                components.append(solved)
+        for (key, _), solved in zip(fresh, self._solve_components([component for _, component in fresh])):
+            current[key] = solved
+            components.append(solved)
+        self._solved = current
+        return components
+
+    @timed("safe_moves")
+    def find_safe_moves(self):
+        """
+        Basit mantıksal kurallar kullanarak güvenli hamleleri ve mayın olabilecek hücreleri belirler.
+        Her açılmış hücrenin komşularını kontrol ederek iki kural uygular:
+         - Kural 1: Kalan sayı gizli hücre sayısına eşitse, tüm gizli hücreler mayındır.
+         - Kural 2: Kalan sayı 0 ise, tüm gizli hücreler güvenlidir.
+        Kurallar sadece son hamleden beri komşuluğu değişen aktif kısıtlar için yeniden değerlendirilir; bulunan
+        hücreler açılana veya bayraklanana kadar kuyruklarda kalır. Kuyruğa derin çıkarımların (doğrusal, geri
+        izleme, kesin olasılık) güvenli hücreleri de eklenir (bkz. _queue_safe); hepsi burada birlikte döner.
+        Güvenli hücreler next_safe_move'un vereceği sırayla (en son bulunan önce) listelenir.
+        """
+        self._update_deductions()
+
+        # İndeksler (satır, sütun) koordinatlarına çevrilerek döndürülür.
+        width = self.board.width
+        return [divmod(n, width) for n in reversed(self._safe_queue)], [divmod(n, width) for n in self._mine_queue]
+
+    def _update_deductions(self):
+        # Komşuluğu değişen aktif kısıtlara basit kuralları uygular ve sonuçları kuyruklara ekler.
+        active = self.board.active
+        safe_queue = self._safe_queue
+        mine_queue = self._mine_queue
+        dirty = self._dirty_constraints()
+        self.stats.count("dirty_constraints", len(dirty))
+        for idx in dirty:
+            if idx not in active:
+                continue  # Gizli komşusu kalmamış veya sayısız hücreler kısıt değildir
+            hidden, remaining = self._read_constraint(idx)
+
+            # Eğer kalan sayı gizli hücre sayısına eşitse, bu hücreler mayın olarak işaretlenmelidir.
+            if remaining == len(hidden):
+                for n in hidden:
+                    mine_queue[n] = None
+
+            # Eğer kalan sayı 0 ise, komşudaki tüm gizli hücreler güvenlidir.
+            elif remaining == 0:
+                for n in hidden:
+                    safe_queue[n] = None
+
+    def _settle_deductions(self):
+        # Kuyrukları günceller ve kuyruktaki mayınları bayraklar. Bayraklar kısıtları değiştirir ve yeni güvenli
+        # hücre veya mayın çıkarabilir; kuyruk yeni mayın vermeyene kadar tekrarlanır.
+        width = self.board.width
+        self._update_deductions()
+        while self._mine_queue:
+            self.flag_mines([divmod(n, width) for n in self._mine_queue])
+            self._update_deductions()
+
+    def next_safe_move(self):
+        """
+        Kuyruktaki mayınları bayraklar ve kuyruktaki en son bulunan güvenli hücreyi (satır, sütun) döndürür;
+        kuyruk boşsa None. Sadece değişen kısıtlar işlendiği için kuyruk doluyken maliyet hamle başına sabittir.
+        """
+        self._settle_deductions()
+        for idx in reversed(self._safe_queue):
+            return divmod(idx, self.board.width)  # En son bulunan önce: açılan bölge yerel kalır
+        return None
+
+    def queued_safe_moves(self):
+        # Kuyruktaki mayınları bayraklar ve bütün güvenli hücreleri next_safe_move'un vereceği sırayla
+        # (ilk eleman next_safe_move'un sonucu) döndürür.
+        self._settle_deductions()
+        width = self.board.width
+        return [divmod(idx, width) for idx in reversed(self._safe_queue)]
+
+    def _queue_safe(self, cells):
+        # Derin çıkarımla kanıtlanmış güvenli (satır, sütun) hücrelerini kuyruğa ekler ve kuyruğun tamamını
+        # queued_safe_moves sırasıyla döndürür; sadece ilki açılsa da kalanlar sonraki hamlelerde yeniden arama
+        # yapılmadan kuyruktan verilir.
+        width = self.board.width
+        for row, col in cells:
+            self._safe_queue[row * width + col] = None
+        return self.queued_safe_moves()
+
+    def flag_mines(self, mines):
+        # Belirlenen mayın konumlarını bayraklar ve flag listesine ekler. Bayrak mayın kuyruğuna da yazılır ki
+        # _dirty_constraints onu kanıtlanmış bir bayrak olarak tanısın.
+        width = self.board.width
+        for x, y in mines:
+            if not self.board.is_flagged(x, y):
+                self._mine_queue[x * width + y] = None
+                self.board.set_flag(x, y, True)
+                self.flagged_mines.add((x, y))
+
+    def get_next_moves(self):
+        # Bir sonraki hamle kümesini döndürür: basit kuralların bulduğu güvenli hücrelerin tamamı birlikte
+        # açılabilir (bkz. MinesweeperBoard.reveal_many); yoksa get_next_move'un tek hamlesi döner.
+        # Listenin ilk elemanı her zaman get_next_move'un seçeceği hücredir.
+        safe = self.queued_safe_moves()
+        if safe:
+            return safe
+        move = self.get_next_move()
+        return [move] if move else []
+
+    def _ranked_frontier(self, name, key):
+        """
+        Sınır hücrelerini key(idx) anahtarına göre sıralayan kalıcı yığını (LazyHeap) döndürür.
+        Yığın ilk çağrıda sınırdan kurulur; sonraki çağrılarda sadece son çağrıdan beri değişen hücrelerin
+        ve komşularının anahtarları güncellenir (sınırdan çıkanlar silinir). Anahtar, hücrenin kendisi ve
+        komşularının durumundan başka bir şeye bağlı olmamalıdır.
+        """
+        board = self.board
+        entry = self._rankings.get(name)
+        if entry is None:
+            entry = self._rankings[name] = (LazyHeap(), board.track_changes())
+        heap, changes = entry
+        frontier = board.frontier
+        if changes.full:
+            changes.full = False
+            changes.clear()
+            heap.clear()
+            for idx in frontier:
+                heap.push(idx, key(idx))
+            self.stats.count("rank_updates", len(frontier))
+            return heap
+        if changes:
+            kinds = board.neighbor_table.kinds
+            offsets = board.neighbor_table.offsets
+            affected = set(changes)
+            for idx in changes:
+                for d in offsets[kinds[idx]]:
+                    affected.add(idx + d)
+            changes.clear()
+            for idx in affected:
+                if idx in frontier:
+                    heap.push(idx, key(idx))
+                else:
+                    heap.discard(idx)
+            self.stats.count("rank_updates", len(affected))
+        return heap
+
+    def _best_ranked(self, heap):
+        # Yığındaki kötü olarak işaretlenmemiş en öncelikli hücreyi döndürür; kötü hamleler yığından atılır.
+        width = self.board.width
+        while True:
+            top = heap.peek()
+            if top is None:
+                return None
+            cell = divmod(top[0], width)
+            if cell not in self.bad_moves:
+                return cell
+            heap.discard(top[0])
+
+    def _revealed_neighbors_key(self, idx):
+        # En fazla açılmış komşusu olan hücre önce gelir; eşitlikte indeksi büyük olan (eski sıralamayla aynı).
+        cells = self.board.cells
+        adjacent_revealed = 0
+        for d in self.board.neighbor_table.offsets[self.board.neighbor_table.kinds[idx]]:
+            if cells[idx + d] & REVEALED:
+                adjacent_revealed += 1
+        return -adjacent_revealed, -idx
+
+    @timed("probability_move")
+    def get_probability_move(self):
+        """
+        Olasılıksal olarak en iyi hamleyi seçer.
+        Açılmamış ve bayraklanmamış hücreler arasından, açılmış hücrelere en yakın olanı tercih eder.
+        Açılmış komşusu olan her hücre sınırdadır; sınır hücreleri açık komşu sayısına göre kalıcı bir yığında
+        tutulur ve her çağrıda sadece değişen hücrelerin çevresi yeniden değerlendirilir.
+        """
+        board = self.board
+        width = board.width
+        cell = self._best_ranked(self._ranked_frontier("revealed", self._revealed_neighbors_key))
+        if cell is not None:
+            return cell
+
+        # Uygun sınır hücresi yoksa tüm adayların açık komşusu sıfırdır; en sondaki gizli hücre seçilir.
+        for idx in board.hidden_cells(reverse=True):
+            cell = divmod(idx, width)
+            if cell not in self.bad_moves:
+                return cell
+        return None
+
+    def _exhaust(self):
+        # Hamlenin bütçesi doldu; hamle get_estimated_move ile veya eldeki kesin sonuçlarla seçilir.
+        self.exhausted = True
+        self.stats.count("budget_exhausted")
+
+    def get_estimated_move(self):
+        """
+        Tam çözüm bütçeye sığmadığında kullanılan hızlı olasılık tahmini. Bir sınır hücresinin mayın olasılığı,
+        içinde bulunduğu kısıtların yoğunluklarının (kalan mayın / gizli komşu) en büyüğü; sınırda olmayan
+        hücrelerinki kalan mayınların gizli hücrelere oranı olarak alınır. En düşük tahminli hücre seçilir.
+        """
+        board = self.board
+        width = board.width
+        estimates = {}
+        for hidden, remaining in self._frontier_constraints():
+            density = remaining / len(hidden)
+            for idx in hidden:
+                if estimates.get(idx, -1.0) < density:
+                    estimates[idx] = density
+        best = min(((p, divmod(idx, width)) for idx, p in estimates.items()
+                    if divmod(idx, width) not in self.bad_moves), default=None)
+        hidden_cells = board.width * board.height - board.revealed_count - board.flag_count
+        total = board.mine_total()
+        if total is None:
+            interior_density = board.density
+        else:
+            interior_density = (total - board.flag_count) / hidden_cells if hidden_cells else 1.0
+        if hidden_cells > len(estimates) and (best is None or interior_density < best[0]):
+            frontier = board.frontier
+            for idx in board.hidden_cells():
+                if idx not in frontier and divmod(idx, width) not in self.bad_moves:
+                    return divmod(idx, width)
+        return best[1] if best else self.get_probability_move()
+
+
+
+# LogicalSolver Sınıfı
+# Basit mantıksal kuralları kullanarak hamle belirleyen çözücü.
+# 10x10'luk 10 mayınlı mayın tarlasında ortalama 10.596 saniyede çözümü buluyor.
+class LogicalSolver(SolverBase):
+    def get_next_move(self):
+        # Bulunan mayın hücrelerini bayraklar; güvenli hamle kuyrukta varsa ilkini döndürür.
+        move = self.next_safe_move()
+        if move is not None:
+            return move
+
+        # Güvenli hamle bulunamazsa olasılıksal hamleyi döndürür.
+        return self.get_probability_move()
+
+
+
+# DFSSolver Sınıfı
+# Derinlemesine arama (DFS) mantığı ile hamle seçen çözücü.
+# 10x10'luk 10 mayınlı mayın tarlasında ortalama 11.324 saniyede çözümü buluyor.
+class DFSSolver(SolverBase):
+    def __init__(self, board):
+        super().__init__(board)
+        self.visited = set()  # DFS sırasında ziyaret edilen hücreleri takip eder
+
+    def get_next_move(self):
+        # Bulunan mayınları işaretler; güvenli hamle kuyrukta varsa ilkini döndürür.
+        move = self.next_safe_move()
+        if move is not None:
+            return move
+
+        # DFS mantığı: Henüz ziyaret edilmemiş ve bayraklanmamış hücreler arasından seçim yapar.
+        width = self.board.width
+        for idx in self.board.hidden_cells():
+            cell = divmod(idx, width)
+            if cell not in self.visited and cell not in self.bad_moves:
+                self.visited.add(cell)  # Hücreyi ziyaret edildi olarak işaretle
+                return cell  # İlk bulunan uygun hücreyi seç
+
+        # Hiçbir güvenli hamle bulunamazsa olasılıksal hamleyi döndürür.
+        return self.get_probability_move()
+
+
+# AStarSolver Sınıfı
+# A* algoritmasına benzer sezgisel bir yaklaşım kullanarak hamle seçen çözücü.
+# 10x10'luk 10 mayınlı mayın tarlasında ortalama 7.912 saniyede çözümü buluyor.
+class AStarSolver(SolverBase):
+    def get_next_move(self):
+        # Mayınları işaretler; güvenli hamle kuyrukta varsa döndürür.
+        move = self.next_safe_move()
+        if move is not None:
+            return move
+
+        # A* mantığı: en yüksek öncelikli sınır hücresi kalıcı yığından alınır (bkz. _astar_key).
+        # Açılmış komşusu olmayan hücreler aday olamayacağından yığında sadece sınır hücreleri bulunur.
+        cell = self._best_ranked(self._ranked_frontier("astar", self._astar_key))
+        if cell is not None:
+            return cell
+
+        # Güvenli hamle bulunamazsa olasılıksal hamleyi döndürür.
+        return self.get_probability_move()
+
+    def _astar_key(self, idx):
+        # priority = revealed_neighbors - (total_adjacent_mines / (8 * revealed_neighbors)).
+        board = self.board
+        cells = board.cells
+        revealed_neighbors = 0
+        total_adjacent_mines = 0
+        for d in board.neighbor_table.offsets[board.neighbor_table.kinds[idx]]:
+            neighbor = cells[idx + d]
+            if neighbor & REVEALED:
+                revealed_neighbors += 1
+                total_adjacent_mines += neighbor & COUNT_MASK
+
+        # Sezgisel hesaplama: Açılmış komşu sayısı ve ortalama mayın sayısı üzerinden öncelik belirlenir.
+        # Sınır hücresinin en az bir açık komşusu vardır; eşitlikte (satır, sütun) sırası eski sıralamayla aynıdır.
+        priority = revealed_neighbors - (total_adjacent_mines / (8 * revealed_neighbors))
+        # Negatif değer kullanılarak küçükten büyüğe sıralama sağlanır.
+        return -priority, idx
+
+# Sınır Kısıt Motoru
+# Sınırdaki gizli hücreleri birbirinden bağımsız bileşenlere ayırır ve her bileşeni ayrı ayrı,
+# kısıt yayılımı ile budanan bir geri izleme aramasıyla tam olarak çözer.
+# Atamalar saklanmaz; her bileşen için mayın sayısına göre çözüm sayıları ve hücre bazında mayın sayaçları tutulur.
+
+class FrontierComponent:
+    # cells: bileşendeki tahta indeksleri; constraints: (bileşen içi değişken konumları, kalan mayın) çiftleri.
+    # solve sonrası solutions[k] k mayınlı çözüm sayısını, mine_counts[k][v] bu çözümlerde v'nin mayın olma sayısını verir.
+    # nodes ve prunes, son solve_component çağrısındaki arama düğümü ve budanan dal sayılarıdır.
+    # sampled True ise sayılar MonteCarloEstimator tahminidir (kesin değil, sadece oranları anlamlı).
+    __slots__ = ('cells', 'constraints', 'solutions', 'mine_counts', 'nodes', 'prunes', 'sampled')
+
+    def __init__(self, cells, constraints):
+        self.cells = cells
+        self.constraints = constraints
+        self.solutions = {}
+        self.mine_counts = {}
+        self.nodes = 0
+        self.prunes = 0
+        self.sampled = False
+
+    def total_solutions(self):
+        return sum(self.solutions.values())
+
+    def cell_mine_totals(self):
+        # Tüm çözümler üzerinden her hücrenin kaç çözümde mayın olduğunu döndürür.
+        totals = [0] * len(self.cells)
+        for counts in self.mine_counts.values():
+            for v, count in enumerate(counts):
+                totals[v] += count
+        return totals
+
+    def forced_cells(self):
+        # Tüm çözümlerde güvenli ve tüm çözümlerde mayın olan tahta indekslerini döndürür.
+        total = self.total_solutions()
+        if not total or self.sampled:
+            return [], []  # Çelişkili veya örneklenmiş bileşen: kesin bir sonuç çıkarılamaz
+        safe = []
+        mines = []
+        for idx, count in zip(self.cells, self.cell_mine_totals()):
+            if count == 0:
+                safe.append(idx)
+            elif count == total:
+                mines.append(idx)
+        return safe, mines
+
+
+def split_frontier(constraints, budget=None):
+    """
+    (gizli hücre indeksleri, kalan mayın) kısıtlarını ortak hücre üzerinden bağlı bileşenlere ayırır.
+    Birleştir-bul (union-find) ile her bileşen için bir FrontierComponent döndürür.
+    budget (SearchBudget) verilirse her 1024 kısıtta ve her bileşende bir denetlenir.
+    """
+    parent = {}
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for count, (hidden, _) in enumerate(constraints):
+        if budget is not None and not count & 1023:
+            budget.check()
+        for idx in hidden:
+            parent.setdefault(idx, idx)
+        root = find(hidden[0])
+        for idx in hidden[1:]:
+            other = find(idx)
+            if other != root:
+                parent[other] = root
+
+    groups = {}
+    for hidden, remaining in constraints:
+        groups.setdefault(find(hidden[0]), []).append((hidden, remaining))
+
+    components = []
+    for group in groups.values():
+        if budget is not None:
+            budget.check()
+        # Değişkenler kısıt grafiğinde genişlik öncelikli sırayla numaralandırılır;
+        # böylece birbirine bağlı hücreler aramada art arda gelir ve çelişkiler erken yakalanır.
+        by_cell = {}
+        for ci, (hidden, _) in enumerate(group):
+            for idx in hidden:
+                by_cell.setdefault(idx, []).append(ci)
+        position = {}
+        seen = {0}
+        queue = [0]
+        for ci in queue:
+            for idx in group[ci][0]:
+                if idx not in position:
+                    position[idx] = len(position)
+                    for other in by_cell[idx]:
+                        if other not in seen:
+                            seen.add(other)
+                            queue.append(other)
+        local = [(tuple(position[idx] for idx in hidden), remaining) for hidden, remaining in group]
+        components.append(FrontierComponent(list(position), local))
+    return components
+
+
+def component_signature(component):
+    # Bileşenin tahta indeksleriyle yazılmış kısıtlarından oluşan anahtar; aynı yerdeki aynı bileşeni tanır.
+    return tuple(sorted((tuple(sorted(component.cells[v] for v in variables)), remaining)
+                        for variables, remaining in component.constraints))
+
+
+def linear_deductions(component, budget=None):
+    """
+    Bileşeni arama yapmadan, polinom sürede çözmeye çalışır ve kesin güvenli/mayın tahta indekslerini döndürür.
+    Kısıtlar hücre bit kümeleri (tam sayı) olarak tutulur ve bilinen hücreler çıkarıldıktan sonra sırayla:
+     - tek kısıt kuralı (kalan 0 veya gizli hücre sayısına eşit),
+     - birbiriyle kesişen kısıt çiftleri (alt/üst küme dahil): A'nın B dışındaki hücreleri kalan farkı
+       kadar mayın taşıyorsa hepsi mayın, B'nin A dışındaki hücreleri güvenlidir,
+     - kısıt matrisinin tam sayı Gauss eliminasyonu: indirgenmiş her satırda sağ taraf pozitif katsayıların
+       toplamına (veya negatiflerin toplamına) eşitse satırdaki tüm hücrelerin değeri bellidir,
+    uygulanır; yeni bir hücre belirlendikçe tur tekrarlanır. Bulunan her sonuç tüm çözümlerde geçerlidir,
+    ancak tam aramanın bulduğu her kesin hücreyi bulmayabilir.
+    budget (SearchBudget) verilirse her turda, kısıt çiftlerinde ve eliminasyonun her sütununda denetlenir.
+    """
+    n = len(component.cells)
+    value = [-1] * n
+    rows = {}
+    for variables, remaining in component.constraints:
+        bits = 0
+        for v in variables:
+            bits |= 1 << v
+        rows[bits] = remaining  # Aynı hücre kümesine sahip kısıtlar tek satıra iner
+
+    def settle(bits, choice):
+        # Bit kümesindeki atanmamış hücrelere değer verir; yeni bir atama yapıldıysa True döner.
+        changed = False
+        while bits:
+            low = bits & -bits
+            bits ^= low
+            v = low.bit_length() - 1
+            if value[v] < 0:
+                value[v] = choice
+                changed = True
+        return changed
+
+    known_mines = known_safe = 0
+    progress = True
+    while progress:
+        progress = False
+        if budget is not None:
+            budget.check()
+        # Bilinen hücreler kısıtlardan çıkarılır.
+        reduced = {}
+        for bits, remaining in rows.items():
+            remaining -= bin(bits & known_mines).count("1")
+            bits &= ~(known_mines | known_safe)
+            if bits:
+                reduced[bits] = remaining
+        rows = reduced
+
+        # Tek kısıt kuralı
+        for bits, remaining in rows.items():
+            if remaining == 0:
+                progress |= settle(bits, 0)
+            elif remaining == bin(bits).count("1"):
+                progress |= settle(bits, 1)
+
+        # Kesişen kısıt çiftleri: |A∖B| == rA - rB ise A∖B tamamen mayın, B∖A tamamen güvenlidir
+        # (A ⊆ B ise bu, B∖A'da rB - rA mayın olması kuralının özel halidir).
+        if not progress:
+            items = list(rows.items())
+            for i, (a, ra) in enumerate(items):
+                if budget is not None:
+                    budget.check()
+                for b, rb in items[i + 1:]:
+                    if not a & b:
+                        continue
+                    only_a = a & ~b
+                    only_b = b & ~a
+                    diff = ra - rb
+                    if diff == bin(only_a).count("1"):
+                        progress |= settle(only_a, 1) | settle(only_b, 0)
+                    elif -diff == bin(only_b).count("1"):
+                        progress |= settle(only_b, 1) | settle(only_a, 0)
+
+        # Gauss eliminasyonu (tam sayı katsayılı, her satır ebob ile sadeleştirilir)
+        if not progress and rows:
+            progress = _eliminate(rows, n, settle, budget)
+
+        if progress:
+            known_mines = known_safe = 0
+            for v in range(n):
+                if value[v] == 1:
+                    known_mines |= 1 << v
+                elif value[v] == 0:
+                    known_safe |= 1 << v
+
+    cells = component.cells
+    return ([cells[v] for v in range(n) if value[v] == 0],
+            [cells[v] for v in range(n) if value[v] == 1])
+
+
+def _eliminate(rows, n, settle, budget=None):
+    # rows ({bit kümesi: kalan}) kısıtlarını satır basamak biçimine indirger ve sınır kuralıyla kesin
+    # hücreleri settle ile atar. Her satır {değişken: katsayı} sözlüğü ve sağ taraf olarak tutulur.
+    matrix = []
+    for bits, remaining in rows.items():
+        row = {}
+        while bits:
+            low = bits & -bits
+            bits ^= low
+            row[low.bit_length() - 1] = 1
+        matrix.append([row, remaining])
+
+    pivot_rows = []
+    for col in range(n):
+        if budget is not None:
+            budget.check()
+        pivot = None
+        for entry in matrix:
+            if col in entry[0]:
+                pivot = entry
+                break
+        if pivot is None:
+            continue
+        matrix.remove(pivot)
+        pivot_row, pivot_rhs = pivot
+        p = pivot_row[col]
+        for entry in matrix + pivot_rows:
+            row, rhs = entry
+            c = row.get(col)
+            if not c:
+                continue
+            # satır = satır * p - pivot * c; col sütunu sıfırlanır
+            new_row = {v: coef * p for v, coef in row.items()}
+            for v, coef in pivot_row.items():
+                total = new_row.get(v, 0) - coef * c
+                if total:
+                    new_row[v] = total
+                else:
+                    new_row.pop(v, None)
+            rhs = rhs * p - pivot_rhs * c
+            divisor = math.gcd(rhs, *new_row.values()) if new_row else abs(rhs) or 1
+            if divisor > 1:
+                new_row = {v: coef // divisor for v, coef in new_row.items()}
+                rhs //= divisor
+            entry[0] = new_row
+            entry[1] = rhs
+        pivot_rows.append(pivot)
+
+    # Sınır kuralı: katsayıların en büyük/en küçük toplamı sağ tarafa eşitse tüm değişkenler belirlenir.
+    progress = False
+    for row, rhs in pivot_rows:
+        if not row:
+            continue
+        positive = negative = 0
+        high = low = 0
+        for v, coef in row.items():
+            if coef > 0:
+                positive |= 1 << v
+                high += coef
+            else:
+                negative |= 1 << v
+                low += coef
+        if rhs == high:
+            progress |= settle(positive, 1) | settle(negative, 0)
+        elif rhs == low:
+            progress |= settle(positive, 0) | settle(negative, 1)
+    return progress
+
+
+# solve_component yığınındaki iş türleri
+_VISIT, _TRY, _UNDO = range(3)
+
+
+def solve_component(component, budget=None):
+    """
+    Bileşendeki tüm geçerli mayın atamalarını sayar.
+    Her kısıt için atanmış mayın ve atanmamış hücre sayaçları tutulur; bir hücre atandığında veya geri
+    alındığında sadece o hücrenin kısıtları O(derece) sürede güncellenir. Sayaçlar kısıtın artık
+    sağlanamayacağını gösterdiği anda dal budanır. Kalan mayın sıfırsa diğer hücreler güvenli,
+    kalan mayın atanmamış hücre sayısına eşitse hepsi mayın olarak yayılır.
+    budget (SearchBudget) verilirse her 256 düğümde bir ve arama bitince (kalan düğümler yazılarak) denetlenir;
+    bütçe dolunca arama istisnayla kesilir ve bileşenin sayaçları eksik kalır.
+    """
+    n = len(component.cells)
+    constraints = component.constraints
+    var_constraints = [[] for _ in range(n)]
+    for ci, (variables, _) in enumerate(constraints):
+        for v in variables:
+            var_constraints[v].append(ci)
+    value = [-1] * n  # -1: atanmamış, 0: güvenli, 1: mayın
+    cells_range = range(n)
+    # Her kısıt için: henüz yerleştirilmesi gereken mayın sayısı ve atanmamış hücre sayısı
+    need = [remaining for _, remaining in constraints]
+    unassigned = [len(variables) for variables, _ in constraints]
+    solutions = component.solutions
+    mine_counts = component.mine_counts
+    solutions.clear()
+    mine_counts.clear()
+    tally = [0, 0]  # Arama düğümü ve budanan dal sayıları (istatistik için)
+
+    def assign(forced, trail):
+        # forced yığınındaki (hücre, değer) atamalarını yapar ve kısıt sayaçlarını O(derece) günceller.
+        # Sayaçlara göre sağlanamayacak bir kısıt oluşursa False döner; kalan mayın sıfır veya atanmamış
+        # hücre sayısına eşit olan kısıtların diğer hücreleri zorunlu atama olarak yığına eklenir.
+        ok = True
+        while forced:
+            v, choice = forced.pop()
+            if value[v] >= 0:
+                continue  # Daha önce atanmış; farklı değer istenmişse sayaçlar çelişkiyi zaten yakalar
+            value[v] = choice
+            trail.append(v)
+            for ci in var_constraints[v]:
+                before = need[ci]
+                left = before - choice
+                free = unassigned[ci] - 1
+                need[ci] = left
+                unassigned[ci] = free
+                if left < 0 or left > free:
+                    ok = False
+                elif free and (left == 0 or left == free) and before and before <= free:
+                    # Kısıt bu atamayla zorunlu hale geldi (önceden zaten zorunluysa hücreleri yığında bekliyor).
+                    fill = 1 if left else 0
+                    for other in constraints[ci][0]:
+                        if value[other] < 0:
+                            forced.append((other, fill))
+            if not ok:
+                return False
+        return True
+
+    def undo(trail):
+        # Atamalar geri alınır ve kısıt sayaçları eski haline getirilir.
+        for v in trail:
+            undone = value[v]
+            value[v] = -1
+            for ci in var_constraints[v]:
+                unassigned[ci] += 1
+                need[ci] += undone
+
+    def search():
+        # Derinlik öncelikli arama özyinelemesiz, açık bir yığınla yapılır (derinlik bileşen boyutuyla sınırsız
+        # büyüyebilir). Yığındaki işler: (_VISIT, konum, mayın) düğüme gir, (_TRY, konum, mayın, değer) hücreye
+        # değer ver ve alt düğüme in, (_UNDO, atamalar) dalın atamalarını geri al. Mayın önce denenir.
+        stack = [(_VISIT, 0, 0)]
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            task = pop()
+            kind = task[0]
+            if kind == _UNDO:
+                undo(task[1])
+                continue
+            if kind == _TRY:
+                _, pos, mines, choice = task
+                trail = []
+                if assign([(pos, choice)], trail):
+                    push((_UNDO, trail))
+                    push((_VISIT, pos + 1, mines + choice))
+                else:
+                    tally[1] += 1
+                    undo(trail)
+                continue
+            _, pos, mines = task
+            tally[0] += 1
+            if budget is not None and not tally[0] & 255:
+                budget.charge(256)
+            while pos < n and value[pos] >= 0:
+                mines += value[pos]
+                pos += 1
+            if pos == n:
+                # Geçerli bir atama bulundu: mayın sayısına göre sayaçlar güncellenir.
+                solutions[mines] = solutions.get(mines, 0) + 1
+                counts = mine_counts.get(mines)
+                if counts is None:
+                    counts = mine_counts[mines] = [0] * n
+                for v in compress(cells_range, value):
+                    counts[v] += 1
+                continue
+            push((_TRY, pos, mines, 0))
+            push((_TRY, pos, mines, 1))
+
+    # Arama başlamadan önce tek başına zorunlu olan hücreler (kalan mayını 0 veya dolu kısıtlar) atanır.
+    forced = []
+    for ci, (variables, _) in enumerate(constraints):
+        if need[ci] < 0 or need[ci] > unassigned[ci]:
+            return component  # Çelişkili kısıt: geçerli atama yoktur
+        if need[ci] == 0 or need[ci] == unassigned[ci]:
+            forced.extend((v, 1 if need[ci] else 0) for v in variables)
+    if assign(forced, []):
+        search()
+    component.nodes, component.prunes = tally
+    if budget is not None:
+        budget.charge(tally[0] & 255)
+    return component
+
+
+# Tahtanın sekiz simetrisi (dönme ve yansıma): (eksenler yer değiştirir mi, satır yönü, sütun yönü).
+_SYMMETRIES = tuple((swap, row_sign, col_sign) for swap in (False, True) for row_sign in (1, -1) for col_sign in (1, -1))
+
+
+def canonical_pattern(component, width):
+    """
+    Bileşenin kısıt yapısını öteleme, dönme ve yansımadan bağımsız bir anahtara çevirir.
+    Her simetri için hücreler dönüştürülmüş koordinatlarına göre sıralanıp numaralandırılır ve kısıtlar bu
+    numaralarla yazılır. Önce sadece hücrelerin şekli karşılaştırılır; kısıtlar yalnızca en küçük şekli veren
+    simetriler için yazılır ve en küçüğü anahtar olur. (anahtar, hücre -> kanonik numara listesi) döndürür.
+    """
+    coords = [divmod(idx, width) for idx in component.cells]
+    top = min(r for r, _ in coords)
+    left = min(c for _, c in coords)
+    coords = [(r - top, c - left) for r, c in coords]
+    span = max(max(r for r, _ in coords), max(c for _, c in coords)) + 1
+    # Her simetri için hücre koordinatları tek bir tam sayıya kodlanır; sıralı liste şekli temsil eder.
+    candidates = []
+    best_shape = None
+    for swap, row_sign, col_sign in _SYMMETRIES:
+        row_off = 0 if row_sign > 0 else span - 1
+        col_off = 0 if col_sign > 0 else span - 1
+        if swap:
+            keys = [(col_off + col_sign * c) * span + row_off + row_sign * r for r, c in coords]
+        else:
+            keys = [(row_off + row_sign * r) * span + col_off + col_sign * c for r, c in coords]
+        shape = sorted(keys)
+        low = shape[0]
+        shape = [key - low for key in shape]  # Öteleme farkı giderilir
+        if best_shape is None or shape < best_shape:
+            best_shape = shape
+            candidates = [keys]
+        elif shape == best_shape:
+            candidates.append(keys)
+
+    variables_range = range(len(coords))
+    best = None
+    for keys in candidates:
+        rank = [0] * len(keys)
+        for position, v in enumerate(sorted(variables_range, key=keys.__getitem__)):
+            rank[v] = position
+        # Aynı hücreleri ve aynı kalan mayını içeren tekrar kısıtlar sonucu değiştirmez, bir kez yazılır.
+        key = tuple(sorted({(tuple(sorted([rank[v] for v in variables])), remaining)
+                            for variables, remaining in component.constraints}))
+        if best is None or key < best[0]:
+            best = (key, rank)
+    return best
+
+
+class PatternCache:
+    """
+    Çözülmüş sınır bileşenlerini kanonik kısıt yapılarına göre saklayan, boyutu sınırlı (LRU) önbellek.
+    Aynı yerel desen (1-2-1, 1-2-2-1 gibi) tahtanın başka bir yerinde, döndürülmüş veya yansıtılmış olarak
+    ya da başka bir oyunda tekrar ettiğinde arama yapılmadan sonuç doğrudan alınır.
+    Sonuçlar kanonik hücre sırasıyla tutulur ve her kullanımda bileşenin kendi hücre sırasına çevrilir.
+    """
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()  # Anahtar -> (solutions, mine_counts) kanonik sırada
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = 0
+
+    def solve(self, component, width, budget=None):
+        # Bileşeni önbellekten veya solve_component ile çözer; çözülmüş bileşeni döndürür.
+        # Bütçe dolarak kesilen aramanın eksik sonucu önbelleğe yazılmaz.
+        key, rank = canonical_pattern(component, width)
+        entries = self.entries
+        entry = entries.get(key)
+        if entry is None:
+            self.misses += 1
+            solve_component(component, budget)
+            mine_counts = {}
+            for k, counts in component.mine_counts.items():
+                canonical = [0] * len(counts)
+                for v, count in enumerate(counts):
+                    canonical[rank[v]] = count
+                mine_counts[k] = canonical
+            entries[key] = (dict(component.solutions), mine_counts)
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)  # En uzun süredir kullanılmayan desen atılır
+            return component
+
+        self.hits += 1
+        entries.move_to_end(key)
+        solutions, mine_counts = entry
+        component.solutions = dict(solutions)
+        component.mine_counts = {k: [counts[r] for r in rank] for k, counts in mine_counts.items()}
+        return component
+
+    def save(self, path):
+        # Önbelleği (en eski kullanılandan en yeniye) JSON olarak diske yazar.
+        entries = [[[[list(variables), remaining] for variables, remaining in key],
+                    [[k, count, mine_counts[k]] for k, count in solutions.items()]]
+                   for key, (solutions, mine_counts) in self.entries.items()]
+        with open(path, "w") as stream:
+            json.dump({"version": 1, "entries": entries}, stream)
+
+    def load(self, path):
+        # save ile yazılmış desenleri önbelleğe ekler (ön ısıtma); sayaçlar değişmez.
+        with open(path) as stream:
+            data = json.load(stream)
+        if data.get("version") != 1:
+            raise ValueError(f"desteklenmeyen desen önbelleği sürümü: {data.get('version')}")
+        for key, values in data["entries"]:
+            key = tuple((tuple(variables), remaining) for variables, remaining in key)
+            self.entries[key] = ({k: count for k, count, _ in values}, {k: counts for k, _, counts in values})
+            self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+
+# Çözücülerin varsayılan olarak paylaştığı önbellek; aynı süreçteki oyunlar arasında korunur.
+PATTERN_CACHE = PatternCache()
+
+
+def mine_probabilities(components, remaining_mines, interior, budget=None, density=None):
+    """
+    Çözülmüş bileşenleri toplam mayın sayısıyla birleştirerek kesin mayın olasılıklarını hesaplar.
+    Sınırda toplam t mayın bulunan her çözüm, kalan mayınların kısıtsız iç bölgeye yerleşme sayısı
+    C(interior, remaining_mines - t) ile ağırlıklandırılır. Ağırlıklar büyük tahtalarda taşmaması için
+    lgamma ile log düzleminde hesaplanır; bileşen dağılımları kendi toplamlarına bölünerek normalize edilir.
+    Her bileşen için hücre olasılıkları listesi ile iç bölgedeki bir hücrenin olasılığını döndürür;
+    toplamda geçerli bir yerleşim yoksa None döndürür. budget (SearchBudget) verilirse her bileşende denetlenir.
+    Toplam mayın sayısı bilinmiyorsa (remaining_mines None, ör. SparseBoard) her hücre bağımsız olarak density
+    olasılıkla mayın sayılır: bileşenin k mayınlı çözümleri (density / (1 - density))^k ile ağırlıklandırılır,
+    bileşenler birbirinden bağımsızdır ve iç bölgedeki olasılık density'dir.
+    """
+    if remaining_mines is None:
+        return _density_probabilities(components, density, budget)
+    if remaining_mines < 0:
+        return None
+    # Sınırdaki mayın sayısı ne kalan mayını ne de sınır hücrelerinin sayısını aşabilir
+    # (çok büyük tahtalarda kalan mayın sayısı milyarları bulabilir).
+    limit = min(remaining_mines, sum(len(component.cells) for component in components))
+
+    # w[t]: sınırda t mayın varken iç bölgeye kalan mayınların yerleşim sayısı (normalize)
+    logs = []
+    for t in range(limit + 1):
+        rest = remaining_mines - t
+        if rest > interior:
+            logs.append(None)
+        else:
+            logs.append(math.lgamma(interior + 1) - math.lgamma(rest + 1) - math.lgamma(interior - rest + 1))
+    top = max((value for value in logs if value is not None), default=None)
+    if top is None:
+        return None
+    weight = [0.0 if value is None else math.exp(value - top) for value in logs]
+
+    dists = []
+    for component in components:
+        total = component.total_solutions()
+        if not total:
+            return None  # Çelişkili bileşen
+        dist = [0.0] * (max(component.solutions) + 1)
+        for k, count in component.solutions.items():
+            dist[k] = count / total
+        dists.append(dist)
+
+    def convolve(left, right):
+        out = [0.0] * min(len(left) + len(right) - 1, limit + 1)
+        for i, a in enumerate(left):
+            if a:
+                for j, b in enumerate(right[:len(out) - i]):
+                    out[i + j] += a * b
+        return out
+
+    # prefix[i]: ilk i bileşenin birleşik dağılımı
+    prefix = [[1.0]]
+    for dist in dists:
+        if budget is not None:
+            budget.check()
+        prefix.append(convolve(prefix[-1], dist))
+    # after[i][t]: i'den sonraki bileşenler ve iç bölge, önceki bileşenlerde toplam t mayın varken kalan ağırlık
+    after = [None] * len(dists)
+    tail = weight
+    for i in range(len(dists) - 1, -1, -1):
+        if budget is not None:
+            budget.check()
+        after[i] = tail
+        dist = dists[i]
+        tail = [sum(p * tail[t + k] for k, p in enumerate(dist[:limit + 1 - t]) if p)
+                for t in range(limit + 1)]
+    norm = sum(p * w for p, w in zip(prefix[-1], weight))
+    if not norm:
+        return None
+
+    probabilities = []
+    for i, component in enumerate(components):
+        if budget is not None:
+            budget.check()
+        # g[k]: bileşende k mayın varken diğer bileşenler ve iç bölgenin toplam ağırlığı
+        before = prefix[i]
+        tail = after[i]
+        total = component.total_solutions()
+        cells = [0.0] * len(component.cells)
+        for k, counts in component.mine_counts.items():
+            g = sum(p * tail[s + k] for s, p in enumerate(before[:limit + 1 - k]) if p)
+            if g:
+                scale = g / total / norm
+                for v, count in enumerate(counts):
+                    if count:
+                        cells[v] += count * scale
+        probabilities.append(cells)
+
+    interior_probability = 0.0
+    if interior:
+        interior_probability = sum(p * weight[t] * (remaining_mines - t) for t, p in enumerate(prefix[-1])) / interior / norm
+    return probabilities, interior_probability
+
+
+def _density_probabilities(components, density, budget=None):
+    # mine_probabilities'in toplam mayın sayısı bilinmeyen hali; ağırlıklar log düzleminde hesaplanır.
+    log_ratio = math.log(density / (1 - density)) if 0 < density < 1 else None
+    probabilities = []
+    for component in components:
+        if budget is not None:
+            budget.check()
+        if log_ratio is None:
+            # density 0 ise sadece mayınsız, 1 ise sadece tamamen mayınlı çözümler mümkündür.
+            full = 0 if density <= 0 else len(component.cells)
+            weight = {full: 1.0} if full in component.solutions else {}
+        else:
+            top = max(k * log_ratio for k in component.solutions)
+            weight = {k: math.exp(k * log_ratio - top) for k in component.solutions}
+        norm = sum(weight[k] * count for k, count in component.solutions.items() if k in weight)
+        if not norm:
+            return None  # Çelişkili bileşen
+        cells = [0.0] * len(component.cells)
+        for k, counts in component.mine_counts.items():
+            scale = weight.get(k, 0.0) / norm
+            if scale:
+                for v, count in enumerate(counts):
+                    if count:
+                        cells[v] += count * scale
+        probabilities.append(cells)
+    return probabilities, density
+
+
+# --------------------------
+# Monte Carlo Olasılık Tahmini
+# Tam sayımın pahalı olduğu büyük bileşenlerde çözümler sayılmaz, örneklenir. Her örnek, hücrelere sırayla
+# değer veren rastgele bir tamamlamadır; her adımda sadece hücrenin kısıtlarını bozmayan değerler seçilebilir
+# (ileri denetim). Seçim olasılıklarının tersi örneğin ağırlığıdır, böylece ağırlıklı ortalamalar bileşenin
+# çözüm sayılarını ve hücre sayaçlarını yansız tahmin eder (sıralı önem örneklemesi). Tahminler, tam
+# çözülmüş bileşenlerle aynı biçimde (solutions, mine_counts) tutulduğu için toplam mayın sayısıyla
+# birleştirme mine_probabilities ile aynen yapılır.
+# --------------------------
+
+class MonteCarloEstimator:
+    """
+    Bileşenin çözüm dağılımını NumPy ile toplu örnekleyerek tahmin eder. Çözücüler (bkz.
+    SolverBase._solve_components) threshold'dan büyük bileşenlerde önce en fazla exact_nodes düğümlük tam
+    arama dener, sığmazsa örneklemeye geçer. Örnekler batch'er batch'er ve bütün batch aynı anda üretilir
+    (her hücre için bir dizi işlemi); en fazla samples örnek çekilir. Her batch bağımsız bir tekrar sayılır;
+    en az üç batch'ten sonra hücre olasılıklarının batch'ler arası standart hatası tolerance'ın altına
+    inerse örnekleme erken biter. Son tahminin tanıları (örnek, batch, ortalama etkin örnek, elenen örnek,
+    yeniden örnekleme, en büyük standart hata) last sözlüğündedir.
+    exact_nodes ölçüme göre seçilmiştir: 400 expert oyununda en pahalı bileşenin tam çözümü 38 bin düğüm
+    (saniyede ~165 bin düğümle ~0,2 sn) sürdü. Sınır bunun yaklaşık 2,5 katı (~0,6 sn) olduğundan olağan
+    oyunlarda hiçbir bileşen örneklenmez ve hamleler örnekleyicisiz çözücüyle aynıdır.
+    """
+    def __init__(self, samples=4096, batch=1024, tolerance=0.02, threshold=32, exact_nodes=100000, seed=0):
+        if np is None:
+            raise RuntimeError("MonteCarloEstimator için NumPy gerekli")
+        self.samples = samples
+        self.batch = batch
+        self.tolerance = tolerance
+        self.threshold = threshold
+        self.exact_nodes = exact_nodes
+        self.rng = np.random.default_rng(seed)
+        self.last = {}
+
+    def _draw(self, n, constraints, var_constraints, size):
+        """
+        size adet rastgele tamamlamayı birlikte üretir; (atamalar, log ağırlıklar, geçerli mi, elenen,
+        yeniden örnekleme sayısı) döndürür.
+        Her seçimden sonra kalan mayını 0 veya atanmamış hücre sayısına eşit olan kısıtların diğer hücreleri tüm
+        örneklerde birlikte atanır (yayılım). Mayın seçme olasılığı hücrenin kısıtlarındaki kalan mayın /
+        atanmamış hücre oranlarının ortalamasıdır. Çelişkiye düşen örnekler elenir; etkin örnek sayısı yarının
+        altına inince yaşayan örnekler ağırlıklarıyla orantılı olarak yeniden çekilir ve hepsi ortalama ağırlığı
+        alır (sıralı Monte Carlo). Böylece yüzlerce hücreli bileşenlerde de örnekler sona ulaşır.
+        Sayaçlar kısıt başına bir satır (kısıt x örnek) tutulur; güncellemeler maskeyle tüm satır boyunca yapılır.
+        """
+        need = np.repeat(np.array([[remaining] for _, remaining in constraints], dtype=np.int32), size, axis=1)
+        free = np.repeat(np.array([[len(variables)] for variables, _ in constraints], dtype=np.int32), size, axis=1)
+        members = [variables for variables, _ in constraints]
+        assigned = np.zeros((n, size), dtype=bool)
+        values = np.zeros((n, size), dtype=bool)
+        log_weight = np.zeros(size)
+        alive = ((need >= 0) & (need <= free)).all(axis=0)
+        tally = [0, 0]  # Elenen örnek ve yeniden örnekleme sayıları
+
+        def assign(v, mask, mine):
+            # mask örneklerinde v hücresine mine değerlerini verir; kısıtı bozulan örnekler elenir.
+            assigned[v] |= mask
+            values[v] |= mine
+            cs = var_constraints[v]
+            need[cs] -= mine
+            free[cs] -= mask
+            left = need[cs]
+            alive[((left < 0) | (left > free[cs])).any(axis=0)] = False
+
+        def propagate(pending):
+            queued = set(pending)
+            while pending:
+                ci = pending.pop()
+                queued.discard(ci)
+                room = free[ci]
+                left = need[ci]
+                fill = alive & (room > 0) & ((left == 0) | (left == room))
+                if not fill.any():
+                    continue
+                mine = fill & (left > 0)
+                for u in members[ci]:
+                    mask = fill & ~assigned[u]
+                    if not mask.any():
+                        continue
+                    assign(u, mask, mine & mask)
+                    for cj in var_constraints[u].tolist():
+                        if cj not in queued:
+                            queued.add(cj)
+                            pending.append(cj)
+
+        def resample():
+            # Etkin örnek sayısı yarının altındaysa yaşayan örnekleri ağırlıklarıyla orantılı olarak çoğaltır.
+            living = int(alive.sum())
+            if not living:
+                return False
+            top = log_weight[alive].max()
+            weight = np.where(alive, np.exp(log_weight - top), 0.0)
+            total = weight.sum()
+            if total * total >= (weight * weight).sum() * size / 2:
+                return True
+            tally[0] += size - living
+            tally[1] += 1
+            chosen = self.rng.choice(size, size, p=weight / total)
+            need[:] = need[:, chosen]
+            free[:] = free[:, chosen]
+            assigned[:] = assigned[:, chosen]
+            values[:] = values[:, chosen]
+            log_weight[:] = top + math.log(total / size)
+            alive[:] = True
+            return True
+
+        propagate(list(range(len(constraints))))
+        for v in range(n):
+            if not resample():
+                break
+            mask = alive & ~assigned[v]
+            if not mask.any():
+                continue
+            cs = var_constraints[v]
+            q = np.clip((need[cs] / np.maximum(free[cs], 1)).mean(axis=0), 0.05, 0.95)
+            mine = (self.rng.random(size) < q) & mask
+            log_weight -= np.where(mask, np.log(np.where(mine, q, 1 - q)), 0.0)
+            assign(v, mask, mine)
+            propagate(cs.tolist())
+        tally[0] += size - int(alive.sum())
+        return values.T, log_weight, alive, tally[0], tally[1]
+
+    def estimate(self, component, budget=None):
+        """
+        Bileşenin solutions ve mine_counts alanlarını örneklerden tahmin eder ve bileşeni döndürür.
+        Tahminler tam sayı değildir ve sadece oranları anlamlıdır; geçerli örnek bulunamazsa alanlar boş kalır
+        (mine_probabilities bileşeni çelişkili sayar).
+        """
+        n = len(component.cells)
+        constraints = component.constraints
+        var_constraints = [[] for _ in range(n)]
+        for ci, (variables, _) in enumerate(constraints):
+            for v in variables:
+                var_constraints[v].append(ci)
+        var_constraints = [np.array(cs, dtype=np.intp) for cs in var_constraints]
 
-        # İlk hamle ise, tıklanan hücre hariç mayınları yerleştirir.
-        if self.first_move:
-            self.place_mines(row, col)
-            self.first_move = False
-            self.mines_placed = True
+        drawn = []
+        estimates = []  # Her batch'in hücre olasılıkları (standart hata için)
+        effective = []
+        error = None  # En az üç batch olmadan standart hata hesaplanmaz
+        count = dead = resamples = 0
+        while count < self.samples:
+            size = min(self.batch, self.samples - count)
+            if budget is not None:
+                budget.charge(size)
+            values, log_weight, alive, died, redrawn = self._draw(n, constraints, var_constraints, size)
+            count += size
+            dead += died
+            resamples += redrawn
+            if not alive.any():
+                continue
+            values = values[alive]
+            log_weight = log_weight[alive]
+            drawn.append((values, log_weight))
+            weight = np.exp(log_weight - log_weight.max())
+            total = weight.sum()
+            effective.append(total * total / (weight * weight).sum())
+            estimates.append(weight @ values / total)
+            if len(estimates) >= 3:
+                error = float((np.std(estimates, axis=0, ddof=1) / math.sqrt(len(estimates))).max())
+                if error <= self.tolerance:
+                    break
 
-        # Hücre açılır ve açılan hücre sayısı artırılır.
-        self.grid[row][col]['revealed'] = True
-        self.revealed_count += 1
+        component.solutions = {}
+        component.mine_counts = {}
+        component.nodes = count
+        component.prunes = dead
+        component.sampled = True
+        self.last = {"samples": count, "batches": len(estimates),
+                     "effective": float(np.mean(effective)) if effective else 0.0,
+                     "dead_ends": dead, "resamples": resamples, "max_stderr": error}
+        if not drawn:
+            return component
+        values = np.concatenate([part[0] for part in drawn])
+        log_weight = np.concatenate([part[1] for part in drawn])
+        weight = np.exp(log_weight - log_weight.max())
+        weight /= weight.sum()
+        mines = values.sum(axis=1)
+        for k in np.unique(mines).tolist():
+            chosen = mines == k
+            component.solutions[k] = float(weight[chosen].sum())
+            component.mine_counts[k] = (weight[chosen] @ values[chosen]).tolist()
+        return component
 
-        # Eğer açılan hücrede mayın varsa, oyunu bitirir.
-        if self.grid[row][col]['is_mine']:
-            self.game_over = True
-            return True
 
-        # Eğer açılan hücrede komşu mayın yoksa, çevresindeki tüm hücreleri açmaya çalışır.
-        if self.grid[row][col]['adjacent_mines'] == 0:
-            for x in range(max(0, row - 1), min(self.height, row + 2)):
-                for y in range(max(0, col - 1), min(self.width, col + 2)):
-                    if not self.grid[x][y]['revealed']:
-                        self.reveal(x, y)
+# --------------------------
+# Sınır Çözücü Arka Uçları
+# Çok büyük bileşenlerde tüm çözümleri saymak yerine, her hücre için "bu hücre kesin güvenli/mayın mı?"
+# sorusu bir SAT çözücüye varsayımlarla (assumption) sorulur. Yerleşik arka uç, kardinalite kısıtlarını
+# doğrudan yayan ve çelişkilerden cümle öğrenen küçük bir CDCL çözücüdür; python-sat kuruluysa o kullanılır.
+# --------------------------
 
-        # Eğer açılan hücre sayısı kazanma durumunu sağlarsa oyunu bitirir.
-        if self.revealed_count == self.width * self.height - self.num_mines:
-            self.game_over = True
-        return False
+class CardinalitySAT:
+    """
+    "Bu hücrelerde tam olarak k mayın var" biçimindeki kısıtlar için artımlı CDCL çözücü.
+    Kısıt sayaçları (kalan mayın, atanmamış hücre) her atamada O(derece) güncellenir; kalan mayın sıfır veya
+    atanmamış hücre sayısına eşit olduğunda diğer hücreler yayılır. Çelişkide ilk tekil belirleyici noktaya
+    (1-UIP) kadar çözümleme yapılır, öğrenilen cümle eklenir ve geri sıçranır. Öğrenilen cümleler sadece
+    kısıtlardan türediği için farklı varsayımlarla yapılan sonraki sorgularda da geçerlidir.
+    """
+    def __init__(self, n, constraints):
+        self.n = n
+        self.constraints = constraints
+        self.var_constraints = [[] for _ in range(n)]
+        for ci, (variables, _) in enumerate(constraints):
+            for v in variables:
+                self.var_constraints[v].append(ci)
+        self.need = [remaining for _, remaining in constraints]
+        self.free = [len(variables) for variables, _ in constraints]
+        self.value = [-1] * n
+        self.level = [0] * n
+        self.reason = [None] * n  # None: karar veya varsayım; ('c', kısıt) ya da ('l', öğrenilen cümle)
+        self.position = [0] * n  # Atamanın iz (trail) içindeki sırası
+        self.trail = []
+        self.limits = []  # Her karar seviyesinin başladığı iz uzunluğu
+        self.clauses = []  # Öğrenilen cümleler: (hücre, değer) listesi, en az biri doğru olmalı
+        self.var_clauses = [[] for _ in range(n)]
+        self.head = 0  # Yayılımı yapılmamış ilk iz konumu
+        self.unsat = False
+        self.budget = None  # Verilirse (SearchBudget) her 256 kararda bir denetlenir
+        self.decisions = 0
+        for ci, (variables, remaining) in enumerate(constraints):
+            if remaining < 0 or remaining > len(variables):
+                self.unsat = True
+            elif remaining == 0 or remaining == len(variables):
+                fill = 1 if remaining else 0
+                for v in variables:
+                    if self.value[v] < 0:
+                        self._assign(v, fill, ('c', ci))
 
-    def get_adjacent_cells(self, row, col):
-        # Belirtilen hücrenin çevresindeki henüz açılmamış hücreleri döndürür.
-        cells = []
-        for i in range(max(0, row - 1), min(self.height, row + 2)):
-            for j in range(max(0, col - 1), min(self.width, col + 2)):
-                if (i, j) != (row, col) and not self.grid[i][j]['revealed']:
-                    cells.append((i, j))
-        return cells
+    def _assign(self, v, choice, reason):
+        self.value[v] = choice
+        self.level[v] = len(self.limits)
+        self.reason[v] = reason
+        self.position[v] = len(self.trail)
+        self.trail.append(v)
+        need = self.need
+        free = self.free
+        for ci in self.var_constraints[v]:
+            need[ci] -= choice
+            free[ci] -= 1
 
-    def save_state(self):
-        # Oyun tahtasının mevcut durumunu (grid, açılan hücre sayısı, oyun durumu vs.) kaydeder.
-        return {
-            'grid': [[cell.copy() for cell in row] for row in self.grid],
-            'revealed_count': self.revealed_count,
-            'game_over': self.game_over,
-            'first_move': self.first_move,
-            'mines_placed': self.mines_placed
-        }
+    def _backtrack(self, level):
+        # Verilen karar seviyesinden sonraki tüm atamaları geri alır.
+        if len(self.limits) <= level:
+            return
+        start = self.limits[level]
+        del self.limits[level:]
+        value = self.value
+        need = self.need
+        free = self.free
+        for v in self.trail[start:]:
+            choice = value[v]
+            value[v] = -1
+            self.reason[v] = None
+            for ci in self.var_constraints[v]:
+                need[ci] += choice
+                free[ci] += 1
+        del self.trail[start:]
+        self.head = min(self.head, start)
 
-    def load_state(self, state):
-        # Daha önce kaydedilmiş olan durumu geri yükler.
-        self.grid = [[cell.copy() for cell in row] for row in state['grid']]
-        self.revealed_count = state['revealed_count']
-        self.game_over = state['game_over']
-        self.first_move = state['first_move']
-        self.mines_placed = state['mines_placed']
+    def _propagate(self):
+        # İzdeki yeni atamaları kısıtlara ve öğrenilen cümlelere yayar; çelişki varsa nedenini döndürür.
+        value = self.value
+        need = self.need
+        free = self.free
+        constraints = self.constraints
+        while self.head < len(self.trail):
+            v = self.trail[self.head]
+            self.head += 1
+            for ci in self.var_constraints[v]:
+                if need[ci] < 0 or need[ci] > free[ci]:
+                    return ('c', ci)
+                if free[ci] and (need[ci] == 0 or need[ci] == free[ci]):
+                    fill = 1 if need[ci] else 0
+                    for u in constraints[ci][0]:
+                        if value[u] < 0:
+                            self._assign(u, fill, ('c', ci))
+            for li in self.var_clauses[v]:
+                open_literal = None
+                satisfied = False
+                for u, wanted in self.clauses[li]:
+                    if value[u] == wanted:
+                        satisfied = True
+                        break
+                    if value[u] < 0:
+                        if open_literal is not None:
+                            satisfied = True  # İki açık literal: henüz bir şey çıkmaz
+                            break
+                        open_literal = (u, wanted)
+                if satisfied:
+                    continue
+                if open_literal is None:
+                    return ('l', li)
+                self._assign(open_literal[0], open_literal[1], ('l', li))
+        return None
 
-# SolverBase: Ortak Çözücü Sınıfı
-# Tüm çözücü algoritmaların ortak özelliklerini ve temel yöntemlerini barındırır.
+    def _explain(self, reason, v=None):
+        # Nedenin (kısıt veya cümle) v atamasını ya da çelişkiyi doğuran atanmış hücrelerini döndürür.
+        kind, index = reason
+        value = self.value
+        if kind == 'l':
+            return [u for u, _ in self.clauses[index] if u != v]
+        variables, _ = self.constraints[index]
+        if v is None:
+            # Çelişki: fazla mayın varsa mayın atananlar, mayına yer kalmadıysa güvenli atananlar sorumludur.
+            culprit = 1 if self.need[index] < 0 else 0
+            return [u for u in variables if value[u] == culprit]
+        # v, kısıtın zorunlu hale gelmesiyle atandı: güvenli ise önceki mayınlar, mayın ise önceki güvenliler.
+        culprit = 1 - value[v]
+        limit = self.position[v]
+        return [u for u in variables if value[u] == culprit and self.position[u] < limit]
 
-class SolverBase:
-    def __init__(self, board):
-        self.board = board  # Oyun tahtasına referans
-        self.bad_moves = set()  # Güvenli olmayan hamlelerin kaydı
-        self.flagged_mines = set()  # İşaretlenmiş mayınların takibi
-        self.visited = set()  # Ziyaret edilen hücrelerin takibi (bazı algoritmalarda kullanılır)
+    def _analyze(self, conflict):
+        # 1-UIP çözümlemesi: (öğrenilen cümle, geri sıçrama seviyesi) döndürür.
+        current = len(self.limits)
+        level = self.level
+        seen = set()
+        others = []
+        pending = 0
+        index = len(self.trail) - 1
+        culprits = self._explain(conflict)
+        while True:
+            for u in culprits:
+                if u not in seen and level[u] > 0:
+                    seen.add(u)
+                    if level[u] == current:
+                        pending += 1
+                    else:
+                        others.append(u)
+            while self.trail[index] not in seen:
+                index -= 1
+            uip = self.trail[index]
+            index -= 1
+            pending -= 1
+            if not pending:
+                break
+            culprits = self._explain(self.reason[uip], uip)
+        value = self.value
+        clause = [(uip, 1 - value[uip])] + [(u, 1 - value[u]) for u in others]
+        return clause, max((level[u] for u in others), default=0)
 
-    def find_safe_moves(self):
+    def _learn(self, clause):
+        # Geri sıçramadan sonra cümleyi ekler ve ilk literalini (UIP'nin tersi) zorunlu olarak atar.
+        li = len(self.clauses)
+        self.clauses.append(clause)
+        for u, _ in clause:
+            self.var_clauses[u].append(li)
+        self._assign(clause[0][0], clause[0][1], ('l', li))
+
+    def solve(self, assumptions=()):
         """
-        Basit mantıksal kurallar kullanarak güvenli hamleleri ve mayın olabilecek hücreleri belirler.
-        Her açılmış hücrenin komşularını kontrol ederek iki kural uygular:
-         - Kural 1: Kalan sayı gizli hücre sayısına eşitse, tüm gizli hücreler mayındır.
-         - Kural 2: Kalan sayı 0 ise, tüm gizli hücreler güvenlidir.
+        Varsayımlar ((hücre, değer) listesi) altında tüm kısıtları sağlayan bir atama arar.
+        Bulursa hücre değerleri listesini, bulamazsa None döndürür.
         """
-        safe = []
-        mines = []
-
-        # Tüm açılmış hücreler üzerinden geçerek komşu hücreleri inceler.
-        for i in range(self.board.height):
-            for j in range(self.board.width):
-                if self.board.grid[i][j]['revealed'] and self.board.grid[i][j]['adjacent_mines'] > 0:
-                    adj = self.board.get_adjacent_cells(i, j)
-                    # Açılmamış ve bayraklanmamış hücreler bulunur.
-                    hidden = [c for c in adj if not self.board.grid[c[0]][c[1]]['revealed']
-                              and not self.board.grid[c[0]][c[1]]['flagged']]
-                    # Bayraklanmış hücrelerin sayısı hesaplanır.
-                    flags = sum(1 for c in adj if self.board.grid[c[0]][c[1]]['flagged'])
-                    remaining = self.board.grid[i][j]['adjacent_mines'] - flags
-
-                    # Eğer kalan sayı gizli hücre sayısına eşitse, bu hücreler mayın olarak işaretlenmelidir.
-                    if remaining == len(hidden) and hidden:
-                        for cell in hidden:
-                            if cell not in mines:
-                                mines.append(cell)
-
-                    # Eğer kalan sayı 0 ise, komşudaki tüm gizli hücreler güvenlidir.
-                    elif remaining == 0 and hidden:
-                        for cell in hidden:
-                            if cell not in safe:
-                                safe.append(cell)
-
-        # Sonuçları küme yapısına çevirip tekrar listeye çevirir (tekrarlananları önlemek için)
-        return list(set(safe)), list(set(mines))
+        if self.unsat:
+            return None
+        self._backtrack(0)
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                if not self.limits:
+                    self.unsat = True  # Varsayımsız çelişki: kısıtlar birlikte sağlanamaz
+                    return None
+                clause, back_level = self._analyze(conflict)
+                self._backtrack(back_level)
+                self._learn(clause)
+                continue
+            level = len(self.limits)
+            if level < len(assumptions):
+                v, choice = assumptions[level]
+                if self.value[v] >= 0 and self.value[v] != choice:
+                    return None  # Varsayım kısıtlarla çelişiyor
+                self.limits.append(len(self.trail))
+                if self.value[v] < 0:
+                    self._assign(v, choice, None)
+                continue
+            try:
+                v = self.value.index(-1)
+            except ValueError:
+                return list(self.value)
+            self.decisions += 1
+            if self.budget is not None and not self.decisions & 255:
+                self.budget.charge(256)
+            self.limits.append(len(self.trail))
+            self._assign(v, 0, None)  # Sınır hücrelerinin çoğu güvenli olduğundan önce güvenli denenir
 
-    def flag_mines(self, mines):
-        # Belirlenen mayın konumlarını bayraklar ve flag listesine ekler.
-        for x, y in mines:
-            if not self.board.grid[x][y]['flagged']:
-                self.board.grid[x][y]['flagged'] = True
-                self.flagged_mines.add((x, y))
+    def add_fact(self, v, choice):
+        # Kesinleşmiş bir hücre değerini kalıcı (seviye 0) cümle olarak ekler.
+        self._backtrack(0)
+        li = len(self.clauses)
+        self.clauses.append([(v, choice)])
+        self.var_clauses[v].append(li)
+        if self.value[v] < 0:
+            self._assign(v, choice, ('l', li))
 
-    def get_probability_move(self):
-        """
-        Olasılıksal olarak en iyi hamleyi seçer.
-        Açılmamış ve bayraklanmamış hücreler arasından, açılmış hücrelere en yakın olanı tercih eder.
-        """
-        unknown_cells = []
-        for i in range(self.board.height):
-            for j in range(self.board.width):
-                if (not self.board.grid[i][j]['revealed'] and
-                        not self.board.grid[i][j]['flagged'] and
-                        (i, j) not in self.bad_moves):
-                    # Hücrenin açılmış komşu sayısı hesaplanır
-                    adjacent_revealed = 0
-                    for ni, nj in self._get_neighbors(i, j):
-                        if self.board.grid[ni][nj]['revealed']:
-                            adjacent_revealed += 1
-
-                    unknown_cells.append((adjacent_revealed, i, j))
-
-        # En fazla açılmış komşusu olan hücreyi seçer
-        unknown_cells.sort(reverse=True)
-        return (unknown_cells[0][1], unknown_cells[0][2]) if unknown_cells else None
-
-    def _get_neighbors(self, row, col):
-        # Belirtilen hücrenin komşularını döndürür.
-        neighbors = []
-        for i in range(max(0, row - 1), min(self.board.height, row + 2)):
-            for j in range(max(0, col - 1), min(self.board.width, col + 2)):
-                if (i, j) != (row, col):
-                    neighbors.append((i, j))
-        return neighbors
 
+class FrontierBackend:
+    """
+    Sınır bileşeni arka uçlarının ortak arayüzü. Alt sınıflar _open ile bileşen için solve(varsayımlar) ve
+    add_fact(hücre, değer) yöntemleri olan bir oturum döndürür. forced_cells önce bir çözüm bulur, sonra her
+    hücre için ters değeri varsayarak sorar: çözüm yoksa hücre kesindir, varsa yeni çözümde değeri değişen
+    tüm hücreler de aday olmaktan çıkar. Böylece çözümler hiç sayılmaz.
+    budget (SearchBudget) verilirse her sorgudan önce denetlenir; yerleşik arka uç sorgu içinde de denetler.
+    """
+    name = None
+    queries = 0  # Toplam SAT sorgusu sayısı (istatistik için)
 
+    def _open(self, component, budget=None):
+        raise NotImplementedError
 
-# LogicalSolver Sınıfı
-# Basit mantıksal kuralları kullanarak hamle belirleyen çözücü.
-# 10x10'luk 10 mayınlı mayın tarlasında ortalama 10.596 saniyede çözümü buluyor.
-class LogicalSolver(SolverBase):
-    def get_next_move(self):
-        # Güvenli hamleleri ve mayın olabilecek hücreleri bulur.
-        safe, mines = self.find_safe_moves()
+    def forced_cells(self, component, budget=None):
+        # Tüm çözümlerde güvenli ve tüm çözümlerde mayın olan tahta indekslerini döndürür.
+        session = self._open(component, budget)
+        self.queries += 1
+        model = session.solve()
+        if model is None:
+            return [], []  # Çelişkili bileşen: kesin bir sonuç çıkarılamaz
+        n = len(component.cells)
+        undecided = [True] * n
+        forced = []
+        for v in range(n):
+            if not undecided[v]:
+                continue
+            if budget is not None:
+                budget.charge()
+            self.queries += 1
+            other = session.solve([(v, 1 - model[v])])
+            if other is None:
+                forced.append(v)
+                session.add_fact(v, model[v])
+            else:
+                for u in range(v, n):
+                    if other[u] != model[u]:
+                        undecided[u] = False
+        cells = component.cells
+        return [cells[v] for v in forced if not model[v]], [cells[v] for v in forced if model[v]]
 
-        # Bulunan mayın hücrelerini bayraklar.
-        self.flag_mines(mines)
 
-        # Eğer güvenli hamle varsa, ilkini döndürür.
-        if safe:
-            return safe[0]
+class DPLLBackend(FrontierBackend):
+    # Ek bağımlılık gerektirmeyen yerleşik arka uç (bkz. CardinalitySAT).
+    name = "dpll"
 
-        # Güvenli hamle bulunamazsa olasılıksal hamleyi döndürür.
-        return self.get_probability_move()
+    def _open(self, component, budget=None):
+        session = CardinalitySAT(len(component.cells), component.constraints)
+        session.budget = budget
+        return session
 
 
+class _PySatSession:
+    # python-sat çözücüsünü FrontierBackend oturum arayüzüne uyarlar; hücre v, SAT değişkeni v + 1'dir.
+    def __init__(self, solver, n):
+        self.solver = solver
+        self.n = n
 
-# DFSSolver Sınıfı
-# Derinlemesine arama (DFS) mantığı ile hamle seçen çözücü.
-# 10x10'luk 10 mayınlı mayın tarlasında ortalama 11.324 saniyede çözümü buluyor.
-class DFSSolver(SolverBase):
-    def __init__(self, board):
-        super().__init__(board)
-        self.visited = set()  # DFS sırasında ziyaret edilen hücreleri takip eder
+    def solve(self, assumptions=()):
+        literals = [v + 1 if choice else -(v + 1) for v, choice in assumptions]
+        if not self.solver.solve(assumptions=literals):
+            return None
+        model = self.solver.get_model()
+        return [1 if model[v] > 0 else 0 for v in range(self.n)]
 
-    def get_next_move(self):
-        safe, mines = self.find_safe_moves()
+    def add_fact(self, v, choice):
+        self.solver.add_clause([v + 1 if choice else -(v + 1)])
 
-        # Bulunan mayınları işaretler.
-        self.flag_mines(mines)
 
-        # Güvenli hamle varsa ilkini döndürür.
-        if safe:
-            return safe[0]
+class PySatBackend(FrontierBackend):
+    # Kurulu python-sat kütüphanesini kullanan arka uç; kısıtlar sıralı sayaç kodlamasıyla cümlelere çevrilir.
+    name = "pysat"
 
-        # DFS mantığı: Henüz ziyaret edilmemiş ve bayraklanmamış hücreler arasından seçim yapar.
-        for i in range(self.board.height):
-            for j in range(self.board.width):
-                if (not self.board.grid[i][j]['revealed'] and
-                        not self.board.grid[i][j]['flagged'] and
-                        (i, j) not in self.visited and
-                        (i, j) not in self.bad_moves):
-                    self.visited.add((i, j))  # Hücreyi ziyaret edildi olarak işaretle
-                    return (i, j)  # İlk bulunan uygun hücreyi seç
+    def __init__(self, solver_name="cadical153"):
+        if SatSolver is None:
+            raise RuntimeError("python-sat kurulu değil (pip install python-sat)")
+        self.solver_name = solver_name
+        self._solver = None
 
-        # Hiçbir güvenli hamle bulunamazsa olasılıksal hamleyi döndürür.
-        return self.get_probability_move()
+    def _open(self, component, budget=None):
+        if self._solver is not None:
+            self._solver.delete()
+        n = len(component.cells)
+        pool = IDPool(start_from=n + 1)
+        solver = self._solver = SatSolver(name=self.solver_name)
+        for variables, remaining in component.constraints:
+            if remaining < 0 or remaining > len(variables):
+                solver.add_clause([1])
+                solver.add_clause([-1])  # Sağlanamayan kısıt: çelişkili bileşen
+                continue
+            encoded = CardEnc.equals(lits=[v + 1 for v in variables], bound=remaining, vpool=pool,
+                                     encoding=EncType.seqcounter)
+            solver.append_formula(encoded.clauses)
+        return _PySatSession(solver, n)
 
 
-# AStarSolver Sınıfı
-# A* algoritmasına benzer sezgisel bir yaklaşım kullanarak hamle seçen çözücü.
-# 10x10'luk 10 mayınlı mayın tarlasında ortalama 7.912 saniyede çözümü buluyor.
-class AStarSolver(SolverBase):
-    def get_next_move(self):
-        safe, mines = self.find_safe_moves()
+# Kullanılabilir arka uçlar; python-sat kuruluysa varsayılan odur.
+FRONTIER_BACKENDS = {"dpll": DPLLBackend}
+if SatSolver is not None:
+    FRONTIER_BACKENDS["pysat"] = PySatBackend
 
-        # Mayınları işaretler.
-        self.flag_mines(mines)
 
-        # Güvenli hamle varsa döndürür.
-        if safe:
-            return safe[0]
-
-        # A* mantığı: priority = revealed_neighbors - (total_adjacent_mines / (8 * revealed_neighbors)).
-        candidates = []
-        for i in range(self.board.height):
-            for j in range(self.board.width):
-                if (not self.board.grid[i][j]['revealed'] and
-                        not self.board.grid[i][j]['flagged'] and
-                        (i, j) not in self.bad_moves):
-
-                    revealed_neighbors = 0
-                    total_adjacent_mines = 0
-                    for ni, nj in self._get_neighbors(i, j):
-                        if self.board.grid[ni][nj]['revealed']:
-                            revealed_neighbors += 1
-                            total_adjacent_mines += self.board.grid[ni][nj]['adjacent_mines']
-
-                    # Sezgisel hesaplama: Açılmış komşu sayısı ve ortalama mayın sayısı üzerinden öncelik belirlenir.
-                    if revealed_neighbors > 0:
-                        priority = revealed_neighbors - (total_adjacent_mines / (8 * revealed_neighbors))
-                        # Negatif değer kullanılarak küçükten büyüğe sıralama sağlanır.
-                        candidates.append((-priority, i, j))
-
-        candidates.sort()  # Öncelik sırasına göre sıralar
-
-        if candidates:
-            return (candidates[0][1], candidates[0][2])
+def default_backend():
+    return PySatBackend() if SatSolver is not None else DPLLBackend()
 
-        # Güvenli hamle bulunamazsa olasılıksal hamleyi döndürür.
-        return self.get_probability_move()
 
 # BacktrackingSolver Sınıfı
 # Geriye izleme algoritması kullanarak hamle seçen çözücü.
 # 10x10'luk 10 mayınlı mayın tarlasında ortalama 8.88 saniyede çözümü buluyor.
 class BacktrackingSolver(SolverBase):
+    # Bu sayıdan fazla hücreli bileşenlerde çözümler sayılmaz; kesin hücreler SAT arka ucuna sorulur.
+    ENUMERATION_LIMIT = 32
+
+    def __init__(self, board, pattern_cache=None, backend=None):
+        super().__init__(board, pattern_cache)
+        self.backend = backend or default_backend()  # Büyük bileşenler için sınır çözücü arka ucu
+        self._forced = {}  # Bileşen imzası -> (güvenli, mayın) indeksleri (son çağrıdaki bileşenler)
+
     def get_next_move(self):
-        # Öncelikle basit mantıksal kurallarla güvenli hamle bulunur.
-        safe, mines = self.find_safe_moves()
+        # Önceki hamlelerde kanıtlanmış güvenli hücre varsa arama yapılmadan kuyruktan verilir.
+        move = self.next_safe_move()
+        if move is not None:
+            return move
+        moves = self.get_next_moves()
+        return moves[0] if moves else None
+
+    def get_next_moves(self):
+        self.exhausted = False
+        if self.budget is not None:
+            self.budget.start()
 
-        # Bulunan mayınları işaretler.
-        self.flag_mines(mines)
+        # Öncelikle basit mantıksal kurallarla güvenli hamle bulunur; bulunan mayınlar işaretlenir.
+        safe = self.queued_safe_moves()
 
-        # Eğer güvenli hamle bulunursa döndürülür.
+        # Eğer güvenli hamle bulunursa hepsi döndürülür.
         if safe:
-            return safe[0]
+            return safe
 
-        # Basit mantık yetersizse, geri izleme algoritması devreye girer.
-        safe_cells, mine_cells = self.deduce_mines_and_safe()
+        try:
+            # Basit mantık yetersizse önce polinom süreli doğrusal çıkarım denenir.
+            safe_cells, mine_cells = self.find_linear_moves()
+            self.flag_mines(mine_cells)
+            if safe_cells:
+                return self._queue_safe(safe_cells)
+
+            # Doğrusal çıkarım da yetersizse, geri izleme algoritması devreye girer.
+            safe_cells, mine_cells = self.deduce_mines_and_safe()
+        except BudgetExceeded:
+            # Bütçe bileşenlere ayırma veya doğrusal çıkarım sırasında doldu; kesin sonuç yoktur.
+            self._exhaust()
+            safe_cells = mine_cells = []
 
         # Tespit edilen mayınları işaretler.
         self.flag_mines(mine_cells)
 
-        # Güvenli hücrelerden birini döndürür.
+        # Güvenli hücrelerin tamamı döndürülür (sadece ilki açılırsa kalanlar kuyruktan verilir).
         if safe_cells:
-            return safe_cells[0]
+            return self._queue_safe(safe_cells)
 
-        # Hiçbir güvenli hamle bulunamazsa olasılıksal hamleyi döndürür.
-        return self.get_probability_move()
+        # Bütçe dolduysa çözülemeyen bileşenler olabilir; hamle hızlı olasılık tahminiyle seçilir.
+        if self.exhausted:
+            move = self.get_estimated_move()
+            return [move] if move else []
+
+        # Hiçbir güvenli hamle bulunamazsa olasılıksal hamle (tek hücre) döndürülür.
+        move = self.get_probability_move()
+        return [move] if move else []
 
+    @timed("deduce")
     def deduce_mines_and_safe(self):
         """
-        Geriye izleme algoritması ile sınır hücreleri üzerinde atama yaparak,
-        kesin olarak mayın veya güvenli olan hücreleri belirler.
+        Sınırı birbirinden bağımsız kısıt bileşenlerine ayırır ve her bileşeni geri izleme ile tam olarak çözer.
+        Tüm geçerli atamalarda mayın olan hücreler kesin mayın, hiçbirinde mayın olmayanlar kesin güvenlidir.
+        Daha önce görülmüş desenler (döndürülmüş veya yansıtılmış olsalar da) desen önbelleğinden alınır;
+        ENUMERATION_LIMIT'ten büyük bileşenler sayılmadan, varsayımlı SAT sorgularıyla çözülür.
+        Bütçe (self.budget) dolarsa o ana kadar çözülen bileşenlerin sonuçları döndürülür ve exhausted True olur;
+        bu durumda küçük bileşenler önce çözülür ki eldeki kesin hamleler olabildiğince çok olsun. Bütçe
+        bileşenlere ayırma sırasında dolarsa BudgetExceeded çağırana geçer.
         """
-        # Açılmış hücrelere komşu olan ancak henüz açılmamış hücreleri (frontier) belirler.
-        frontier = set()
-        for i in range(self.board.height):
-            for j in range(self.board.width):
-                if not self.board.grid[i][j]['revealed'] and not self.board.grid[i][j]['flagged']:
-                    neighbors = self._get_neighbors(i, j)
-                    for ni, nj in neighbors:
-                        if self.board.grid[ni][nj]['revealed']:
-                            frontier.add((i, j))
-                            break
+        previous = self._forced
+        current = {}
+        safe_cells = []
+        mine_cells = []
+        width = self.board.width
+        budget = self.budget
+        components = self._split_frontier()
+        if budget is not None:
+            components.sort(key=lambda component: len(component.cells))
+        try:
+            for component in components:
+                if budget is not None:
+                    budget.check()
+                key = component_signature(component)
+                forced = previous.get(key)
+                if forced is None:
+                    if len(component.cells) > self.ENUMERATION_LIMIT:
+                        queries = self.backend.queries
+                        with self.stats.phase("sat"):
+                            forced = self.backend.forced_cells(component, budget)
+                        self.stats.count("sat_queries", self.backend.queries - queries)
+                    else:
+                        forced = self._solve_components([component])[0].forced_cells()
+                current[key] = forced
+                safe_cells.extend(forced[0])
+                mine_cells.extend(forced[1])
+        except BudgetExceeded:
+            self._exhaust()
+        self._forced = current
+
+        return [divmod(idx, width) for idx in safe_cells], [divmod(idx, width) for idx in mine_cells]
 
-        # Frontier çok büyükse, performans için kısıtlamalar uygulanır.
-        MAX_FRONTIER_SIZE = 16
-        if len(frontier) > MAX_FRONTIER_SIZE:
-            # Frontier içerisinden en fazla açılmış komşusu olanları seç.
-            sorted_frontier = sorted(list(frontier),
-                                     key=lambda cell: sum(1 for ni, nj in self._get_neighbors(cell[0], cell[1])
-                                                          if self.board.grid[ni][nj]['revealed']))
-            frontier = set(sorted_frontier[:MAX_FRONTIER_SIZE])
-
-        frontier = list(frontier)
-        valid_assignments = []  # Geçerli atamaları tutacak liste
-        assignment = {}  # Hücrelere atanan değerler (True: mayın, False: güvenli)
-
-        # Açılmış hücreler için kısıtlamaları toplar: her açılmış hücrenin komşularındaki gizli hücre sayısı ve
-        # bu hücrelerde olması gereken mayın sayısı.
-        constraints = []
-        for i in range(self.board.height):
-            for j in range(self.board.width):
-                if self.board.grid[i][j]['revealed'] and self.board.grid[i][j]['adjacent_mines'] > 0:
-                    neighbors = self._get_neighbors(i, j)
-                    frontier_adj = [cell for cell in neighbors if cell in frontier]
-                    if frontier_adj:
-                        already_flagged = sum(1 for ni, nj in neighbors
-                                              if self.board.grid[ni][nj]['flagged'])
-                        remaining = self.board.grid[i][j]['adjacent_mines'] - already_flagged
-                        constraints.append((frontier_adj, remaining))
-
-        def check_assignment(assign):
-            """
-            Atanan değerlere göre tüm kısıtlamaların sağlanıp sağlanmadığını kontrol eder.
-            """
-            for cells, count in constraints:
-                relevant_cells = [c for c in cells if c in assign]
-                if len(relevant_cells) == len(cells):  # Tüm ilgili hücreler atandıysa
-                    if sum(assign[c] for c in cells) != count:
-                        return False
-            return True
 
-        def backtrack(index):
-            """
-            Geriye izleme algoritmasını uygular. Tüm frontier hücreleri için atama yapar ve
-            geçerli atamalar listesini oluşturur.
-            """
-            if index == len(frontier):
-                if check_assignment(assignment):
-                    valid_assignments.append(assignment.copy())
-                return
+# ProbabilitySolver Sınıfı
+# Sınır bileşenlerini tam olarak çözüp toplam mayın sayısıyla ağırlıklandırarak her hücrenin gerçek mayın
+# olasılığını hesaplar ve en düşük olasılıklı hücreyi seçer. Değişmeyen veya daha önce görülmüş bileşenler yeniden çözülmez.
+class ProbabilitySolver(SolverBase):
+    # Örneklenmiş bileşenlerdeki hücrelerin olasılığı bu aralığa kırpılır; tahmin kesin sonuç sayılmaz.
+    SAMPLED_FLOOR = 1e-6
 
-            cell = frontier[index]
+    def __init__(self, board, pattern_cache=None, sampler=None):
+        super().__init__(board, pattern_cache)
+        if sampler is None and np is not None:
+            sampler = MonteCarloEstimator()
+        self.sampler = sampler
 
-            # Hücreyi mayın olarak atamayı dener.
-            assignment[cell] = True
-            if check_assignment(assignment):
-                backtrack(index + 1)
+    def get_next_move(self):
+        # Önceki hamlelerde kanıtlanmış güvenli hücre varsa arama yapılmadan kuyruktan verilir.
+        move = self.next_safe_move()
+        if move is not None:
+            return move
+        moves = self.get_next_moves()
+        return moves[0] if moves else None
 
-            # Hücreyi güvenli olarak atamayı dener.
-            assignment[cell] = False
-            if check_assignment(assignment):
-                backtrack(index + 1)
+    def get_next_moves(self):
+        self.exhausted = False
+        if self.budget is not None:
+            self.budget.start()
 
-            del assignment[cell]
+        safe = self.queued_safe_moves()
+        if safe:
+            return safe
 
-        # Geriye izleme algoritmasını başlatır.
-        backtrack(0)
+        try:
+            # Kesin güvenli hücre doğrusal çıkarımla bulunabiliyorsa olasılıkların tamamı hesaplanmaz.
+            safe, mines = self.find_linear_moves()
+            self.flag_mines(mines)
+            if safe:
+                return self._queue_safe(safe)
+            result = self.get_mine_probabilities()
+        except BudgetExceeded:
+            # Olasılıklar bütçe içinde hesaplanamadı; hamle hızlı olasılık tahminiyle seçilir.
+            self._exhaust()
+            move = self.get_estimated_move()
+            return [move] if move else []
+        if result is None:
+            # Tutarlı bir yerleşim bulunamadı (ör. elle hatalı bayrak); sezgisel seçime dönülür.
+            move = self.get_probability_move()
+            return [move] if move else []
+        probabilities, interior_probability = result
 
-        # Geçerli atamalara göre kesin olarak mayın veya güvenli olan hücreleri belirler.
-        mine_cells = []
-        safe_cells = []
+        # Kesin sonuçlar önce uygulanır: tam çözülmüş bileşenlerde bütün çözümlerde mayın olan hücreler
+        # (sayaçlar kesin, bkz. FrontierComponent.forced_cells) bayraklanır, olasılığı 0 olanların hepsi açılır.
+        # 1'e çok yakın olasılık kanıt sayılmaz; örneklenmiş bileşenlerden hiç bayrak konmaz.
+        width = self.board.width
+        certain = [divmod(idx, width) for component in self._solved.values()
+                   for idx in component.forced_cells()[1]]
+        self.flag_mines(certain)
+        certain = set(certain)
+        candidates = [(p, cell) for cell, p in probabilities.items()
+                      if cell not in certain and cell not in self.bad_moves]
+        best = min(candidates, default=None)
+        if best is not None and best[0] == 0:
+            return self._queue_safe(sorted(cell for p, cell in candidates if p == 0))
+        if best is not None and (interior_probability is None or best[0] <= interior_probability):
+            return [best[1]]
+
+        # İç bölgedeki (sınırda olmayan) hücreler daha güvenliyse bunlardan biri seçilir.
+        move = self._pick_interior_cell() or (best[1] if best else self.get_probability_move())
+        return [move] if move else []
+
+    @timed("probabilities")
+    def get_mine_probabilities(self):
+        """
+        Sınır hücrelerinin kesin mayın olasılıklarını {(satır, sütun): olasılık} sözlüğü olarak ve
+        sınırda olmayan gizli hücrelerin ortak olasılığını döndürür (iç bölge yoksa None).
+        """
+        board = self.board
+        components = self._solve_frontier()
 
-        if valid_assignments:
-            for cell in frontier:
-                # Tüm atamalarda hücre mayın ise kesin mayın olarak işaretlenir.
-                if all(assign[cell] for assign in valid_assignments):
-                    mine_cells.append(cell)
-                # Tüm atamalarda hücre güvenli ise kesin güvenli olarak işaretlenir.
-                elif all(not assign[cell] for assign in valid_assignments):
-                    safe_cells.append(cell)
+        hidden_cells = board.width * board.height - board.revealed_count - board.flag_count
+        interior = hidden_cells - len(board.frontier)
+        total = board.mine_total()
+        remaining = None if total is None else total - board.flag_count
+        with self.stats.phase("weights"):
+            result = mine_probabilities(components, remaining, interior, self.budget,
+                                        density=board.density)
+        if result is None:
+            return None
+        probabilities, interior_probability = result
 
-        return safe_cells, mine_cells
+        width = board.width
+        floor = self.SAMPLED_FLOOR
+        cells = {}
+        for component, values in zip(components, probabilities):
+            if component.sampled:
+                values = [min(max(p, floor), 1 - floor) for p in values]
+            for idx, p in zip(component.cells, values):
+                cells[divmod(idx, width)] = p
+        return cells, (interior_probability if interior else None)
+
+    def _pick_interior_cell(self):
+        # Sınırda olmayan gizli bir hücre seçer; açılınca boş alan çıkma olasılığı yüksek olan köşeler önceliklidir.
+        board = self.board
+        cells = board.cells
+        frontier = board.frontier
+        width = board.width
+        last = len(cells) - 1
+        for idx in (0, width - 1, last - width + 1, last):
+            if not cells[idx] & (REVEALED | FLAGGED) and idx not in frontier \
+                    and divmod(idx, width) not in self.bad_moves:
+                return divmod(idx, width)
+        for idx in board.hidden_cells():
+            if idx not in frontier and divmod(idx, width) not in self.bad_moves:
+                return divmod(idx, width)
+        return None
+
+
+# Arayüzdeki ve komut satırındaki algoritma adlarının çözücü sınıflarına karşılığı
+SOLVERS = {
+    "Logical": LogicalSolver,
+    "DFS": DFSSolver,
+    "A*": AStarSolver,
+    "Backtracking": BacktrackingSolver,
+    "Probability": ProbabilitySolver,
+}
 
 
 # --------------------------
 # GUI ve Oyun Mantığı
 # Minesweeper oyununu tkinter arayüzü ile oynanabilir hale getirir ve çözücü algoritmaları entegre eder.
+# Çözücü ayrı bir iş parçacığında çalışır ve hamleleri bir kuyruğa yazar; arayüz kuyruğu sabit aralıklarla
+# boşaltıp ekranı yeniler, böylece uzun süren aramalarda pencere donmaz.
 # --------------------------
+
+# Çözücü hız seçenekleri: hamleler arası bekleme süresi (saniye); "Max" hiç beklemeden oynar.
+SOLVER_SPEEDS = {"Slow": 0.5, "Normal": 0.1, "Fast": 0.02, "Max": 0.0}
+FRAME_MS = 33  # Olay kuyruğunun boşaltılıp ekranın yenilendiği aralık (yaklaşık 30 kare/sn)
+
+# Tuval (Canvas) çizimi: hücre boyutu tahta büyüdükçe küçülür, sayılar klasik renklerle gösterilir.
+MAX_CELL_SIZE = 24
+MIN_CELL_SIZE = 8
+HIDDEN_COLOR = '#d9d9d9'
+NUMBER_COLORS = {1: 'blue', 2: 'green', 3: 'red', 4: 'navy', 5: 'maroon', 6: 'teal', 7: 'black', 8: 'gray'}
+
 class MinesweeperGUI:
     def __init__(self, master, width=10, height=10, num_mines=10):
         self.master = master
         self.board = MinesweeperBoard(width, height, num_mines)
+        self._changes = self.board.track_changes()  # Son çizimden beri değişen hücreler
         self.width = width
         self.height = height
         self.num_mines = num_mines
@@ -431,10 +3094,24 @@ class MinesweeperGUI:
         # Arc Consistency algoritması kaldırıldığı için seçenek listesinden çıkarıldı.
         self.algorithm = tk.StringVar(value="Manual")
         self.solver = None  # Otomatik çözücü nesnesi
+        self.mode = "Manual"  # Başlatılmış oyunun modu
         self.solver_running = False  # Çözücü çalışıyor mu kontrolü
         self.paused = False  # Duraklatma durumu
         self.start_time = None  # Oyuna başlama zamanı
 
+        # Çözücü iş parçacığı ile haberleşme: hamle olayları kuyruğu, durdurma ve duraklatma sinyalleri.
+        self.events = queue.Queue()
+        self.solver_thread = None
+        self._stop = threading.Event()
+        self._resume = threading.Event()
+        self._resume.set()
+        self._drain_job = None  # Zamanlanmış _drain_events çağrısının after kimliği (en fazla bir tane)
+        # Hız seçimi sadece ana iş parçacığında okunur; işçi düz bir sayı (move_delay) görür.
+        self.speed = tk.StringVar(value="Slow")
+        self.move_delay = SOLVER_SPEEDS["Slow"]
+        self.speed.trace_add("write", self._on_speed_change)
+        self.show_stats = tk.BooleanVar(value=False)  # Çözücü istatistik paneli açık mı
+
         self.setup_ui()  # Arayüz öğelerini oluşturur
 
     def setup_ui(self):
@@ -444,7 +3121,7 @@ class MinesweeperGUI:
 
         ttk.Label(control_frame, text="Algorithm:").pack(side=tk.LEFT)
         # Kullanılabilir algoritmalar listesi (Arc Consistency kaldırıldı)
-        algorithms = ["Manual", "Logical", "DFS", "A*", "Backtracking"]
+        algorithms = ["Manual"] + list(SOLVERS)
         for algo in algorithms:
             rb = tk.Radiobutton(control_frame, text=algo, variable=self.algorithm, value=algo)
             rb.pack(side=tk.LEFT, padx=5)
@@ -454,97 +3131,176 @@ class MinesweeperGUI:
         self.pause_button = ttk.Button(control_frame, text="Pause", command=self.toggle_pause)
         self.pause_button.pack(side=tk.LEFT, padx=5)
 
-        # Oyun alanı için grid çerçevesi oluşturulur.
-        self.grid_frame = tk.Frame(self.master)
-        self.grid_frame.pack()
+        # Çözücü hızı seçimi
+        ttk.Label(control_frame, text="Speed:").pack(side=tk.LEFT, padx=(10, 0))
+        tk.OptionMenu(control_frame, self.speed, *SOLVER_SPEEDS).pack(side=tk.LEFT)
+        # İşaretlenirse bir sonraki oyunda çözücü ölçülür ve son hamlenin istatistikleri gösterilir.
+        tk.Checkbutton(control_frame, text="Stats", variable=self.show_stats).pack(side=tk.LEFT, padx=5)
 
-        self.buttons = []
+        # Oyun alanı tek bir tuval üzerine çizilir; her hücre için bir dikdörtgen ve bir yazı öğesi tutulur.
+        size = max(MIN_CELL_SIZE, min(MAX_CELL_SIZE, 720 // max(self.width, self.height)))
+        self.cell_size = size
+        self.canvas = tk.Canvas(self.master, width=self.width * size, height=self.height * size,
+                                highlightthickness=0)
+        self.canvas.pack()
+        font = ('Arial', max(6, size // 3))
+        self.cell_items = []
         for i in range(self.height):
-            row = []
             for j in range(self.width):
-                # Her hücre için bir buton oluşturulur; başlangıçta manuel modda kullanılmak üzere ayarlanır.
-                btn = tk.Button(self.grid_frame, text=' ', width=3, font=('Arial', 8))
-                btn.grid(row=i, column=j)
-                row.append(btn)
-            self.buttons.append(row)
+                x, y = j * size, i * size
+                rect = self.canvas.create_rectangle(x, y, x + size, y + size, fill=HIDDEN_COLOR, outline='gray')
+                text = self.canvas.create_text(x + size // 2, y + size // 2, text='', font=font)
+                self.cell_items.append((rect, text))
+        # Her hücrenin en son çizildiği görünüm; değişmeyen hücreler için Tk çağrısı yapılmaz.
+        self._drawn = [None] * (self.width * self.height)
+        self.canvas.bind("<Button-1>", self._on_left_click)
+        self.canvas.bind("<Button-3>", self._on_right_click)
+
+        # Canlı istatistik paneli: son hamlenin aşama süreleri ve sayaçları
+        self.stats_label = tk.Label(self.master, text="", anchor="w", justify=tk.LEFT, font=('Courier', 9))
+        self.stats_label.pack(fill=tk.X)
+
+    def _on_speed_change(self, *args):
+        # Seçilen hız, işçi iş parçacığının okuyacağı bekleme süresine çevrilir.
+        self.move_delay = SOLVER_SPEEDS[self.speed.get()]
 
     def toggle_pause(self):
         # Çözücü duraklatma veya devam ettirme işlemini yönetir.
+        # İşçi iş parçacığı bir sonraki hamleden önce _resume sinyalini bekler; süren uzun bir arama bütçe
+        # üzerinden hemen kesilir ve devam edilince aynı hamle yeniden aranır.
+        budget = self.solver.budget if self.solver is not None else None
         if self.paused:
             self.paused = False
             self.pause_button.config(text="Pause")
-            if self.algorithm.get() != "Manual":
-                self.make_move()
+            if budget is not None:
+                budget.reset()
+            self._resume.set()
         else:
             self.paused = True
             self.pause_button.config(text="Resume")
+            self._resume.clear()
+            if budget is not None:
+                budget.cancel()
+
+    def stop_solver(self):
+        # Çalışan çözücü iş parçacığına durmasını bildirir ve kısa bir süre bitmesini bekler.
+        # Süren arama bütçe üzerinden kesilir; kesilemeyen bir adım sürüyorsa iş parçacığı kendi (eski)
+        # tahtasında bitirip kendiliğinden çıkar.
+        self.solver_running = False
+        self._stop.set()
+        if self._drain_job is not None:
+            self.master.after_cancel(self._drain_job)
+            self._drain_job = None
+        if self.solver is not None and self.solver.budget is not None:
+            self.solver.budget.cancel()
+        self._resume.set()
+        if self.solver_thread is not None and self.solver_thread.is_alive():
+            self.solver_thread.join(timeout=0.1)
+        self.solver_thread = None
 
     def update_display(self):
-        # Her hücre için buton görünümünü günceller.
-        for i in range(self.height):
-            for j in range(self.width):
-                cell = self.board.grid[i][j]
-                btn = self.buttons[i][j]
-
-                if cell['flagged']:
-                    btn.config(text='🚩', bg='red', relief=tk.RAISED)
-                elif cell['revealed']:
-                    btn.config(relief=tk.SUNKEN,
-                               text=str(cell['adjacent_mines']) if cell['adjacent_mines'] > 0 else ' ',
-                               bg='lightgrey', state=tk.DISABLED)
-                else:
-                    btn.config(text=' ', bg='SystemButtonFace', relief=tk.RAISED, state=tk.NORMAL)
+        # Tüm hücrelerin görünümünü günceller (yeni oyun, durum yükleme ve oyun sonu için).
+        self.render_cells(range(self.width * self.height))
+
+    def render_cells(self, indices):
+        # Sadece verilen hücreleri yeniden çizer; görünümü değişmeyen hücrelere dokunulmaz.
+        cells = self.board.cells
+        show_mines = self.board.game_over
+        canvas = self.canvas
+        for idx in indices:
+            state = cells[idx]
+            # Oyun bittiğinde, mayınlar bayraklı şekilde gösterilir.
+            if state & FLAGGED or (show_mines and state & MINE):
+                look = ('red', '🚩', 'black')
+            elif state & REVEALED:
+                count = state & COUNT_MASK
+                look = ('lightgrey', str(count) if count else '', NUMBER_COLORS.get(count, 'black'))
+            else:
+                look = (HIDDEN_COLOR, '', 'black')
+            if self._drawn[idx] != look:
+                self._drawn[idx] = look
+                rect, text = self.cell_items[idx]
+                canvas.itemconfig(rect, fill=look[0])
+                canvas.itemconfig(text, text=look[1], fill=look[2])
 
-                # Oyun bittiğinde, mayınlar bayraklı şekilde gösterilir.
-                if self.board.game_over and cell['is_mine']:
-                    btn.config(text='🚩', bg='red')
+    def _render_tracked(self):
+        # Ana iş parçacığında yapılan değişikliklerden (manuel mod) sonra sadece değişen hücreleri çizer.
+        changes = self._changes
+        if changes.full or self.board.game_over:
+            # Oyun bittiyse gizli mayınlar da gösterileceği için tüm tahta çizilir.
+            changes.full = False
+            changes.clear()
+            self.update_display()
+        else:
+            indices = list(changes)
+            changes.clear()
+            self.render_cells(indices)
+
+    def _event_cell(self, event):
+        # Tuval üzerindeki tıklama konumunu (satır, sütun) hücresine çevirir.
+        row, col = event.y // self.cell_size, event.x // self.cell_size
+        if 0 <= row < self.height and 0 <= col < self.width:
+            return row, col
+        return None
+
+    def _on_left_click(self, event):
+        cell = self._event_cell(event)
+        if cell and self.mode == "Manual":
+            self.manual_left_click(*cell)
+
+    def _on_right_click(self, event):
+        cell = self._event_cell(event)
+        if cell and self.mode == "Manual":
+            self.manual_right_click(*cell)
 
     def start_mode(self):
         # Oyunu başlatır ve seçilen moda göre çözücü veya manuel oynanış ayarlanır.
-        self.board.reset_board()  # Oyun tahtası sıfırlanır
+        # Önceki oyunun çözücüsü durdurulur; hâlâ bitmemişse yeni tahtaya dokunmaması için her oyun yeni bir tahtayla başlar.
+        self.stop_solver()
+        self.board = MinesweeperBoard(self.width, self.height, self.num_mines)
+        self._changes = self.board.track_changes()
+        self._changes.full = False
         self.update_display()  # Ekran güncellenir
-        mode = self.algorithm.get()
+        mode = self.mode = self.algorithm.get()
         self.solver_running = False
         self.paused = False
         self.pause_button.config(text="Pause")
         self.start_time = time.time()  # Oyuna başlama zamanı kaydedilir
 
-        # Manuel mod için her butona sol tıklama ve sağ tıklama işlemleri bağlanır.
-        if mode == "Manual":
-            for i in range(self.height):
-                for j in range(self.width):
-                    self.buttons[i][j].config(command=lambda i=i, j=j: self.manual_left_click(i, j))
-                    self.buttons[i][j].bind("<Button-3>", lambda e, i=i, j=j: self.manual_right_click(i, j))
-        else:
+        # Manuel modda tuval tıklamaları hücrelere yönlendirilir (bkz. _on_left_click); otomatik modda yok sayılır.
+        if mode != "Manual":
             # Otomatik modlar için uygun çözücü (solver) oluşturulur.
-            if mode == "Logical":
-                self.solver = LogicalSolver(self.board)
-            elif mode == "DFS":
-                self.solver = DFSSolver(self.board)
-            elif mode == "A*":
-                self.solver = AStarSolver(self.board)
-            elif mode == "Backtracking":
-                self.solver = BacktrackingSolver(self.board)
-
-            # Otomatik modda butonlar pasif hale getirilir.
-            for i in range(self.height):
-                for j in range(self.width):
-                    self.buttons[i][j].config(command=None)
-                    self.buttons[i][j].unbind("<Button-3>")
-
-            # Çözücü başlatılır.
+            self.solver = SOLVERS[mode](self.board)
+            self.solver.budget = SearchBudget()  # Sınırsız; sadece Pause ve Stop ile aramayı kesmek için
+            if self.show_stats.get():
+                self.solver.stats = SolverStats()
+
+            # Çözücü arka planda başlatılır; arayüz kuyruğu FRAME_MS aralıklarla boşaltır.
+            # Değişiklik kümesi artık işçiye aittir; değişen hücreler olaylarla birlikte gönderilir.
             self.solver_running = True
-            self.make_move()
+            self._stop = threading.Event()
+            self._resume.set()
+            self.events = queue.Queue()
+            self.solver_thread = threading.Thread(
+                target=self._solver_loop, args=(self.solver, self.board, self._stop, self.events, self._changes),
+                daemon=True)
+            self.solver_thread.start()
+            self._schedule_drain()
 
     def manual_left_click(self, i, j):
         # Manuel modda sol tıklama işlemi: Hücre açılır.
         if self.board.game_over:
             return
         cell = self.board.grid[i][j]
-        if cell['flagged'] or cell['revealed']:
+        if cell['flagged']:
             return
-        mine_hit = self.board.reveal(i, j)  # Hücre açılır ve mayın kontrolü yapılır.
-        self.update_display()  # Ekran güncellenir.
+        if cell['revealed']:
+            # Açılmış sayıya tıklanırsa bayrakları tamamlanmış komşular tek seferde açılır (akor).
+            opened = self.board.chord(i, j)
+            mine_hit = bool(opened) and self.board.is_mine(*opened[-1])
+        else:
+            mine_hit = self.board.reveal(i, j)  # Hücre açılır ve mayın kontrolü yapılır.
+        self._render_tracked()  # Sadece açılan hücreler çizilir.
         if mine_hit:
             self.show_game_over()  # Mayına basılırsa oyun biter.
         elif self.board.revealed_count == self.width * self.height - self.num_mines:
@@ -560,67 +3316,111 @@ class MinesweeperGUI:
 
         # Hücre bayrak durumu değiştirilir.
         cell['flagged'] = not cell['flagged']
-        self.update_display()  # Görüntü güncellenir.
+        self._render_tracked()  # Görüntü güncellenir.
 
-    def make_move(self):
-        # Otomatik modda çözücünün hamle yapma işlemini yönetir.
-        if self.paused or not self.solver_running or self.board.game_over:
-            return
-
-        # Güvenli hamleler ve mayın hücreleri tespit edilir.
-        prev_state = self.board.save_state()
-        if hasattr(self.solver, 'find_safe_moves'):
-            safe, mines = self.solver.find_safe_moves()
+    def solver_step(self, solver, board):
+        """
+        Çözücünün bir hamle kümesini (bkz. get_next_moves) tek seferde açar ve (hamleler, mayına basıldı mı)
+        döndürür; oynanacak hücre kalmadıysa None. İşçi iş parçacığında çalışır, bu yüzden hiçbir Tk çağrısı yapmaz.
+        """
+        with solver.stats.move():
+            # Güvenli hamleler ve mayın hücreleri tespit edilir.
+            safe, mines = solver.find_safe_moves()
             # Eğer çözücü kendi içinde bayraklama yapmıyorsa burada bayraklama yapılır.
-            if hasattr(self.solver, 'flag_mines'):
-                self.solver.flag_mines(mines)
+            solver.flag_mines(mines)
 
-        self.update_display()  # Ekran güncellenir
-        self.master.update_idletasks()
+            # Çözücüden bir sonraki hamle kümesi alınır.
+            moves = solver.get_next_moves()
 
-        if self.paused or not self.solver_running or self.board.game_over:
-            return
+        # Eğer hamle bulunamazsa, gizli hücrelerden rastgele seçim yapılır.
+        if not moves:
+            move = board.random_hidden_cell(random, solver.bad_moves)
+            if move is None:
+                return None
+            moves = [move]
+
+        opened = board.reveal_many(moves)
+        mine_hit = bool(opened) and board.is_mine(*opened[-1])
+        if mine_hit:
+            # Sadece mayına basan tıklama (günlükteki son hamle) geri alınır ve hamle kötü olarak işaretlenir;
+            # aynı kümedeki önceki güvenli açmalar korunur.
+            move = opened[-1]
+            board.goto(board.checkpoint() - 1)
+            solver.bad_moves.add(move)
+            solver.visited.discard(move)
+        return moves, mine_hit
 
-        # Çözücüden bir sonraki hamle alınır.
-        move = self.solver.get_next_move()
+    def _solver_loop(self, solver, board, stop, events, changes):
+        # İşçi iş parçacığı: oyun bitene veya durdurulana kadar hamle yapar ve olayları kuyruğa yazar.
+        # Her olay, hamlenin değiştirdiği hücre indekslerini taşır (None: tüm tahta yeniden çizilmeli).
+        try:
+            while not stop.is_set():
+                self._resume.wait()  # Duraklatılmışsa devam sinyali beklenir
+                if stop.is_set():
+                    break
+                try:
+                    step = self.solver_step(solver, board)
+                except SearchCancelled:
+                    continue  # Duraklatıldı veya durduruldu; döngü başında devam sinyali beklenir
+                if changes.full:
+                    changes.full = False
+                    changed = None
+                else:
+                    changed = list(changes)
+                changes.clear()
+                if step is None or board.game_over:
+                    events.put(("game_over", changed))
+                    break
+                events.put(("move", changed))
+                if self.move_delay:
+                    stop.wait(self.move_delay)
+        except Exception as exc:  # Hata arayüzde gösterilmek üzere kuyruğa iletilir
+            events.put(("error", exc))
 
-        # Eğer hamle bulunamazsa, gizli hücrelerden rastgele seçim yapılır.
-        if not move:
-            hidden = [(i, j) for i in range(self.height) for j in range(self.width)
-                      if (not self.board.grid[i][j]['revealed'] and
-                          not self.board.grid[i][j]['flagged'] and
-                          (i, j) not in getattr(self.solver, 'bad_moves', set()))]
+    def _schedule_drain(self):
+        # Kuyruk boşaltmayı bir kare sonrasına zamanlar; zaten zamanlanmış bir çağrı varsa yenisi eklenmez.
+        if self._drain_job is None:
+            self._drain_job = self.master.after(FRAME_MS, self._drain_events)
 
-            if hidden:
-                move = random.choice(hidden)
-            else:
-                self.show_game_over()
-                return
-
-        if move:
-            row, col = move
-            prev_state = self.board.save_state()  # Hamle öncesi durum kaydedilir.
-            mine_hit = self.board.reveal(row, col)
-
-            if mine_hit:
-                #önceki duruma geri dönüp hamleyi kötü olarak işaretler.
-                self.board.load_state(prev_state)
-                if hasattr(self.solver, 'bad_moves'):
-                    self.solver.bad_moves.add((row, col))
-                if hasattr(self.solver, 'visited'):
-                    self.solver.visited.discard((row, col))
-                self.update_display()
-                self.master.after(500, self.make_move)
-            else:
-                # Hamle başarılıysa ekran güncellenir ve sonraki hamle için beklenir.
-                self.update_display()
-                if self.board.game_over:
-                    self.show_game_over()
-                    return
+    def _drain_events(self):
+        # Ana iş parçacığı: kuyruktaki tüm olayları alır ve ekranı kare başına en fazla bir kez yeniler.
+        self._drain_job = None
+        if not self.solver_running:
+            return
+        dirty = set()
+        full = False
+        finished = False
+        error = None
+        try:
+            while True:
+                kind, payload = self.events.get_nowait()
+                if kind == "error":
+                    error = payload
+                    continue
+                if kind == "game_over":
+                    finished = True
+                if payload is None:
+                    full = True
+                else:
+                    dirty.update(payload)
+        except queue.Empty:
+            pass
 
-                self.master.after(500, self.make_move)
-        else:
+        # Oyun sonunda mayınlar da gösterileceğinden tahta bütünüyle yeniden çizilir.
+        if full or finished:
+            self.update_display()
+        elif dirty:
+            self.render_cells(dirty)
+        if self.solver is not None and self.solver.stats.enabled:
+            self.stats_label.config(text=format_move_stats(self.solver.stats))
+        if error is not None:
+            self.solver_running = False
+            messagebox.showerror("Çözücü Hatası", str(error))
+            return
+        if finished:
             self.show_game_over()
+            return
+        self._schedule_drain()
 
     def show_game_over(self):
         # Oyun bittiğinde çözücüyü durdurur ve oyun sonucunu, çözüm süresiyle birlikte mesaj kutusu ile gösterir.
@@ -632,9 +3432,887 @@ class MinesweeperGUI:
             messagebox.showinfo("Oyun Bitti", f"Mayına bastınız, oyunu kaybettiniz!\nÇözüm süresi: {elapsed_time:.2f} saniye.")
 
 
-if __name__ == "__main__":
+# --------------------------
+# Oyun Kayıtları
+# Oyunlar, tek dosyada art arda eklenen sıkıştırılmış ikili kayıtlar olarak saklanır. Her kayıt; tahta
+# boyutları, mayın yerleşimi (tohum veya bit haritası) ve değişken uzunluklu tam sayılarla (varint)
+# kodlanmış hamle akışından oluşur. Okuyucu dosyayı belleğe eşler (mmap) ve herhangi bir oyuna
+# indeksle erişir; kayıt, istenen hamleye kadar yeniden oynatılarak tahta durumu elde edilir.
+# --------------------------
+GAME_RECORD_MAGIC = b"MSGR\x01"  # Dosya başlığı: biçim adı ve sürümü
+
+# Hamle türleri; her hamle (hücre indeksi << 2 | tür) olarak tek bir varint ile yazılır.
+MOVE_REVEAL = 0
+MOVE_FLAG = 1
+MOVE_UNFLAG = 2
+
+# Mayın yerleşiminin kayıtta nasıl tutulduğu
+_LAYOUT_NONE = 0  # Henüz mayın yerleştirilmemiş (hiç hücre açılmamış)
+_LAYOUT_SEED = 1  # random.Random tohumu; yerleşim ilk açmada yeniden üretilir
+_LAYOUT_BITMAP = 2  # Hücre başına bir bitlik mayın haritası
+
+
+def _write_varint(out, value):
+    # Negatif olmayan tam sayıyı 7 bitlik gruplar halinde (LEB128) bytearray'e ekler.
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    # pos konumundaki varint'i okur; (değer, sonraki konum) döndürür.
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def board_moves(board):
+    # Tahtanın hamle günlüğünü (geri alınmış hamleler hariç) (tür, satır, sütun) listesine çevirir.
+    moves = []
+    for entry in board.journal[:board.journal_pos]:
+        row, col = divmod(entry.indices[0], board.width)
+        if entry.mask == REVEALED:
+            moves.append((MOVE_REVEAL, row, col))
+        else:
+            # Bayrak sayısı arttıysa bayrak konmuş, azaldıysa kaldırılmıştır.
+            moves.append((MOVE_FLAG if entry.after[1] > entry.before[1] else MOVE_UNFLAG, row, col))
+    return moves
+
+
+class GameRecord:
+    # Tek bir oyunun kaydı. seed veya mines (mayın indeksleri) yerleşimi belirler; ikisi de None ise
+    # oyunda henüz hücre açılmamıştır. moves (tür, satır, sütun) listesidir.
+    __slots__ = ('width', 'height', 'num_mines', 'seed', 'mines', 'moves')
+
+    def __init__(self, width, height, num_mines, moves, seed=None, mines=None):
+        self.width = width
+        self.height = height
+        self.num_mines = num_mines
+        self.moves = moves
+        self.seed = seed
+        self.mines = mines
+
+    @classmethod
+    def from_board(cls, board, seed=None):
+        # Tahtanın şimdiye kadarki oyununu kaydeder. Tahta tohumla (rng=seed) oluşturulduysa seed
+        # verilmesi yeterlidir; aksi halde yerleştirilmiş mayınlar bit haritası olarak saklanır.
+        mines = None
+        if seed is None and board.mines_placed:
+            mines = [idx for idx, state in enumerate(board.cells) if state & MINE]
+        return cls(board.width, board.height, board.num_mines, board_moves(board), seed, mines)
+
+    def encode(self):
+        # Kaydı sıkıştırılmış ikili biçime çevirir (uzunluk öneki hariç).
+        out = bytearray()
+        for value in (self.width, self.height, self.num_mines):
+            _write_varint(out, value)
+        if self.seed is not None:
+            out.append(_LAYOUT_SEED)
+            _write_varint(out, self.seed << 1 if self.seed >= 0 else (~self.seed << 1) | 1)  # zigzag
+        elif self.mines is not None:
+            out.append(_LAYOUT_BITMAP)
+            bits = 0
+            for idx in self.mines:
+                bits |= 1 << idx
+            out += bits.to_bytes((self.width * self.height + 7) // 8, 'little')
+        else:
+            out.append(_LAYOUT_NONE)
+        _write_varint(out, len(self.moves))
+        width = self.width
+        for kind, row, col in self.moves:
+            _write_varint(out, (row * width + col) << 2 | kind)
+        return bytes(out)
+
+    @classmethod
+    def decode(cls, data, pos=0):
+        # encode ile üretilmiş kaydı data[pos:] içinden okur (bytes, bytearray veya mmap olabilir).
+        width, pos = _read_varint(data, pos)
+        height, pos = _read_varint(data, pos)
+        num_mines, pos = _read_varint(data, pos)
+        layout = data[pos]
+        pos += 1
+        seed = mines = None
+        if layout == _LAYOUT_SEED:
+            value, pos = _read_varint(data, pos)
+            seed = value >> 1 if not value & 1 else ~(value >> 1)
+        elif layout == _LAYOUT_BITMAP:
+            size = (width * height + 7) // 8
+            bits = int.from_bytes(data[pos:pos + size], 'little')
+            pos += size
+            mines = []
+            while bits:
+                low = bits & -bits
+                mines.append(low.bit_length() - 1)
+                bits ^= low
+        elif layout != _LAYOUT_NONE:
+            raise ValueError(f"bilinmeyen mayın yerleşimi türü: {layout}")
+        count, pos = _read_varint(data, pos)
+        moves = []
+        for _ in range(count):
+            code, pos = _read_varint(data, pos)
+            row, col = divmod(code >> 2, width)
+            moves.append((code & 3, row, col))
+        return cls(width, height, num_mines, moves, seed, mines)
+
+    def replay(self, upto=None):
+        """
+        Oyunu baştan oynatarak ilk upto hamle sonrasındaki tahtayı döndürür (None: tüm hamleler).
+        Dönen tahtanın hamle günlüğü doludur; goto/undo ile başka hamlelere de geçilebilir.
+        """
+        board = MinesweeperBoard(self.width, self.height, self.num_mines, rng=self.seed)
+        if self.mines is not None:
+            board.set_mines(self.mines)
+        for kind, row, col in self.moves[:upto]:
+            if kind == MOVE_REVEAL:
+                board.reveal(row, col)
+            else:
+                board.set_flag(row, col, kind == MOVE_FLAG)
+        return board
+
+
+class GameRecordWriter:
+    # Kayıt dosyasına oyunları sırayla ekleyen yazıcı. Her kayıt, uzunluk öneki (varint) ile yazılır;
+    # dosya kapanmadan kesilirse okuyucu yarım kalan son kaydı yok sayar.
+    def __init__(self, path, append=True):
+        self.stream = open(path, "ab" if append else "wb")
+        if self.stream.tell() == 0:
+            self.stream.write(GAME_RECORD_MAGIC)
+
+    def write(self, record):
+        # GameRecord veya önceden kodlanmış kayıt (bytes) kabul eder.
+        data = record if isinstance(record, (bytes, bytearray)) else record.encode()
+        prefix = bytearray()
+        _write_varint(prefix, len(data))
+        self.stream.write(prefix)
+        self.stream.write(data)
+
+    def write_board(self, board, seed=None):
+        self.write(GameRecord.from_board(board, seed))
+
+    def flush(self):
+        self.stream.flush()
+
+    def close(self):
+        self.stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class GameRecordReader:
+    # Kayıt dosyasını belleğe eşleyerek okur. Kayıtların başlangıç konumları ilk erişimde uzunluk
+    # önekleri üzerinden atlanarak bulunur; sonrasında her oyuna indeksle doğrudan erişilir.
+    def __init__(self, path):
+        with open(path, "rb") as stream:
+            header = stream.read(len(GAME_RECORD_MAGIC))
+            if header != GAME_RECORD_MAGIC:
+                raise ValueError(f"{path!r} bir oyun kaydı dosyası değil")
+            self.data = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        self._offsets = None
+
+    def _scan(self):
+        data = self.data
+        size = len(data)
+        offsets = []
+        pos = len(GAME_RECORD_MAGIC)
+        try:
+            while pos < size:
+                length, start = _read_varint(data, pos)
+                if start + length > size:
+                    break  # Yazımı yarıda kalmış son kayıt
+                offsets.append(start)
+                pos = start + length
+        except IndexError:
+            pass  # Uzunluk öneki bile tamamlanmamış
+        self._offsets = offsets
+        return offsets
+
+    @property
+    def offsets(self):
+        return self._offsets if self._offsets is not None else self._scan()
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        return GameRecord.decode(self.data, self.offsets[index])
+
+    def __iter__(self):
+        for offset in self.offsets:
+            yield GameRecord.decode(self.data, offset)
+
+    def close(self):
+        self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# --------------------------
+# Toplu Oyun Motoru (BatchBoards)
+# Aynı boyuttaki B tahtayı (B, yükseklik, genişlik) biçiminde üst üste dizilmiş NumPy dizileri olarak tutar.
+# Açma, boş bölge taşkını ve find_safe_moves'taki iki basit kural bütün tahtalara dizi işlemleriyle
+# aynı anda uygulanır. Basit kuralların ilerleyemediği tahtalar tek tek skaler çözücülere devredilir.
+# Çözücü sezgilerini çok sayıda oyunla sınamak için kullanılır; NumPy gerektirir.
+# --------------------------
+
+class BatchBoards:
+    def __init__(self, width, height, num_mines, batch, seed=None):
+        if np is None:
+            raise RuntimeError("BatchBoards için NumPy gerekli (pip install numpy)")
+        self.width = width
+        self.height = height
+        self.num_mines = num_mines
+        self.batch = batch
+        self.rng = np.random.default_rng(seed)
+        shape = (batch, height, width)
+        self.mines = np.zeros(shape, dtype=bool)
+        self.counts = np.zeros(shape, dtype=np.uint8)
+        self.revealed = np.zeros(shape, dtype=bool)
+        self.flagged = np.zeros(shape, dtype=bool)
+        self.lost = np.zeros(batch, dtype=bool)
+        self.won = np.zeros(batch, dtype=bool)
+        self.guesses = np.zeros(batch, dtype=np.int32)  # Basit kurallar dışındaki (tahmin/devir) hamleler
+        self.handoffs = 0  # Skaler çözücüye devredilen hamle sayısı
+        self.rounds = 0  # Toplu kural turlarının sayısı
+
+    def _padded_slices(self, mask):
+        # Dizinin kenarları sıfırla doldurulur ve her tahta için 3x3 penceredeki dokuz kaydırılmış görünüm üretilir.
+        padded = np.pad(mask, ((0, 0), (1, 1), (1, 1)))
+        height, width = mask.shape[1:]
+        for di in range(3):
+            for dj in range(3):
+                yield padded[:, di:di + height, dj:dj + width]
+
+    def _neighbor_sum(self, mask):
+        # Her hücrenin komşularında mask'in doğru olduğu hücre sayısı (kendisi hariç).
+        total = np.zeros(mask.shape, dtype=np.uint8)
+        for window in self._padded_slices(mask.view(np.uint8)):
+            total += window
+        return total - mask
+
+    def _dilate(self, mask):
+        # mask'teki hücrelerin kendisi ve komşuları (3x3 genişletme).
+        result = np.zeros(mask.shape, dtype=bool)
+        for window in self._padded_slices(mask):
+            result |= window
+        return result
+
+    @property
+    def done(self):
+        return self.lost | self.won
+
+    def place_mines(self, row, col):
+        # Her tahtaya, verilen hücre hariç num_mines mayın yerleştirir. Hücre başına rastgele anahtar üretilip
+        # en küçük num_mines anahtar seçilir; bu, her tahta için düzgün dağılımlı bir alt kümedir.
+        total = self.width * self.height
+        if self.num_mines:
+            keys = self.rng.random((self.batch, total))
+            keys[:, row * self.width + col] = 2.0  # Hariç tutulan hücre hiçbir zaman seçilmez
+            picks = np.argpartition(keys, self.num_mines - 1, axis=1)[:, :self.num_mines]
+            flat = self.mines.reshape(self.batch, total)
+            flat[np.arange(self.batch)[:, None], picks] = True
+        self.counts = self._neighbor_sum(self.mines)
+
+    def start(self, row=None, col=None):
+        # İlk hamleyi bütün tahtalarda aynı hücrede (varsayılan tahtanın ortası) yapar; ilk hamle güvenlidir.
+        row = self.height // 2 if row is None else row
+        col = self.width // 2 if col is None else col
+        self.place_mines(row, col)
+        boards = np.arange(self.batch)
+        self.reveal(boards, np.full(self.batch, row), np.full(self.batch, col))
+
+    def reveal(self, boards, rows, cols):
+        # boards[k] tahtasında (rows[k], cols[k]) hücresini açar; boş hücrelerden taşkınla bölge açılır.
+        boards = np.asarray(boards)
+        rows = np.asarray(rows)
+        cols = np.asarray(cols)
+        closed = ~(self.revealed[boards, rows, cols] | self.flagged[boards, rows, cols])
+        boards, rows, cols = boards[closed], rows[closed], cols[closed]
+        self.revealed[boards, rows, cols] = True
+        self.lost[boards[self.mines[boards, rows, cols]]] = True
+        self._flood(np.unique(boards))
+        self._update_won()
+
+    def _flood(self, boards):
+        # Açık sıfır hücrelerin açılmamış, bayraksız komşularını, yeni hücre kalmayana kadar açar.
+        # Her turda sadece hâlâ genişleyen tahtalar işlenir.
+        zero = (self.counts == 0) & ~self.mines
+        while boards.size:
+            revealed = self.revealed[boards]
+            grow = self._dilate(revealed & zero[boards]) & ~revealed & ~self.flagged[boards]
+            growing = grow.any(axis=(1, 2))
+            boards = boards[growing]
+            self.revealed[boards] |= grow[growing]
+
+    def _update_won(self):
+        safe = self.width * self.height - self.num_mines
+        self.won = ~self.lost & (self.revealed.sum(axis=(1, 2)) == safe)
+
+    def apply_rules(self):
+        """
+        find_safe_moves'taki iki basit kuralı bitmemiş bütün tahtalara aynı anda uygular:
+         - Kalan sayı gizli komşu sayısına eşitse gizli komşular mayındır (bayraklanır).
+         - Kalan sayı 0 ise gizli komşular güvenlidir (açılır).
+        İlerleme kaydedilen tahtaları gösteren bool dizisi döner.
+        """
+        live = np.flatnonzero(~self.done)
+        progress = np.zeros(self.batch, dtype=bool)
+        if not live.size:
+            return progress
+        self.rounds += 1
+        revealed = self.revealed[live]
+        flagged = self.flagged[live]
+        counts = self.counts[live]
+        hidden = ~revealed & ~flagged
+        hidden_count = self._neighbor_sum(hidden)
+        remaining = counts.astype(np.int16) - self._neighbor_sum(flagged)
+        numbered = revealed & (counts > 0) & (hidden_count > 0) & ~self.mines[live]
+        new_mines = self._dilate(numbered & (remaining == hidden_count)) & hidden
+        new_safe = self._dilate(numbered & (remaining == 0)) & hidden & ~new_mines
+        self.flagged[live] = flagged | new_mines
+        self.revealed[live] = revealed | new_safe
+        changed = new_mines.any(axis=(1, 2)) | new_safe.any(axis=(1, 2))
+        progress[live] = changed
+        self._flood(live[new_safe.any(axis=(1, 2))])
+        self._update_won()
+        return progress
+
+    def to_board(self, b):
+        # b numaralı tahtanın mevcut durumundan skaler bir MinesweeperBoard oluşturur (çözücüye devir için).
+        cells = (self.counts[b] | (self.mines[b] * MINE) | (self.revealed[b] * REVEALED)
+                 | (self.flagged[b] * FLAGGED)).astype(np.uint8)
+        board = MinesweeperBoard(self.width, self.height, self.num_mines)
+        board.load_state({'cells': cells.tobytes(), 'revealed_count': int(self.revealed[b].sum()),
+                          'game_over': bool(self.lost[b] or self.won[b]), 'first_move': False,
+                          'mines_placed': True})
+        return board
+
+    def _random_guesses(self, boards):
+        # Her tahtada açılmamış ve bayraksız hücreler arasından rastgele birini seçer.
+        # Gizli hücresi kalmamış (yanlış bayraklarla tıkanmış) tahtalar kaybedilmiş sayılır.
+        hidden = ~(self.revealed[boards] | self.flagged[boards]).reshape(len(boards), -1)
+        self.lost[boards[~hidden.any(axis=1)]] = True
+        keys = np.where(hidden, self.rng.random(hidden.shape), -1.0)
+        return np.divmod(keys.argmax(axis=1), self.width)
+
+    def guess(self, boards, solver_name=None):
+        # Basit kuralların ilerleyemediği tahtalarda bir hamle yapar. solver_name verilirse tahta skaler
+        # çözücüye devredilir; çözücünün bayrakları geri alınır ve önerdiği hücre kümesinin tamamı
+        # (bkz. get_next_moves) açılır. Çözücü hamle bulamazsa (veya çözücü verilmemişse) rastgele gizli
+        # bir hücre açılır.
+        boards = np.asarray(boards)
+        if not boards.size:
+            return
+        rows, cols = self._random_guesses(boards)
+        boards, rows, cols = list(boards), list(rows), list(cols)
+        if solver_name is not None:
+            for k in range(len(boards)):
+                b = boards[k]
+                board = self.to_board(b)
+                solver = SOLVERS[solver_name](board)
+                safe, mines = solver.find_safe_moves()
+                solver.flag_mines(mines)
+                moves = solver.get_next_moves()
+                self.handoffs += 1
+                self.flagged[b] = (np.frombuffer(board.cells, dtype=np.uint8) & FLAGGED).reshape(
+                    self.height, self.width) != 0
+                if moves:
+                    rows[k], cols[k] = moves[0]
+                    for row, col in moves[1:]:
+                        boards.append(b)
+                        rows.append(row)
+                        cols.append(col)
+        self.guesses[np.unique(boards)] += 1
+        self.reveal(boards, rows, cols)
+
+    def play(self, solver_name=None, row=None, col=None):
+        # Bütün tahtaları bitene kadar oynatır: basit kurallar toplu uygulanır, takılan tahtalar guess ile
+        # ilerletilir. Kazanılan tahtaları gösteren bool dizisi döner.
+        if not self.revealed.any():
+            self.start(row, col)
+        while True:
+            live = ~self.done
+            if not live.any():
+                break
+            progress = self.apply_rules()
+            self.guess(np.flatnonzero(live & ~progress & ~self.done), solver_name)
+        return self.won
+
+
+# --------------------------
+# Arayüzsüz Kıyaslama (bench)
+# Çözücüleri Tk olmadan, tohumlu oyunlarla oynatır; kazanma oranı, hamle sayısı, hamle gecikmesi
+# yüzdelikleri ve toplam CPU süresini JSON/CSV olarak raporlar. Kayıtlı bir taban çizgisine göre
+# yavaşlayan çözücü varsa hata koduyla çıkar.
+# --------------------------
+BOARD_CONFIGS = {
+    "beginner": (9, 9, 10),
+    "intermediate": (16, 16, 40),
+    "expert": (30, 16, 99),
+}
+
+
+def parse_board_config(name):
+    # "expert" gibi hazır bir ad veya "GENİŞLİKxYÜKSEKLİKxMAYIN" biçiminde özel bir tahta kabul eder.
+    if name in BOARD_CONFIGS:
+        return BOARD_CONFIGS[name]
+    try:
+        width, height, num_mines = (int(part) for part in name.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"geçersiz tahta: {name!r} (ör. expert veya 30x16x99)")
+    if width < 1 or height < 1 or not 0 <= num_mines < width * height:
+        raise argparse.ArgumentTypeError(f"geçersiz tahta boyutu: {name!r}")
+    return width, height, num_mines
+
+
+def play_game(solver_name, width, height, num_mines, seed, record=False, stats=False, on_move=None, sparse=False,
+              max_moves=None, budget=None, backend=None):
+    """
+    Tek bir oyunu arayüzsüz oynatır. Arayüzdeki geri almanın aksine mayına basmak oyunu kaybettirir.
+    Mayın yerleşimi ve çözücünün hamle bulamadığında yapılan rastgele seçim seed ile belirlenir.
+    Sonuç olarak kazanma durumu, hamle sayısı ve her hamlenin çözücüde geçen süresi (saniye) döner. Her hamle
+    çözücünün get_next_moves ile verdiği hücre kümesinin tamamıdır (bkz. MinesweeperBoard.reveal_many).
+    record True ise oyunun kodlanmış kaydı (bkz. GameRecord) da "record" anahtarıyla döner.
+    stats True ise çözücünün aşama istatistikleri (bkz. SolverStats.to_json) "stats" anahtarıyla döner;
+    on_move verilirse her hamleden sonra çözücüyle çağrılır (ör. canlı istatistik paneli).
+    sparse True ise oyun tohumlu bir SparseBoard üzerinde oynanır (çok büyük tahtalar için; kayıt desteklenmez).
+    max_moves verilirse oyun en fazla bu kadar hamle sürer; sonsuza yakın tahtalarda keşfedilen alan ("revealed")
+    ölçülür.
+    budget verilirse (SearchBudget) çözücü her hamlede bu süre/düğüm sınırıyla aranır; bütçesi dolan hamle
+    sayısı "budget_exhausted" anahtarıyla döner. Verilen nesnenin cancel yöntemi oyunu SearchCancelled ile keser.
+    backend verilirse (FRONTIER_BACKENDS anahtarı) BacktrackingSolver büyük bileşenlerde bu arka ucu kullanır.
+    """
+    cpu_start = time.process_time()
+    hits, misses = PATTERN_CACHE.hits, PATTERN_CACHE.misses
+    if sparse:
+        board = SparseBoard(width, height, num_mines, seed=seed)
+    else:
+        board = MinesweeperBoard(width, height, num_mines, rng=random.Random(seed))
+    solver_class = SOLVERS[solver_name]
+    if backend is not None and issubclass(solver_class, BacktrackingSolver):
+        solver = solver_class(board, backend=FRONTIER_BACKENDS[backend]())
+    else:
+        solver = solver_class(board)
+    solver.budget = budget
+    if stats or on_move:
+        solver.stats = SolverStats()
+    fallback = random.Random(seed ^ 0x5EED)
+    latencies = []
+    mine_hit = False
+    exhausted = 0
+    while not board.game_over and (max_moves is None or len(latencies) < max_moves):
+        start = time.perf_counter()
+        with solver.stats.move():
+            safe, mines = solver.find_safe_moves()
+            solver.flag_mines(mines)
+            moves = solver.get_next_moves()
+        latencies.append(time.perf_counter() - start)
+        exhausted += solver.exhausted
+        if on_move:
+            on_move(solver)
+
+        # Çözücü hamle bulamazsa arayüzdeki gibi gizli hücrelerden rastgele biri seçilir.
+        if not moves:
+            move = board.random_hidden_cell(fallback)
+            if move is None:
+                break
+            moves = [move]
+        opened = board.reveal_many(moves)
+        mine_hit = bool(opened) and board.is_mine(*opened[-1])
+    # Son tahminde mayına basılırsa açık hücre sayısı da kazanma sayısına ulaşabilir; açık mayın kaybettirir.
+    total = board.mine_total()
+    won = total is not None and board.revealed_count == width * height - total and not mine_hit
+    result = {"seed": seed, "won": won, "moves": len(latencies), "latencies": latencies,
+              "revealed": board.revealed_count, "budget_exhausted": exhausted,
+              "cpu_seconds": time.process_time() - cpu_start,
+              "pattern_hits": PATTERN_CACHE.hits - hits, "pattern_misses": PATTERN_CACHE.misses - misses}
+    if sparse:
+        result["chunks"] = board.chunks_generated
+    if record:
+        result["record"] = GameRecord.from_board(board, seed).encode()
+    if stats:
+        result["stats"] = solver.stats.to_json()
+    return result
+
+
+def _play_chunk(solver_name, config_name, seeds, record=False, stats=False, on_move=None, sparse=False,
+                max_moves=None, budget=None, backend=None):
+    # Süreç havuzundaki işçinin çalıştırdığı görev: aynı çözücü ve tahta için birkaç oyun oynatır.
+    # Her oyunun tohumu görevle birlikte gelir; sonuçlar hangi işçide çalıştığından bağımsızdır.
+    config = parse_board_config(config_name)
+    results = []
+    for seed in seeds:
+        result = play_game(solver_name, *config, seed, record, stats, on_move, sparse, max_moves, budget, backend)
+        result["solver"] = solver_name
+        result["config"] = config_name
+        results.append(result)
+    return results
+
+
+def _load_pattern_cache(path):
+    # Desen önbelleğini dosyadan ön ısıtır (işçi süreçlerinin başlangıcında da çağrılır).
+    if path and os.path.exists(path):
+        PATTERN_CACHE.load(path)
+
+
+def iter_games(tasks, workers=1, chunk_size=8, record=False, pattern_cache=None, stats=False, on_move=None,
+               sparse=False, max_moves=None, budget=None, backend=None):
+    """
+    (çözücü, tahta, tohum) görevlerini oynatır ve sonuçları bittikleri sırayla üretir.
+    workers 1'den büyükse görevler chunk_size'lık parçalar halinde ProcessPoolExecutor'a dağıtılır.
+    Üretici erken kapatılırsa (ör. Ctrl+C) bekleyen parçalar iptal edilir.
+    pattern_cache verilirse her işçi süreci desen önbelleğini bu dosyadan ön ısıtır.
+    on_move sadece tek süreçte (workers <= 1) çağrılır.
+    """
+    groups = {}
+    for solver_name, config_name, seed in tasks:
+        groups.setdefault((solver_name, config_name), []).append(seed)
+    chunks = [(solver_name, config_name, seeds[i:i + chunk_size])
+              for (solver_name, config_name), seeds in groups.items()
+              for i in range(0, len(seeds), chunk_size)]
+
+    if workers <= 1:
+        for chunk in chunks:
+            yield from _play_chunk(*chunk, record, stats, on_move, sparse, max_moves, budget, backend)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_load_pattern_cache, initargs=(pattern_cache,))
+    try:
+        futures = [executor.submit(_play_chunk, *chunk, record, stats, None, sparse, max_moves, budget, backend)
+                   for chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def load_journal(path):
+    # Daha önce yazılmış oyun sonuçlarını (satır başına bir JSON) okur; yarım kalmış son satır atlanır.
+    results = {}
+    if not path or not os.path.exists(path):
+        return results
+    with open(path) as stream:
+        for line in stream:
+            try:
+                result = json.loads(line)
+            except ValueError:
+                continue
+            results[(result["solver"], result["config"], result["seed"])] = result
+    return results
+
+
+def _journal_unterminated(path):
+    # Günlüğün son satırı kesinti yüzünden yarım kaldıysa (dosya satır sonuyla bitmiyorsa) True döndürür.
+    # Metin kipindeki seek/tell değerleri bayt konumu olmadığından dosya ikili kipte okunur.
+    if not os.path.exists(path) or not os.path.getsize(path):
+        return False
+    with open(path, "rb") as stream:
+        stream.seek(-1, os.SEEK_END)
+        return stream.read(1) != b"\n"
+
+
+def _percentile(values, q):
+    # Sıralı listede en yakın sıra yöntemiyle yüzdelik değer.
+    if not values:
+        return 0.0
+    rank = max(0, math.ceil(q / 100 * len(values)) - 1)
+    return values[rank]
+
+
+def summarize_games(solver_name, config_name, config, games, cpu_seconds):
+    # Oyun sonuçlarını çözücü/tahta başına tek bir özet satırına indirger (süreler milisaniye).
+    latencies = sorted(latency for game in games for latency in game["latencies"])
+    wins = sum(1 for game in games if game["won"])
+    moves = sum(game["moves"] for game in games)
+    pattern_hits = sum(game.get("pattern_hits", 0) for game in games)
+    pattern_lookups = pattern_hits + sum(game.get("pattern_misses", 0) for game in games)
+    summary = {
+        "solver": solver_name,
+        "config": config_name,
+        "width": config[0],
+        "height": config[1],
+        "mines": config[2],
+        "games": len(games),
+        "wins": wins,
+        "win_rate": wins / len(games) if games else 0.0,
+        "moves_per_game": moves / len(games) if games else 0.0,
+        "revealed_per_game": sum(game.get("revealed", 0) for game in games) / len(games) if games else 0.0,
+        "budget_exhausted": sum(game.get("budget_exhausted", 0) for game in games),
+        "latency_mean_ms": 1000 * sum(latencies) / len(latencies) if latencies else 0.0,
+        "latency_p50_ms": 1000 * _percentile(latencies, 50),
+        "latency_p90_ms": 1000 * _percentile(latencies, 90),
+        "latency_p99_ms": 1000 * _percentile(latencies, 99),
+        "latency_max_ms": 1000 * latencies[-1] if latencies else 0.0,
+        "cpu_seconds": cpu_seconds,
+        "pattern_hit_rate": pattern_hits / pattern_lookups if pattern_lookups else 0.0,
+    }
+    if games and "chunks" in games[0]:
+        # SparseBoard oyunları: oyun başına üretilen 64x64 mayın parçası sayısı.
+        summary["chunks_per_game"] = sum(game["chunks"] for game in games) / len(games)
+    return summary
+
+
+def run_benchmark(solver_names, config_names, games, seed=0, workers=1, journal=None, resume=False,
+                  chunk_size=8, record=None, pattern_cache=None, stats=None, on_move=None, sparse=False,
+                  max_moves=None, budget=None, backend=None):
+    """
+    Her çözücü ve tahta için games adet tohumlu oyun oynatır ve özet satırlarını döndürür.
+    Aynı tahta için tüm çözücüler aynı tohumları (yani aynı mayın yerleşimlerini) kullanır.
+    journal verilirse her biten oyun hemen bu dosyaya eklenir; resume ile dosyadaki oyunlar yeniden oynanmaz.
+    record verilirse oynanan her oyunun hamleleri bu ikili kayıt dosyasına (bkz. GameRecordWriter) eklenir.
+    pattern_cache verilirse desen önbelleği bu JSON dosyasından ön ısıtılır ve sonunda dosyaya yazılır;
+    birden çok işçiyle işçilerin öğrendiği desenler dosyaya yansımaz.
+    stats bir sözlük verilirse bu çalıştırmada oynanan oyunların çözücü istatistikleri "çözücü/tahta"
+    anahtarlarıyla SolverStats olarak birleştirilir; on_move, sparse, max_moves, budget ve backend için bkz. play_game.
+    """
+    tasks = [(solver_name, config_name, seed + game)
+             for config_name in config_names for solver_name in solver_names for game in range(games)]
+    done = load_journal(journal) if resume else {}
+    pending = [task for task in tasks if task not in done]
+
+    _load_pattern_cache(pattern_cache)
+    unterminated = resume and journal and _journal_unterminated(journal)
+    stream = open(journal, "a" if resume else "w") if journal else None
+    recorder = GameRecordWriter(record, append=resume) if record else None
+    try:
+        if unterminated:
+            # Kesintide yarım yazılmış son satır varsa yeni kayıtlar ona eklenmesin diye satır sonlandırılır.
+            stream.write("\n")
+        for result in iter_games(pending, workers, chunk_size, bool(recorder), pattern_cache,
+                                 stats is not None, on_move, sparse, max_moves, budget, backend):
+            done[(result["solver"], result["config"], result["seed"])] = result
+            if stats is not None:
+                key = f"{result['solver']}/{result['config']}"
+                stats.setdefault(key, SolverStats()).merge(result.pop("stats"))
+            if recorder:
+                recorder.write(result.pop("record"))
+                recorder.flush()
+            if stream:
+                stream.write(json.dumps(result) + "\n")
+                stream.flush()
+    finally:
+        if stream:
+            stream.close()
+        if recorder:
+            recorder.close()
+        if pattern_cache:
+            PATTERN_CACHE.save(pattern_cache)
+
+    results = []
+    for config_name in config_names:
+        config = parse_board_config(config_name)
+        for solver_name in solver_names:
+            played = [done[(solver_name, config_name, seed + game)] for game in range(games)]
+            cpu_seconds = sum(game["cpu_seconds"] for game in played)
+            results.append(summarize_games(solver_name, config_name, config, played, cpu_seconds))
+    return results
+
+
+def run_batch_benchmark(solver_names, config_names, games, seed=0, batch=1000):
+    """
+    Her çözücü ve tahta için games adet oyunu BatchBoards ile batch'er tahtalık gruplar hâlinde oynatır.
+    Basit kurallar toplu uygulanır, takılan tahtalar çözücüye devredilir. Mayın yerleşimleri NumPy üreteciyle
+    seçildiği için tek tek oynatılan (run_benchmark) oyunlarla aynı değildir; gecikme yerine saniyedeki
+    oyun sayısı raporlanır.
+    """
+    results = []
+    for config_name in config_names:
+        width, height, num_mines = parse_board_config(config_name)
+        for solver_name in solver_names:
+            wins = guesses = handoffs = 0
+            start = time.perf_counter()
+            cpu_start = time.process_time()
+            for offset in range(0, games, batch):
+                boards = BatchBoards(width, height, num_mines, min(batch, games - offset), seed + offset)
+                wins += int(boards.play(solver_name).sum())
+                guesses += int(boards.guesses.sum())
+                handoffs += boards.handoffs
+            elapsed = time.perf_counter() - start
+            results.append({
+                "solver": solver_name,
+                "config": config_name,
+                "width": width,
+                "height": height,
+                "mines": num_mines,
+                "games": games,
+                "wins": wins,
+                "win_rate": wins / games if games else 0.0,
+                "guesses_per_game": guesses / games if games else 0.0,
+                "handoffs": handoffs,
+                "cpu_seconds": time.process_time() - cpu_start,
+                "games_per_minute": 60 * games / elapsed if elapsed else 0.0,
+            })
+    return results
+
+
+def check_regressions(results, baseline, tolerance):
+    # Ortalama hamle gecikmesi taban çizgisinden tolerance oranından fazla artan satırları döndürür.
+    previous = {(row["solver"], row["config"]): row for row in baseline}
+    regressions = []
+    for row in results:
+        old = previous.get((row["solver"], row["config"]))
+        if old and row["latency_mean_ms"] > old["latency_mean_ms"] * (1 + tolerance):
+            regressions.append((row, old))
+    return regressions
+
+
+def write_results(results, stream, fmt):
+    if fmt == "csv":
+        writer = csv.DictWriter(stream, fieldnames=list(results[0]) if results else [])
+        writer.writeheader()
+        writer.writerows(results)
+    else:
+        json.dump(results, stream, indent=2)
+        stream.write("\n")
+
+
+def main(argv=None):
+    # Komut satırı: argüman verilmezse arayüz açılır, "bench" alt komutu arayüzsüz kıyaslama yapar.
+    parser = argparse.ArgumentParser(description="Minesweeper Solver")
+    parser.add_argument("--board", type=parse_board_config, default=(10, 10, 10),
+                        help="arayüzdeki tahta: beginner, intermediate, expert veya GENİŞLİKxYÜKSEKLİKxMAYIN")
+    commands = parser.add_subparsers(dest="command")
+    bench = commands.add_parser("bench", help="çözücüleri arayüzsüz kıyaslar")
+    bench.add_argument("--solvers", nargs="+", default=list(SOLVERS), choices=list(SOLVERS))
+    bench.add_argument("--configs", nargs="+", default=["beginner", "intermediate", "expert"],
+                       help="beginner, intermediate, expert veya GENİŞLİKxYÜKSEKLİKxMAYIN")
+    bench.add_argument("--games", type=int, default=100, help="çözücü ve tahta başına oyun sayısı")
+    bench.add_argument("--seed", type=int, default=0, help="ilk oyunun tohumu")
+    bench.add_argument("--format", choices=["json", "csv"], default="json")
+    bench.add_argument("--output", help="sonuç dosyası (verilmezse standart çıktı)")
+    bench.add_argument("--baseline", help="karşılaştırılacak JSON taban çizgisi; yavaşlama varsa çıkış kodu 1")
+    bench.add_argument("--tolerance", type=float, default=0.2,
+                       help="ortalama hamle gecikmesinde izin verilen artış oranı (varsayılan 0.2)")
+    bench.add_argument("--save-baseline", help="sonuçları taban çizgisi olarak bu JSON dosyasına yazar")
+    bench.add_argument("--workers", type=int, default=1,
+                       help="paralel süreç sayısı (0: işlemci sayısı kadar, varsayılan 1)")
+    bench.add_argument("--chunk-size", type=int, default=8, help="bir işçiye tek seferde verilen oyun sayısı")
+    bench.add_argument("--journal", help="her biten oyunun yazıldığı JSON satırları dosyası")
+    bench.add_argument("--resume", action="store_true",
+                       help="--journal dosyasındaki oyunları atlayarak yarım kalan kıyaslamaya devam eder")
+    bench.add_argument("--record", help="oynanan oyunların hamlelerinin eklendiği ikili kayıt dosyası")
+    bench.add_argument("--pattern-cache", help="desen önbelleğinin ön ısıtıldığı ve sonunda kaydedildiği JSON dosyası")
+    bench.add_argument("--stats", help="çözücü aşama süreleri ve sayaçlarının yazıldığı JSON dosyası")
+    bench.add_argument("--flame", help="aşama sürelerinin flame graph (folded stacks) biçiminde yazıldığı dosya")
+    bench.add_argument("--live", action="store_true",
+                       help="her hamlenin istatistiklerini standart hataya yazar (sadece --workers 1)")
+    bench.add_argument("--sparse", action="store_true",
+                       help="oyunları tembel SparseBoard üzerinde oynatır (ör. 1000000x1000000x150000000000)")
+    bench.add_argument("--max-moves", type=int, help="oyun başına en fazla hamle (çözücü çağrısı) sayısı")
+    bench.add_argument("--budget-ms", type=float,
+                       help="hamle başına arama süresi sınırı; dolunca hamle olasılık tahminiyle seçilir")
+    bench.add_argument("--node-budget", type=int, help="hamle başına arama düğümü sınırı (bkz. --budget-ms)")
+    bench.add_argument("--backend", choices=list(FRONTIER_BACKENDS),
+                       help="BacktrackingSolver'ın büyük bileşenlerde kullandığı SAT arka ucu "
+                            "(varsayılan: python-sat kuruluysa pysat, değilse dpll)")
+    bench.add_argument("--batch", type=int,
+                       help="oyunları bu kadar tahtalık NumPy gruplarıyla (BatchBoards) oynatır")
+    args = parser.parse_args(argv)
+
+    if args.command != "bench":
+        run_gui(*args.board)
+        return 0
+
+    for name in args.configs:
+        try:
+            parse_board_config(name)
+        except argparse.ArgumentTypeError as exc:
+            parser.error(str(exc))
+    if args.resume and not args.journal:
+        parser.error("--resume için --journal gerekir")
+    workers = args.workers or os.cpu_count() or 1
+    if args.live and workers > 1:
+        parser.error("--live sadece --workers 1 ile kullanılabilir")
+    if args.batch is not None:
+        if np is None:
+            parser.error("--batch için NumPy gerekli")
+        if args.batch < 1:
+            parser.error("--batch pozitif olmalı")
+        unsupported = [option for option, value in (("--journal", args.journal), ("--record", args.record),
+                                                    ("--stats", args.stats), ("--flame", args.flame),
+                                                    ("--live", args.live), ("--baseline", args.baseline),
+                                                    ("--budget-ms", args.budget_ms),
+                                                    ("--node-budget", args.node_budget), ("--backend", args.backend))
+                       if value]
+        if unsupported:
+            parser.error(f"--batch ile kullanılamaz: {', '.join(unsupported)}")
+    if args.sparse and (args.record or args.batch is not None):
+        parser.error("--sparse, --record ve --batch ile kullanılamaz")
+    budget = None
+    if args.budget_ms is not None or args.node_budget is not None:
+        seconds = args.budget_ms / 1000 if args.budget_ms is not None else None
+        budget = SearchBudget(seconds, args.node_budget)
+    stats = {} if args.stats or args.flame else None
+    on_move = (lambda solver: print(format_move_stats(solver.stats), file=sys.stderr)) if args.live else None
+    try:
+        if args.batch is not None:
+            _load_pattern_cache(args.pattern_cache)
+            results = run_batch_benchmark(args.solvers, args.configs, args.games, args.seed, args.batch)
+            if args.pattern_cache:
+                PATTERN_CACHE.save(args.pattern_cache)
+        else:
+            results = run_benchmark(args.solvers, args.configs, args.games, args.seed, workers,
+                                    args.journal, args.resume, max(1, args.chunk_size), args.record,
+                                    args.pattern_cache, stats, on_move, args.sparse, args.max_moves, budget,
+                                    args.backend)
+    except KeyboardInterrupt:
+        if args.journal:
+            print(f"Kesildi; kaldığı yerden devam etmek için --journal {args.journal} --resume kullanın.",
+                  file=sys.stderr)
+        return 130
+
+    if args.output:
+        with open(args.output, "w", newline="") as stream:
+            write_results(results, stream, args.format)
+    else:
+        write_results(results, sys.stdout, args.format)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as stream:
+            write_results(results, stream, "json")
+    if args.stats:
+        with open(args.stats, "w") as stream:
+            json.dump({key: value.to_json() for key, value in stats.items()}, stream, indent=2)
+    if args.flame:
+        with open(args.flame, "w") as stream:
+            for key, value in stats.items():
+                for line in value.folded_lines(key.replace("/", ";") + ";"):
+                    stream.write(line + "\n")
+
+    if args.baseline:
+        with open(args.baseline) as stream:
+            baseline = json.load(stream)
+        regressions = check_regressions(results, baseline, args.tolerance)
+        for row, old in regressions:
+            print(f"YAVAŞLAMA: {row['solver']} / {row['config']}: ortalama hamle "
+                  f"{old['latency_mean_ms']:.3f} ms -> {row['latency_mean_ms']:.3f} ms", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+def run_gui(width=10, height=10, num_mines=10):
     # Tkinter penceresi oluşturulur, başlık ayarlanır ve GUI çalıştırılır.
+    if tk is None:
+        sys.exit("tkinter bulunamadı; arayüzsüz kullanım için: python MineSweeper.py bench --help")
     root = tk.Tk()
     root.title("Minesweeper Solver")
-    gui = MinesweeperGUI(root, width=10, height=10, num_mines=10)
+    gui = MinesweeperGUI(root, width=width, height=height, num_mines=num_mines)
     root.mainloop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,727 @@
+import importlib.util
+import itertools
+import json
+import random
+import sys
+
+import pytest
+
+import MineSweeper as M
+
+np = M.np
+
+
+# Kaydedilmiş sınır konumları: rakam açılmış sayılı hücre, '.' gizli hücre, 'F' bayraklı hücre.
+SAVED_POSITIONS = [
+    # 1-2-1 deseni
+    """
+    .....
+    .121.
+    """,
+    # 1-2-2-1 deseni
+    """
+    ......
+    .1221.
+    """,
+    # 12x12 tahtada 24 mayınlı oyunlardan (tohum 5, 8 ve 10) basit kuralların tıkandığı konumlar
+    """
+    ............
+    ............
+    ............
+    ............
+    ............
+    ............
+    ....2111....
+    ....1001F...
+    ....210113..
+    ....F10001F.
+    .....3110111
+    ......F10000
+    """,
+    """
+    ............
+    ............
+    ............
+    ......1112..
+    .....F1001F.
+    ...F3110011.
+    ..211000001.
+    ..200011102.
+    ..10002F324.
+    ..10113F....
+    ..112F......
+    ............
+    """,
+    """
+    ............
+    ............
+    ......312...
+    ......201F..
+    ......20112.
+    ......20001.
+    .....F10112.
+    ....11101F..
+    ....10001...
+    ....22221...
+    ............
+    ............
+    """,
+]
+
+
+def board_from_text(text):
+    # Metin konumundan mayınları bilinmeyen (sadece sayıları olan) bir tahta oluşturur.
+    rows = [line.strip() for line in text.strip().splitlines()]
+    height, width = len(rows), len(rows[0])
+    cells = bytearray(width * height)
+    for i, row in enumerate(rows):
+        for j, char in enumerate(row):
+            if char.isdigit():
+                cells[i * width + j] = M.REVEALED | int(char)
+            elif char == "F":
+                cells[i * width + j] = M.FLAGGED
+    board = M.MinesweeperBoard(width, height, 0)
+    board.load_state({"cells": bytes(cells), "revealed_count": sum(1 for c in cells if c & M.REVEALED),
+                      "game_over": False, "first_move": False, "mines_placed": True})
+    return board
+
+
+def brute_force(component):
+    # Bileşenin tüm atamalarını tek tek deneyerek mayın sayısına göre çözüm ve hücre sayaçlarını çıkarır.
+    n = len(component.cells)
+    solutions = {}
+    mine_counts = {}
+    for values in itertools.product((0, 1), repeat=n):
+        if all(sum(values[v] for v in variables) == remaining for variables, remaining in component.constraints):
+            k = sum(values)
+            solutions[k] = solutions.get(k, 0) + 1
+            counts = mine_counts.setdefault(k, [0] * n)
+            for v, value in enumerate(values):
+                counts[v] += value
+    return solutions, mine_counts
+
+
+def frontier_components(board):
+    return M.split_frontier(M.LogicalSolver(board)._frontier_constraints())
+
+
+def brute_neighbors(board, idx):
+    row, col = divmod(idx, board.width)
+    return {r * board.width + c for r in range(row - 1, row + 2) for c in range(col - 1, col + 2)
+            if 0 <= r < board.height and 0 <= c < board.width and (r, c) != (row, col)}
+
+
+def brute_index(board):
+    # Sınır ve aktif kısıt kümelerini tahtayı baştan tarayarak hesaplar.
+    cells = board.cells
+    frontier = set()
+    active = set()
+    for idx, state in enumerate(cells):
+        neighbors = brute_neighbors(board, idx)
+        if state & M.REVEALED:
+            if state & M.COUNT_MASK and not state & M.MINE \
+                    and any(not cells[n] & (M.REVEALED | M.FLAGGED) for n in neighbors):
+                active.add(idx)
+        elif not state & M.FLAGGED and any(cells[n] & M.REVEALED for n in neighbors):
+            frontier.add(idx)
+    return frontier, active
+
+
+@pytest.mark.parametrize("text", SAVED_POSITIONS)
+def test_solve_component_matches_brute_force_on_saved_positions(text):
+    components = frontier_components(board_from_text(text))
+    assert components
+    for component in components:
+        M.solve_component(component)
+        assert (component.solutions, component.mine_counts) == brute_force(component)
+
+
+def test_solve_component_matches_brute_force_on_played_frontiers():
+    # Gerçek oyunlardan alınan sınırlar: her hamlede küçük bileşenler kaba kuvvetle karşılaştırılır.
+    checked = 0
+    for seed in range(6):
+        board = M.MinesweeperBoard(16, 16, 40, rng=seed)
+        solver = M.BacktrackingSolver(board, pattern_cache=M.PatternCache())
+        board.reveal(8, 8)
+        while not board.game_over:
+            for component in frontier_components(board):
+                if len(component.cells) <= 12:
+                    M.solve_component(component)
+                    assert (component.solutions, component.mine_counts) == brute_force(component)
+                    checked += 1
+            move = solver.get_next_move()
+            if move is None or board.reveal(*move):
+                break
+    assert checked > 50
+
+
+def test_solve_component_handles_long_chains():
+    # Arama özyinelemeli olmadığından Python'un özyineleme sınırını aşan derinlikte dallanan zincirlerde de
+    # sadece bütçe dolar; tamamen zorunlu bir zincir ise tek aramada çözülür.
+    chain = M.FrontierComponent(list(range(3001)), [((2 * i, 2 * i + 1, 2 * i + 2), 1) for i in range(1500)])
+    budget = M.SearchBudget(nodes=20000)
+    budget.start()
+    with pytest.raises(M.BudgetExceeded):
+        M.solve_component(chain, budget)
+    component = M.FrontierComponent(list(range(3001)), [((v, v + 1), 1) for v in range(3000)])
+    M.solve_component(component)
+    assert component.solutions == {1501: 1, 1500: 1}
+
+
+def test_forced_cells_are_forced_in_every_solution():
+    component = frontier_components(board_from_text(SAVED_POSITIONS[0]))[0]
+    M.solve_component(component)
+    safe, mines = component.forced_cells()
+    # 1-2-1: kenardaki birler mayın, ortadaki iki güvenlidir.
+    assert sorted(divmod(idx, 5) for idx in mines) == [(0, 1), (0, 3)]
+    assert (0, 2) in [divmod(idx, 5) for idx in safe]
+
+
+def test_linear_and_sat_deductions_agree_with_enumeration():
+    for text in SAVED_POSITIONS:
+        for component in frontier_components(board_from_text(text)):
+            M.solve_component(component)
+            safe, mines = component.forced_cells()
+            linear_safe, linear_mines = M.linear_deductions(component)
+            assert set(linear_safe) <= set(safe) and set(linear_mines) <= set(mines)
+            sat_safe, sat_mines = M.DPLLBackend().forced_cells(component)
+            assert (sorted(sat_safe), sorted(sat_mines)) == (sorted(safe), sorted(mines))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_mine_placement_and_counts(seed):
+    board = M.MinesweeperBoard(30, 16, 99, rng=seed)
+    board.reveal(5, 7)
+    cells = board.cells
+    mines = [idx for idx, state in enumerate(cells) if state & M.MINE]
+    assert len(mines) == 99
+    assert not cells[5 * 30 + 7] & M.MINE
+    for idx, state in enumerate(cells):
+        assert state & M.COUNT_MASK == sum(1 for n in brute_neighbors(board, idx) if cells[n] & M.MINE)
+    # Eski sözlük görünümü aynı hücreleri gösterir.
+    assert board.grid[5][7]["revealed"] and board.grid[5][7]["adjacent_mines"] == board.adjacent_mines(5, 7)
+
+
+def test_flood_fill_opens_whole_empty_region():
+    board = M.MinesweeperBoard(30, 16, 20, rng=3)
+    opened = board.reveal_cells(0, 0)
+    cells = board.cells
+    assert len(opened) == board.revealed_count
+    for idx, state in enumerate(cells):
+        if state & M.REVEALED and not state & M.COUNT_MASK:
+            assert all(cells[n] & M.REVEALED for n in brute_neighbors(board, idx))
+
+
+def test_frontier_index_and_undo_redo_fuzz():
+    rng = random.Random(0)
+    for game in range(20):
+        width, height = rng.randint(2, 16), rng.randint(2, 16)
+        board = M.MinesweeperBoard(width, height, rng.randint(1, width * height // 4), rng=game)
+        snapshots = [bytes(board.cells)]
+        while not board.game_over and len(snapshots) < 60:
+            row, col = rng.randrange(height), rng.randrange(width)
+            if rng.random() < 0.3:
+                board.set_flag(row, col, not board.is_flagged(row, col))
+            else:
+                board.reveal(row, col)
+            if board.journal_pos == len(snapshots):
+                snapshots.append(bytes(board.cells))
+            assert brute_index(board) == (board.frontier, board.active)
+        final = bytes(board.cells)
+        # Geri alma her hamleden önceki duruma, ileri alma son duruma döner.
+        for pos in range(board.journal_pos, 0, -1):
+            assert bytes(board.cells) == snapshots[pos]
+            assert board.undo()
+            assert brute_index(board) == (board.frontier, board.active)
+        assert not any(state & (M.REVEALED | M.FLAGGED) for state in board.cells)
+        assert board.goto(len(board.journal))
+        assert bytes(board.cells) == final
+        assert brute_index(board) == (board.frontier, board.active)
+
+
+def test_game_record_round_trip(tmp_path):
+    results = [M.play_game("Probability", 16, 16, 40, seed, record=True) for seed in range(4)]
+    path = tmp_path / "games.msr"
+    with M.GameRecordWriter(path, append=False) as writer:
+        for result in results:
+            writer.write(M.GameRecord.decode(result["record"]))
+    with M.GameRecordReader(path) as reader:
+        assert len(reader) == len(results)
+        for result, record in zip(results, reader):
+            assert record.encode() == result["record"]
+            board = record.replay()
+            assert board.revealed_count == result["revealed"]
+            assert board.game_over
+
+
+def test_game_record_keeps_explicit_mines():
+    board = M.MinesweeperBoard(9, 9, 10)
+    board.reveal(4, 4)
+    board.set_flag(0, 0)
+    record = M.GameRecord.decode(M.GameRecord.from_board(board).encode())
+    replayed = record.replay()
+    assert bytes(replayed.cells) == bytes(board.cells)
+
+
+def test_sparse_board_set_mines_matches_dense_board():
+    mines = random.Random(1).sample(range(70 * 20), 120)
+    sparse = M.SparseBoard(70, 20, 99, seed=5)
+    dense = M.MinesweeperBoard(70, 20, len(mines))
+    sparse.set_mines(mines)
+    dense.set_mines(mines)
+    assert sparse.mine_total() == len(mines)
+    for row, col in ((0, 0), (10, 35), (19, 69)):
+        sparse.reveal(row, col)
+        dense.reveal(row, col)
+    assert bytes(sparse.cells) == bytes(dense.cells)
+    # Açık yerleşim kayıttan geri yüklenen tahtada da kullanılır.
+    restored = M.SparseBoard(70, 20, 99, seed=5)
+    restored.load_state(sparse.save_state())
+    assert bytes(restored.cells) == bytes(sparse.cells)
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_sparse_game_is_won_exactly_when_all_safe_cells_are_open(seed):
+    # Üretilen yerleşimdeki mayın sayısı num_mines'tan farklı olabilir; kazanma gerçek sayıya göre verilir.
+    boards = []
+    result = M.play_game("Probability", 30, 16, 99, seed, sparse=True, on_move=lambda s: boards.append(s.board))
+    board = boards[0]
+    total = board.width * board.height
+    mines = sum(1 for idx in range(total) if board.cells[idx] & M.MINE)
+    assert board.mine_total() == mines
+    hit = any(state & M.MINE and state & M.REVEALED for state in board.cells)
+    assert result["won"] == (board.revealed_count == total - mines and not hit)
+
+
+def test_density_probabilities_match_brute_force():
+    # Toplam mayın sayısı bilinmediğinde her hücre bağımsız olarak density olasılıkla mayındır.
+    density = 0.2
+    for text in SAVED_POSITIONS:
+        components = frontier_components(board_from_text(text))
+        for component in components:
+            M.solve_component(component)
+        probabilities, interior = M.mine_probabilities(components, None, 10, density=density)
+        assert interior == density
+        for component, values in zip(components, probabilities):
+            solutions, mine_counts = brute_force(component)
+            n = len(component.cells)
+            weight = {k: density ** k * (1 - density) ** (n - k) for k in solutions}
+            norm = sum(weight[k] * count for k, count in solutions.items())
+            expected = [sum(weight[k] * counts[v] for k, counts in mine_counts.items()) / norm for v in range(n)]
+            assert values == pytest.approx(expected)
+
+
+def stuck_position(solver_name, seed):
+    # Basit kuralların yeni hamle bulamadığı bir expert konumu ve çözücüsünü döndürür.
+    board = M.MinesweeperBoard(30, 16, 99, rng=seed)
+    solver = M.SOLVERS[solver_name](board)
+    board.reveal(8, 15)
+    while not board.game_over:
+        move = solver.next_safe_move()
+        if move is None:
+            return board, solver
+        board.reveal(*move)
+    return None, None
+
+
+def test_node_budget_is_shared_by_all_components():
+    # Her biri 256 düğümden az süren bileşenler de aynı hamle bütçesine yazılır.
+    components = [M.FrontierComponent([2 * i, 2 * i + 1], [((0, 1), 1)]) for i in range(200)]
+    budget = M.SearchBudget(nodes=100)
+    budget.start()
+    with pytest.raises(M.BudgetExceeded):
+        for component in components:
+            M.solve_component(component, budget)
+    assert budget.used > 100
+
+
+@pytest.mark.parametrize("solver_name", ["Backtracking", "Probability"])
+def test_expired_deadline_marks_move_exhausted(solver_name):
+    for seed in range(10):
+        board, solver = stuck_position(solver_name, seed)
+        if board is not None and board.active:
+            break
+    solver.budget = M.SearchBudget(seconds=0)
+    moves = solver.get_next_moves()
+    assert solver.exhausted
+    assert moves and not board.is_revealed(*moves[0])
+
+
+def test_cancelled_budget_stops_search():
+    board, solver = stuck_position("Probability", 0)
+    solver.budget = M.SearchBudget()
+    solver.budget.cancel()
+    with pytest.raises(M.SearchCancelled):
+        solver.get_next_moves()
+    solver.budget.reset()
+    assert solver.get_next_moves()
+
+
+def probability_moves(seed, sampler):
+    # ProbabilitySolver'ın bir expert oyununda sırayla açtığı hücre kümelerini döndürür.
+    board = M.MinesweeperBoard(30, 16, 99, rng=seed)
+    solver = M.ProbabilitySolver(board, pattern_cache=M.PatternCache())
+    solver.sampler = sampler
+    played = []
+    while not board.game_over:
+        moves = solver.get_next_moves()
+        if not moves:
+            break
+        board.reveal_many(moves)
+        played.append(moves)
+    return played
+
+
+@pytest.mark.skipif(M.np is None, reason="MonteCarloEstimator için NumPy gerekli")
+@pytest.mark.parametrize("seed", [0, 1, 2, 10, 15, 29])
+def test_sampler_does_not_change_ordinary_games(seed):
+    # 10, 15 ve 29 numaralı oyunlarda 32 hücreden büyük, binlerce düğümlük bileşenler çıkar.
+    assert probability_moves(seed, M.MonteCarloEstimator()) == probability_moves(seed, None)
+
+
+def test_probability_solver_flags_only_proven_mines(monkeypatch):
+    # Olasılığı 1'e çok yakın ama tüm çözümlerde mayın olmayan hücreler bayraklanmaz.
+    for seed in range(20):
+        board, solver = stuck_position("Probability", seed)
+        if board is None:
+            continue
+        original = solver.get_mine_probabilities
+        calls = []
+
+        def nearly_certain():
+            calls.append(True)
+            cells, interior = original()
+            return {cell: 1 - 1e-12 if p else p for cell, p in cells.items()}, interior
+
+        monkeypatch.setattr(solver, "get_mine_probabilities", nearly_certain)
+        before = set(solver.flagged_mines)
+        solver.get_next_moves()
+        if calls:
+            break
+    assert calls
+    proven = {divmod(idx, board.width) for component in solver._solved.values()
+              for idx in component.forced_cells()[1]}
+    assert solver.flagged_mines - before <= proven
+
+
+@pytest.mark.parametrize("solver_name", ["Logical", "Backtracking", "Probability"])
+def test_move_set_starts_with_next_queued_move(solver_name):
+    # get_next_moves'un ilk elemanı, kuyruktan verilen hamle ise get_next_move'un seçeceği hücredir.
+    checked = 0
+    for seed in range(8):
+        board = M.MinesweeperBoard(30, 16, 99, rng=seed)
+        solver = M.SOLVERS[solver_name](board)
+        board.reveal(8, 15)
+        while not board.game_over:
+            moves = solver.get_next_moves()
+            if not moves:
+                break
+            row, col = moves[0]
+            if row * board.width + col in solver._safe_queue:
+                assert solver.get_next_move() == moves[0]
+                checked += 1
+            board.reveal(row, col)
+    assert checked > 20
+
+
+def test_lazy_heap_skips_stale_entries_and_repushes():
+    heap = M.LazyHeap()
+    for item, key in ((1, 5), (2, 3), (3, 4)):
+        heap.push(item, key)
+    heap.push(2, 9)  # (3, 2) kaydı eskir ve en üste çıktığında atlanır
+    assert heap.peek() == (3, 4)
+    heap.discard(3)
+    assert heap.peek() == (1, 5)
+    heap.push(3, 1)  # Silinen öğe yeni anahtarla geri gelir
+    assert heap.peek() == (3, 1) and len(heap) == 3
+    # Rastgele güncellemelerde en üstteki öğe her zaman geçerli anahtarların en küçüğüdür.
+    rng = random.Random(0)
+    keys = {1: 5, 2: 9, 3: 1}
+    for _ in range(2000):
+        item = rng.randrange(50)
+        if rng.random() < 0.2:
+            heap.discard(item)
+            keys.pop(item, None)
+        else:
+            keys[item] = rng.randrange(100)
+            heap.push(item, keys[item])
+            # Eskimiş kayıtlar çoğalınca yığın yeniden kurulur.
+            assert len(heap._heap) <= 2 * len(keys) + 65
+        top = heap.peek()
+        assert (top is None and not keys) or top[1] == min(keys.values()) and keys[top[0]] == top[1]
+
+
+def test_chord_opens_unflagged_neighbors_in_one_batch(monkeypatch):
+    board = M.MinesweeperBoard(5, 5, 2)
+    board.set_mines([0, 24])
+    board.reveal(1, 1)
+    board.set_flag(0, 0)
+    batches = []
+    reveal_many = board.reveal_many
+    monkeypatch.setattr(board, "reveal_many", lambda moves: batches.append(moves) or reveal_many(moves))
+    opened = board.chord(1, 1)
+    neighbors = {(r, c) for r in range(3) for c in range(3)} - {(0, 0), (1, 1)}
+    assert len(batches) == 1 and set(batches[0]) == neighbors
+    assert neighbors <= set(opened)
+    assert not any(state & M.MINE and state & M.REVEALED for state in board.cells)
+
+
+def test_chord_with_mismatched_flags_is_a_no_op():
+    board = M.MinesweeperBoard(5, 5, 2)
+    board.set_mines([0, 24])
+    board.reveal(1, 1)
+    # Sayı 1: bayraksız ve iki bayraklı komşulukta akor hiçbir hücreyi açmaz.
+    for flags in ((), ((0, 1), (1, 0))):
+        for cell in flags:
+            board.set_flag(*cell)
+        snapshot = bytes(board.cells)
+        assert board.chord(1, 1) == []
+        assert bytes(board.cells) == snapshot
+
+
+def test_resume_finishes_a_truncated_journal(tmp_path):
+    path = tmp_path / "bench.jsonl"
+    full = M.run_benchmark(["Logical"], ["beginner"], 4, journal=str(path))
+    data = path.read_bytes()
+    path.write_bytes(data[:-10])  # Son satır yazılırken kesilmiş gibi
+    resumed = M.run_benchmark(["Logical"], ["beginner"], 4, journal=str(path), resume=True)
+    lines = path.read_text().splitlines()
+    assert path.read_bytes().endswith(b"\n")
+    assert len(M.load_journal(str(path))) == 4 and len(lines) == 5
+    assert [row["wins"] for row in resumed] == [row["wins"] for row in full]
+
+
+@pytest.mark.parametrize("solver_name", ["Logical", "Backtracking", "Probability"])
+def test_solver_stats_cover_every_move(solver_name):
+    result = M.play_game(solver_name, 16, 16, 40, 3, stats=True)
+    stats = M.SolverStats()
+    stats.merge(result["stats"])
+    # Her hamle bir "move" kapsamı ve bir basit kural geçişi (safe_moves) içerir.
+    assert stats.moves == result["moves"] == stats.phases["move"][0] == stats.phases["safe_moves"][0]
+    # Öz süreler toplamı, bütün aşamaları kapsayan hamle süresine eşittir.
+    assert sum(stats.folded.values()) == pytest.approx(stats.phases["move"][1])
+    lines = stats.folded_lines(f"{solver_name};16x16x40;")
+    assert lines
+    for line in lines:
+        path, count = line.rsplit(" ", 1)
+        frames = path.split(";")
+        assert frames[:3] == [solver_name, "16x16x40", "move"] and all(frames)
+        assert " " not in path and count.isdigit() and int(count) > 0
+
+
+def test_null_stats_record_nothing():
+    board = M.MinesweeperBoard(16, 16, 40, rng=3)
+    solver = M.ProbabilitySolver(board)
+    board.reveal(8, 8)
+    while not board.game_over:
+        with solver.stats.move():
+            moves = solver.get_next_moves()
+        if not moves:
+            break
+        board.reveal_many(moves)
+    assert solver.stats is M.NULL_STATS
+    assert vars(M.NULL_STATS) == {} and M.NullStats.last_move == {}
+
+
+@pytest.mark.parametrize("name", ["dpll", "pysat"])
+def test_frontier_backends_agree_with_enumeration(name):
+    if name not in M.FRONTIER_BACKENDS:
+        pytest.skip("python-sat kurulu değil")
+    backend = M.FRONTIER_BACKENDS[name]()
+    for text in SAVED_POSITIONS:
+        for component in frontier_components(board_from_text(text)):
+            M.solve_component(component)
+            safe, mines = component.forced_cells()
+            forced_safe, forced_mines = backend.forced_cells(component)
+            assert (sorted(forced_safe), sorted(forced_mines)) == (sorted(safe), sorted(mines))
+
+
+def test_pysat_backend_is_skipped_without_pysat(monkeypatch):
+    # python-sat yüklenemezse modül yerleşik DPLL arka ucuna düşer ve --backend pysat kabul edilmez.
+    for name in [name for name in sys.modules if name == "pysat" or name.startswith("pysat.")]:
+        monkeypatch.delitem(sys.modules, name)
+    monkeypatch.setitem(sys.modules, "pysat", None)
+    spec = importlib.util.spec_from_file_location("minesweeper_without_pysat", M.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert module.SatSolver is None
+    assert list(module.FRONTIER_BACKENDS) == ["dpll"]
+    assert isinstance(module.default_backend(), module.DPLLBackend)
+    with pytest.raises(SystemExit):
+        module.main(["bench", "--backend", "pysat", "--games", "1"])
+
+
+def test_bench_backend_option(tmp_path):
+    output = tmp_path / "bench.json"
+    assert M.main(["bench", "--solvers", "Backtracking", "--configs", "beginner", "--games", "2",
+                   "--backend", "dpll", "--output", str(output)]) == 0
+    assert json.loads(output.read_text())[0]["games"] == 2
+    solvers = []
+    M.play_game("Backtracking", 9, 9, 10, 0, on_move=solvers.append, backend="dpll")
+    assert isinstance(solvers[0].backend, M.DPLLBackend)
+
+
+def transformed_position(text, swap, flip_rows, flip_cols):
+    # Metin konumunu döndürür/yansıtır: satırlar ve sütunlar ters çevrilir, swap ise eksenler yer değiştirir.
+    rows = [line.strip() for line in text.strip().splitlines()]
+    if flip_rows:
+        rows = rows[::-1]
+    if flip_cols:
+        rows = [row[::-1] for row in rows]
+    if swap:
+        rows = ["".join(column) for column in zip(*rows)]
+    return "\n".join(rows)
+
+
+@pytest.mark.parametrize("text", SAVED_POSITIONS)
+def test_pattern_cache_hits_rotated_and_reflected_components(text):
+    cache = M.PatternCache()
+    for number, symmetry in enumerate(itertools.product((False, True), repeat=3)):
+        board = board_from_text(transformed_position(text, *symmetry))
+        misses = cache.misses
+        for component in frontier_components(board):
+            cache.solve(component, board.width)
+            assert (component.solutions, component.mine_counts) == brute_force(component)
+        # İlk yönelimden sonra bütün bileşenler önbellekten gelir.
+        assert number == 0 or cache.misses == misses
+    assert cache.hits >= 7 * len(cache)
+
+
+def test_pattern_cache_evicts_least_recently_used_and_round_trips(tmp_path):
+    components = [frontier_components(board_from_text(text))[0] for text in SAVED_POSITIONS[:3]]
+    widths = [len(text.strip().splitlines()[0].strip()) for text in SAVED_POSITIONS[:3]]
+    cache = M.PatternCache(maxsize=2)
+    cache.solve(components[0], widths[0])
+    cache.solve(components[1], widths[1])
+    cache.solve(components[0], widths[0])  # İlk desen yeniden kullanılır; en eski artık ikincisidir
+    cache.solve(components[2], widths[2])
+    assert len(cache) == 2 and (cache.hits, cache.misses) == (1, 3)
+    cache.solve(components[1], widths[1])
+    assert cache.misses == 4
+
+    path = tmp_path / "patterns.json"
+    cache.save(path)
+    warmed = M.PatternCache()
+    warmed.load(path)
+    assert list(warmed.entries) == list(cache.entries)
+    for component, width in zip(components[1:], widths[1:]):
+        fresh = M.FrontierComponent(component.cells, component.constraints)
+        warmed.solve(fresh, width)
+        assert (fresh.solutions, fresh.mine_counts) == brute_force(component)
+    assert (warmed.hits, warmed.misses) == (2, 0)
+    small = M.PatternCache(maxsize=1)
+    small.load(path)
+    assert list(small.entries) == list(cache.entries)[-1:]
+
+
+# 45 hücrelik, 600 çözümlü bir bileşen içeren expert konumu (tohum 15, 124. hamle).
+SAMPLED_POSITION = """
+    00112F22FF21000001F11.........
+    001F212F33F2101122222..2......
+    11211011123F102F4F11F212......
+    2F21000001F2113FF2111113......
+    F4F10112244422F32100002F......
+    ..4312F3FFFFF2110112123F......
+    ..F..4...433221101F3F3F3......
+    .........22222F11334F43.......
+    ........12FF2F322FF32.........
+    ..........32213F32...4........
+    ..........10002F..............
+    ..........112221..............
+    ..............................
+    ..............................
+    ..............................
+    ..............................
+"""
+
+
+@pytest.mark.skipif(M.np is None, reason="MonteCarloEstimator için NumPy gerekli")
+@pytest.mark.parametrize("seed", range(3))
+def test_sampler_estimates_match_exact_probabilities(seed):
+    components = frontier_components(board_from_text(SAMPLED_POSITION))
+    component = max(components, key=lambda component: len(component.cells))
+    assert len(component.cells) >= 30
+    exact = M.solve_component(M.FrontierComponent(component.cells, component.constraints))
+    sampler = M.MonteCarloEstimator(samples=65536, tolerance=0.01, seed=seed)
+    sampler.estimate(component)
+    assert component.sampled
+    assert sampler.last["max_stderr"] < sampler.tolerance
+
+    def cell_probabilities(solved):
+        total = sum(solved.solutions.values())
+        return [sum(counts[v] for counts in solved.mine_counts.values()) / total
+                for v in range(len(solved.cells))]
+
+    # Her hücrenin tahmini, kesin olasılığın üç standart hata (3 * tolerance) yakınındadır.
+    for estimated, expected in zip(cell_probabilities(component), cell_probabilities(exact)):
+        assert abs(estimated - expected) <= 3 * sampler.tolerance
+
+
+def scalar_rules_fixpoint(board):
+    # Basit kuralları (find_safe_moves) yeni hücre bulunamayana kadar skaler tahtada uygular.
+    solver = M.LogicalSolver(board)
+    while not board.game_over:
+        safe, mines = solver.find_safe_moves()
+        flagged = board.flag_count
+        solver.flag_mines(mines)
+        if not board.reveal_many(safe) and board.flag_count == flagged:
+            break
+
+
+def batch_rules_fixpoint(boards):
+    while boards.apply_rules().any():
+        pass
+
+
+def batch_state(boards, b):
+    revealed = set(np.flatnonzero(boards.revealed[b]))
+    flagged = set(np.flatnonzero(boards.flagged[b]))
+    return revealed, flagged, bool(boards.won[b]), bool(boards.lost[b])
+
+
+def scalar_state(board):
+    cells = board.cells
+    revealed = {idx for idx, state in enumerate(cells) if state & M.REVEALED}
+    flagged = {idx for idx, state in enumerate(cells) if state & M.FLAGGED}
+    lost = any(cells[idx] & M.MINE for idx in revealed)
+    won = board.game_over and not lost
+    return revealed, flagged, won, lost
+
+
+@pytest.mark.skipif(M.np is None, reason="BatchBoards için NumPy gerekli")
+@pytest.mark.parametrize("config", [(9, 9, 10), (16, 16, 40), (30, 16, 99)])
+def test_batch_boards_match_scalar_boards(config):
+    width, height, num_mines = config
+    boards = M.BatchBoards(width, height, num_mines, 12, seed=sum(config))
+    boards.start()
+    scalars = []
+    for b in range(boards.batch):
+        # Aynı yerleşimle skaler tahtada aynı ilk hamle aynı taşkını açar.
+        board = M.MinesweeperBoard(width, height, num_mines)
+        board.set_mines(np.flatnonzero(boards.mines[b]).tolist())
+        board.reveal(height // 2, width // 2)
+        assert bytes(board.cells) == bytes(boards.to_board(b).cells)
+        scalars.append(board)
+    while not boards.done.all():
+        batch_rules_fixpoint(boards)
+        for b, board in enumerate(scalars):
+            scalar_rules_fixpoint(board)
+            assert batch_state(boards, b) == scalar_state(board)
+            assert bytes(boards.to_board(b).cells) == bytes(board.cells)
+        # Takılan tahtalarda aynı gizli hücre iki tarafta da açılır: çift numaralı tahtalarda mayınsız ilk
+        # hücre (oyun kazanılabilsin diye), tek numaralılarda ilk gizli hücre (mayınsa oyun kaybedilir).
+        stuck = [b for b in range(boards.batch) if not boards.done[b]]
+        if not stuck:
+            break
+        cells = []
+        for b in stuck:
+            hidden = ~(boards.revealed[b] | boards.flagged[b])
+            if b % 2 == 0:
+                hidden &= ~boards.mines[b]
+            cells.append(divmod(int(np.flatnonzero(hidden)[0]), width))
+        boards.reveal(stuck, [row for row, _ in cells], [col for _, col in cells])
+        for b, cell in zip(stuck, cells):
+            scalars[b].reveal(*cell)
+        for b, board in enumerate(scalars):
+            assert batch_state(boards, b) == scalar_state(board)
+    assert boards.won.any() and boards.lost.any()